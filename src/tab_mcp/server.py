@@ -9,16 +9,28 @@ MCP Protocol: v1.0
 """
 from __future__ import annotations
 
+import asyncio
+import atexit
+import base64
+import hashlib
 import logging
+import random
+import re
+import socket
+import threading
 import time
-from typing import Any, Dict, List, Optional
-from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
 
 import httpx
+import orjson
 from mcp.server.fastmcp import Context, FastMCP
-from pydantic import BaseModel, Field, validator
+from mcp.server.fastmcp.tools import Tool
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
 from smithery.decorators import smithery
 
+from .utils import TTLCache
+
 
 # Constants
 TAB_BASE_URL = "https://api.beta.tab.com.au"
@@ -26,17 +38,302 @@ OAUTH_TOKEN_PATH = "/oauth/token"
 USER_AGENT = "tabcorp-mcp/1.0.0"
 DEFAULT_TIMEOUT = 30.0
 TOKEN_EXPIRY_BUFFER = 60  # Refresh tokens 60s before expiry
+TOKEN_CACHE_MARGIN = 30  # Stop serving cached tokens 30s before expires_at
+TOKEN_META_TTL = 120.0  # Seconds to reuse decoded access-token claims
+TOKEN_META_MAX = 256  # Upper bound on remembered access tokens
+TOKEN_CACHE_MAX = 256  # Upper bound on cached OAuth grants
+
+# Racing API path prefixes
+RACING_PATH = "/v1/tab-info-service/racing"
+RACING_DATES_PATH = f"{RACING_PATH}/dates"
+RACING_NEXT_TO_GO_PATH = f"{RACING_PATH}/next-to-go/races"
+RACING_JACKPOTS_PATH = f"{RACING_PATH}/jackpots"
+SPORTS_PATH = "/v1/tab-info-service/sports"
+SPORTS_NEXT_TO_GO_PATH = f"{SPORTS_PATH}/nextToGo"
+SPORTS_RESULTS_PATH = f"{SPORTS_PATH}/results"
+
+# Query-string spelling of boolean flags
+BOOL_PARAM = {True: "true", False: "false"}
+
+# Query parameters as a dict, or as pre-built (name, value) pairs for fixed queries
+QueryParams = Union[Dict[str, Any], Tuple[Tuple[str, Any], ...]]
 
 # Valid jurisdictions
-VALID_JURISDICTIONS = {"NSW", "VIC", "QLD", "SA", "TAS", "ACT", "NT"}
-VALID_RACE_TYPES = {"R", "H", "G"}  # Racing, Harness, Greyhounds
+VALID_JURISDICTIONS = frozenset({"NSW", "VIC", "QLD", "SA", "TAS", "ACT", "NT"})
+VALID_RACE_TYPES = frozenset({"R", "H", "G"})  # Racing, Harness, Greyhounds
+
+# Refresh tokens are opaque; anything outside this shape cannot be valid
+REFRESH_TOKEN_PATTERN = re.compile(r"[A-Za-z0-9._~+/=-]{20,}")
+
+# Default headers for the pooled clients; compressed responses are decoded by httpx
+CLIENT_HEADERS = {
+    "user-agent": USER_AGENT,
+    "accept": "application/json",
+    "accept-encoding": "gzip, br",
+}
+# Static per-request headers layered over the client defaults
+OAUTH_HEADERS = {"content-type": "application/x-www-form-urlencoded"}
+BEARER_POST_HEADERS = {"content-type": "application/json"}
+
+# Connection pool tuning for the shared HTTP clients
+POOL_LIMITS = httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60.0)
+STREAM_CHUNK_SIZE = 65536  # Read size for streamed large responses
+MAX_CONCURRENT_REQUESTS = 16  # Cap on in-flight requests for batch tools
+RESPONSE_CACHE_TTL = 15.0  # Seconds to reuse read-only info-service responses
+NEXT_TO_GO_CACHE_TTL = 2.0  # Next-to-go listings change by the second
+CACHEABLE_PATH_PREFIX = "/v1/tab-info-service/"
+RETRY_ATTEMPTS = 3  # Retries for transient HTTP failures
+RETRY_BACKOFF = 0.1  # Base delay in seconds, doubled per attempt
+RETRY_JITTER = 0.5  # Up to +50% random spread so concurrent retries do not align
+RETRY_MAX_DELAY = 5.0  # Upper bound on backoff and honoured Retry-After values
+RETRY_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+DNS_CACHE_TTL = 300.0  # Seconds to reuse resolved addresses for API hosts
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
+class RetryTransport(httpx.AsyncHTTPTransport):
+    """Transport that retries transient failures with jittered exponential backoff.
+
+    Retries timeouts, network errors and 408/425/429/5xx responses. GET and
+    HEAD requests are always retried; other methods only when the request
+    carries a truthy "retry" extension.
+    """
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        retryable = request.method in ("GET", "HEAD") or request.extensions.get("retry", False)
+        attempt = 0
+        while True:
+            try:
+                response = await super().handle_async_request(request)
+            except (httpx.TimeoutException, httpx.NetworkError) as e:
+                if not retryable or attempt >= RETRY_ATTEMPTS:
+                    raise
+                delay = _backoff_delay(attempt)
+                reason = type(e).__name__
+            else:
+                if not retryable or attempt >= RETRY_ATTEMPTS or response.status_code not in RETRY_STATUS_CODES:
+                    return response
+                delay = _backoff_delay(attempt)
+                retry_after = response.headers.get("retry-after")
+                if retry_after is not None:
+                    try:
+                        delay = min(float(retry_after), RETRY_MAX_DELAY)
+                    except ValueError:
+                        pass
+                await response.aclose()
+                reason = f"HTTP {response.status_code}"
+
+            attempt += 1
+            logger.debug("Retrying %s %s after %s (attempt %d)", request.method, request.url.path, reason, attempt)
+            await asyncio.sleep(delay)
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Return the jittered exponential backoff delay for a retry attempt"""
+    return min(RETRY_MAX_DELAY, RETRY_BACKOFF * 2 ** attempt) * (1 + random.uniform(0, RETRY_JITTER))
+
+
+# Shared HTTP clients keyed by API base URL. Reusing one client per host keeps
+# TCP/TLS connections alive between tool calls instead of handshaking per request.
+# Each client remembers the event loop it was created on, since pooled
+# connections cannot be carried over to a different loop.
+_CLIENTS: Dict[str, Tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = {}
+
+
+# DNS results for the API hosts only. New connections after an idle period
+# (keep-alive expiry) would otherwise block on the system resolver again.
+_DNS_CACHE: Dict[Tuple[Any, ...], Tuple[float, List[Any]]] = {}
+_DNS_HOSTS: set = set()
+_system_getaddrinfo = socket.getaddrinfo
+
+
+def _cached_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+    """socket.getaddrinfo with a TTL cache for registered API hosts"""
+    name = host.decode() if isinstance(host, bytes) else host
+    if name not in _DNS_HOSTS:
+        return _system_getaddrinfo(host, port, family, type, proto, flags)
+    key = (name, port, family, type, proto, flags)
+    now = time.monotonic()
+    entry = _DNS_CACHE.get(key)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+    result = _system_getaddrinfo(host, port, family, type, proto, flags)
+    _DNS_CACHE[key] = (now + DNS_CACHE_TTL, result)
+    return result
+
+
+def _register_dns_host(base_url: str) -> None:
+    """Enable DNS caching for the host of a base URL"""
+    _DNS_HOSTS.add(httpx.URL(base_url).host)
+    if socket.getaddrinfo is _system_getaddrinfo:
+        socket.getaddrinfo = _cached_getaddrinfo
+
+
+def _get_client(base_url: str) -> httpx.AsyncClient:
+    """Return the pooled HTTP client for a base URL, creating it on first use"""
+    loop = asyncio.get_running_loop()
+    entry = _CLIENTS.get(base_url)
+    if entry is None or entry[0] is not loop:
+        _register_dns_host(base_url)
+        client = httpx.AsyncClient(
+            base_url=base_url.rstrip("/"),
+            timeout=DEFAULT_TIMEOUT,
+            headers=CLIENT_HEADERS,
+            transport=RetryTransport(http2=True, limits=POOL_LIMITS, retries=1),
+        )
+        _CLIENTS[base_url] = (loop, client)
+        return client
+    return entry[1]
+
+
+def _race_path(meeting_date: str, race_type: str, venue_mnemonic: str, race_number: int) -> str:
+    """Return the API path of a single race"""
+    return f"{RACING_DATES_PATH}/{meeting_date}/meetings/{race_type}/{venue_mnemonic}/races/{race_number}"
+
+
+@lru_cache(maxsize=512)
+def _normalize_path(path: str) -> str:
+    """Return an API path with a single leading slash, relative to the client base URL"""
+    return path if path.startswith("/") else "/" + path
+
+
+@lru_cache(maxsize=256)
+def _bearer_headers(token: str, post: bool = False) -> Dict[str, str]:
+    """Return the per-request headers for a token (shared instance; callers must not mutate it)"""
+    if post:
+        return {**BEARER_POST_HEADERS, "authorization": f"Bearer {token}"}
+    return {"authorization": f"Bearer {token}"}
+
+
+async def aclose_clients() -> None:
+    """Close all pooled HTTP clients (for use from a host application's shutdown hook)"""
+    loop = asyncio.get_running_loop()
+    entries = list(_CLIENTS.values())
+    _CLIENTS.clear()
+    for client_loop, client in entries:
+        if client_loop is loop:
+            await client.aclose()
+
+
+@atexit.register
+def _close_clients() -> None:
+    """Best-effort close of pooled HTTP clients on interpreter shutdown"""
+    for loop, client in list(_CLIENTS.values()):
+        if loop.is_closed():
+            continue
+        try:
+            loop.run_until_complete(client.aclose())
+        except Exception:
+            # Loop still running or torn down mid-close; sockets close with the process
+            pass
+    _CLIENTS.clear()
+
+
+# In-process OAuth token cache keyed by a hash of the base URL and the full grant
+# request (secrets included), so a token is only reused for the exact credentials
+# it was issued to.
+# Entries pair a time.monotonic() deadline with the token, so freshness checks are
+# immune to wall-clock jumps; the token's own expires_at stays wall-clock for callers.
+_TOKEN_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_TOKEN_CACHE_LOCK = threading.Lock()
+# In-progress token renewals per cache key, so concurrent tool calls share one grant
+_TOKEN_RENEWALS: Dict[str, "asyncio.Task[Dict[str, Any]]"] = {}
+
+
+def _token_cache_key(base_url: str, data: Mapping[str, str]) -> str:
+    """Return a fixed-size cache key so credentials are not kept verbatim as dict keys"""
+    raw = "\0".join([base_url, *(f"{k}={v}" for k, v in sorted(data.items()))])
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+def _get_cached_token(key: str, margin: float = TOKEN_CACHE_MARGIN) -> Optional[Dict[str, Any]]:
+    """Return a copy of a cached token that is valid for more than margin seconds"""
+    with _TOKEN_CACHE_LOCK:
+        entry = _TOKEN_CACHE.get(key)
+    if entry and entry[0] - margin > time.monotonic():
+        return dict(entry[1])
+    return None
+
+
+def _peek_token(key: str) -> Optional[Dict[str, Any]]:
+    """Return the raw cached token for a key, ignoring expiry"""
+    with _TOKEN_CACHE_LOCK:
+        entry = _TOKEN_CACHE.get(key)
+    return dict(entry[1]) if entry else None
+
+
+def _store_token(key: str, token: Dict[str, Any]) -> None:
+    """Cache a token response if it carries an expiry.
+
+    Expired entries are dropped on every store and the oldest entries are
+    evicted beyond TOKEN_CACHE_MAX, since each rotated refresh token adds a key.
+    """
+    if "expires_at" in token:
+        now = time.monotonic()
+        deadline = now + (token["expires_at"] - time.time())
+        with _TOKEN_CACHE_LOCK:
+            for expired in [k for k, (d, _) in _TOKEN_CACHE.items() if d <= now]:
+                del _TOKEN_CACHE[expired]
+            _TOKEN_CACHE.pop(key, None)
+            while len(_TOKEN_CACHE) >= TOKEN_CACHE_MAX:
+                del _TOKEN_CACHE[next(iter(_TOKEN_CACHE))]
+            _TOKEN_CACHE[key] = (deadline, dict(token))
+
+
+# Short-lived caches for read-only info-service GETs. Account and betting
+# endpoints are never cached.
+_RESPONSE_CACHE = TTLCache(maxsize=1024, ttl_seconds=RESPONSE_CACHE_TTL)
+_NEXT_TO_GO_CACHE = TTLCache(maxsize=64, ttl_seconds=NEXT_TO_GO_CACHE_TTL)
+
+
+def _response_cache_for(path: str) -> Optional[TTLCache]:
+    """Return the cache for a normalized GET path, or None if it must not be cached"""
+    if not path.startswith(CACHEABLE_PATH_PREFIX):
+        return None
+    return _NEXT_TO_GO_CACHE if "/next-to-go" in path else _RESPONSE_CACHE
+
+
+def _response_cache_key(base_url: str, path: str, token: str, params: Optional[QueryParams]) -> str:
+    """Build a compact cache key; the token is included so sessions never share entries"""
+    query = sorted(params.items()) if isinstance(params, dict) else params
+    raw = repr((base_url, path, token, query))
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+# Decoded (unverified) claims per bearer token, or None for opaque tokens
+_TOKEN_META: Dict[str, Tuple[float, Optional[Dict[str, Any]]]] = {}
+
+
+def _token_claims(token: str) -> Optional[Dict[str, Any]]:
+    """Return the JWT payload of an access token, or None if it is opaque"""
+    now = time.time()
+    entry = _TOKEN_META.get(token)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+
+    claims = None
+    parts = token.split(".")
+    if len(parts) == 3:
+        try:
+            payload = base64.urlsafe_b64decode(parts[1] + "=" * (-len(parts[1]) % 4))
+            claims = orjson.loads(payload)
+        except ValueError:
+            claims = None
+        if not isinstance(claims, dict):
+            claims = None
+
+    if len(_TOKEN_META) >= TOKEN_META_MAX:
+        _TOKEN_META.clear()
+    _TOKEN_META[token] = (now + TOKEN_META_TTL, claims)
+    return claims
+
+
 class TabcorpAPIError(Exception):
     """Custom exception for Tabcorp API errors"""
+    __slots__ = ("message", "status_code", "response_data")
+
     def __init__(self, message: str, status_code: Optional[int] = None, response_data: Optional[Dict] = None):
         self.message = message
         self.status_code = status_code
@@ -44,149 +341,370 @@ class TabcorpAPIError(Exception):
         super().__init__(self.message)
 
 
+def _check_token_expiry(token: str) -> None:
+    """Fail fast on JWT access tokens whose exp claim has already passed"""
+    claims = _token_claims(token)
+    if claims is not None and isinstance(claims.get("exp"), (int, float)) and claims["exp"] <= time.time():
+        raise TabcorpAPIError("Access token has expired. Please re-authenticate.", status_code=401)
+
+
+def _handle_response(resp: httpx.Response, failure: str, oauth: bool = False,
+                     body: Optional[bytearray] = None) -> Dict[str, Any]:
+    """Decode a JSON response (or a pre-read streamed body), raising TabcorpAPIError for HTTP errors"""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("%s %s -> %s (%s, content-encoding: %s)", resp.request.method, resp.request.url.path,
+                     resp.status_code, resp.http_version, resp.headers.get("content-encoding", "identity"))
+    if resp.status_code >= 400:
+        error_data = None
+        try:
+            error_data = orjson.loads(resp.content)
+            if oauth:
+                error_msg = error_data.get('error_description', error_data.get('message', 'Unknown error'))
+            else:
+                error_msg = error_data.get('error', {}).get('message', 'Unknown error')
+        except (orjson.JSONDecodeError, AttributeError):
+            error_msg = resp.text or f"HTTP {resp.status_code}"
+
+        raise TabcorpAPIError(
+            f"{failure}: {error_msg}",
+            status_code=resp.status_code,
+            response_data=error_data
+        )
+
+    try:
+        return orjson.loads(resp.content if body is None else body)
+    except orjson.JSONDecodeError as e:
+        raise TabcorpAPIError(f"{failure}: invalid JSON in response ({e})", status_code=resp.status_code)
+
+
+async def _send(base_url: str, method: str, path: str, *, headers: Dict[str, str],
+                params: Optional[QueryParams] = None, content: Optional[bytes] = None,
+                data: Optional[Dict[str, str]] = None, retry: bool = False, stream: bool = False,
+                context: str = "API request") -> Tuple[httpx.Response, Optional[bytearray]]:
+    """Send one request on the pooled client, mapping transport errors to TabcorpAPIError.
+
+    With stream=True a successful body is read chunk-wise into one buffer and
+    returned alongside the response, avoiding an extra full-size copy for large
+    payloads; otherwise the body is None and the response content is used.
+    """
+    try:
+        client = _get_client(base_url)
+        extensions = {"retry": retry}
+        if stream:
+            async with client.stream(method, path, headers=headers, params=params, content=content,
+                                     data=data, extensions=extensions) as resp:
+                body = None
+                if resp.status_code >= 400:
+                    await resp.aread()
+                else:
+                    body = bytearray()
+                    async for chunk in resp.aiter_bytes(STREAM_CHUNK_SIZE):
+                        body.extend(chunk)
+            return resp, body
+        resp = await client.request(method, path, headers=headers, params=params, content=content,
+                                    data=data, extensions=extensions)
+        return resp, None
+
+    except TabcorpAPIError:
+        raise
+    except httpx.TimeoutException:
+        raise TabcorpAPIError("Request timed out. Please try again.")
+    except httpx.NetworkError as e:
+        raise TabcorpAPIError(f"Network error: {str(e)}")
+    except Exception as e:
+        raise TabcorpAPIError(f"Unexpected error during {context}: {str(e)}")
+
+
+async def _request(base_url: str, method: str, path: str, *, oauth: bool = False,
+                   failure: str = "API request failed", **kwargs: Any) -> Dict[str, Any]:
+    """Send one request and decode its JSON body (see _send for the keyword arguments)"""
+    resp, body = await _send(base_url, method, path, **kwargs)
+    return _handle_response(resp, failure, oauth, body)
+
+
+def _cache_ttl(cache_control: Optional[str]) -> Optional[float]:
+    """Return the TTL a Cache-Control header allows (0 for no-store/no-cache), or None if unspecified"""
+    if not cache_control:
+        return None
+    for directive in cache_control.lower().split(","):
+        name, _, value = directive.strip().partition("=")
+        if name in ("no-store", "no-cache"):
+            return 0.0
+        if name == "max-age":
+            try:
+                return max(float(value.strip('"')), 0.0)
+            except ValueError:
+                return None
+    return None
+
+
 class ConfigSchema(BaseModel):
     """Session configuration for Tabcorp API credentials and preferences"""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     client_id: Optional[str] = Field(None, description="Tabcorp OAuth client_id")
     client_secret: Optional[str] = Field(None, description="Tabcorp OAuth client_secret")
     username: Optional[str] = Field(None, description="TAB account number (for password grant)")
     password: Optional[str] = Field(None, description="TAB account password (for password grant)")
     refresh_token: Optional[str] = Field(None, description="Cached refresh token")
+    auto_refresh: bool = Field(True, description="Refresh cached tokens automatically before they expire")
     jurisdiction: str = Field("NSW", description="Default jurisdiction (NSW, VIC, QLD, SA, TAS, ACT, NT)")
     base_url: str = Field(TAB_BASE_URL, description="Tabcorp API base URL")
 
-    @validator('jurisdiction')
-    def validate_jurisdiction(cls, v):
+    @field_validator('jurisdiction')
+    @classmethod
+    def validate_jurisdiction(cls, v: str) -> str:
         if v not in VALID_JURISDICTIONS:
             raise ValueError(f"Invalid jurisdiction. Must be one of: {', '.join(VALID_JURISDICTIONS)}")
         return v
 
 
+class BatchRequest(BaseModel):
+    """One entry of a tab_get_many batch given as an object"""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    path: str = Field(..., description="API endpoint path")
+    params: Optional[Dict[str, Any]] = Field(None, description="Query parameters for this request only")
+
+
+def _batch_request(index: int, item: Union[str, BatchRequest, Dict[str, Any]]) -> BatchRequest:
+    """Validate one tab_get_many entry, naming its index in the error"""
+    if isinstance(item, str):
+        return BatchRequest(path=item)
+    try:
+        return BatchRequest.model_validate(item)
+    except ValidationError as e:
+        error = e.errors()[0]
+        field = ".".join(str(part) for part in error["loc"])
+        raise ValueError(f"Invalid request at index {index}: {error['msg']}" + (f" ({field})" if field else "")) from None
+
+
+# Tool registrations are built once per process: they are session-independent,
+# since per-session state is read from ctx.session_config at call time. Each
+# create_server() still returns a fresh FastMCP, because its streamable-HTTP
+# session manager can only be run once.
+_TOOLS: Optional[List[Tool]] = None
+
+
 @smithery.server(config_schema=ConfigSchema)
 def create_server() -> FastMCP:
     """Create and configure the production-ready Tabcorp MCP server"""
+    global _TOOLS
+    if _TOOLS is not None:
+        return FastMCP("Tabcorp API Server", tools=_TOOLS)
+
     server = FastMCP("Tabcorp API Server")
 
     # ========== Helper Functions ==========
 
-    def _oauth_post(base_url: str, data: Dict[str, str]) -> Dict[str, Any]:
+    async def _oauth_post(base_url: str, data: Dict[str, str]) -> Dict[str, Any]:
         """POST to OAuth token endpoint with comprehensive error handling"""
-        url = f"{base_url.rstrip('/')}{OAUTH_TOKEN_PATH}"
-        headers = {
-            "content-type": "application/x-www-form-urlencoded",
-            "user-agent": USER_AGENT
-        }
-        
-        try:
-            with httpx.Client(timeout=DEFAULT_TIMEOUT) as client:
-                resp = client.post(url, data=data, headers=headers)
-                
-                # Handle HTTP errors
-                if resp.status_code >= 400:
-                    try:
-                        error_data = resp.json()
-                        error_msg = error_data.get('error_description', error_data.get('message', 'Unknown error'))
-                    except Exception:
-                        error_msg = resp.text or f"HTTP {resp.status_code}"
-                    
-                    raise TabcorpAPIError(
-                        f"OAuth authentication failed: {error_msg}",
-                        status_code=resp.status_code,
-                        response_data=error_data if 'error_data' in locals() else None
-                    )
-                
-                result = resp.json()
-                
-                # Add calculated expiry timestamp
-                if "expires_in" in result:
-                    result["expires_at"] = int(time.time()) + int(result["expires_in"]) - TOKEN_EXPIRY_BUFFER
-                
+        result = await _request(base_url, "POST", OAUTH_TOKEN_PATH, headers=OAUTH_HEADERS, data=data,
+                                retry=True, oauth=True, failure="OAuth authentication failed",
+                                context="authentication")
+        # Add calculated expiry timestamp
+        if "expires_in" in result:
+            result["expires_at"] = int(time.time()) + int(result["expires_in"]) - TOKEN_EXPIRY_BUFFER
+        return result
+
+    async def _oauth_grant(base_url: str, data: Dict[str, str], force_refresh: bool = False) -> Dict[str, Any]:
+        """Run an OAuth grant, reusing a cached token while it is still valid unless force_refresh"""
+        key = _token_cache_key(base_url, data)
+        if not force_refresh:
+            cached = _get_cached_token(key)
+            if cached is not None:
+                return cached
+        result = await _oauth_post(base_url, data)
+        _store_token(key, result)
+        return result
+
+    def _single_flight(key: str, factory) -> "asyncio.Future[Dict[str, Any]]":
+        """Share one in-progress token renewal per key between concurrent callers"""
+        loop = asyncio.get_running_loop()
+        task = _TOKEN_RENEWALS.get(key)
+        if task is None or task.get_loop() is not loop:
+            task = loop.create_task(factory())
+            _TOKEN_RENEWALS[key] = task
+            task.add_done_callback(lambda t: _TOKEN_RENEWALS.pop(key, None) if _TOKEN_RENEWALS.get(key) is t else None)
+        return asyncio.shield(task)
+
+    async def _ensure_token(cfg: ConfigSchema, stale_token: Optional[str] = None) -> Dict[str, Any]:
+        """Return a usable token for the session, refreshing it ahead of expiry.
+
+        A cached token equal to stale_token (one the API just rejected) is
+        renewed even if it has not reached its expiry yet.
+        """
+        if cfg.username and cfg.password:
+            data = {
+                "grant_type": "password",
+                "client_id": cfg.client_id,
+                "client_secret": cfg.client_secret,
+                "username": cfg.username,
+                "password": cfg.password,
+            }
+        else:
+            data = {
+                "grant_type": "client_credentials",
+                "client_id": cfg.client_id,
+                "client_secret": cfg.client_secret,
+            }
+        # username and password are known to be set when the password grant is chosen
+        if not (data["client_id"] and data["client_secret"]):
+            missing = [k for k, v in data.items() if not v]
+            raise ValueError(f"Missing required credentials: {', '.join(missing)}. Provide via session config.")
+
+        key = _token_cache_key(cfg.base_url, data)
+        fresh = _get_cached_token(key, margin=TOKEN_EXPIRY_BUFFER)
+        if fresh is not None and fresh["access_token"] != stale_token:
+            return fresh
+        cached = _peek_token(key)
+
+        # Single-flight: concurrent callers share one in-progress renewal
+        return dict(await _single_flight(key, lambda: _renew_token(cfg, key, data, cached)))
+
+    async def _renew_token(cfg: ConfigSchema, key: str, data: Dict[str, str],
+                           cached: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Refresh a cached token if possible, otherwise perform a full grant"""
+        if cached is not None and cfg.auto_refresh and cached.get("refresh_token"):
+            try:
+                result = await _oauth_post(cfg.base_url, {
+                    "grant_type": "refresh_token",
+                    "client_id": cfg.client_id,
+                    "client_secret": cfg.client_secret,
+                    "refresh_token": cached["refresh_token"],
+                })
+            except TabcorpAPIError as e:
+                logger.warning("Token refresh failed, falling back to full grant: %s", e.message)
+            else:
+                result.setdefault("refresh_token", cached["refresh_token"])
+                _store_token(key, result)
                 return result
-                
-        except httpx.TimeoutException:
-            raise TabcorpAPIError("Request timed out. Please try again.")
-        except httpx.NetworkError as e:
-            raise TabcorpAPIError(f"Network error: {str(e)}")
-        except Exception as e:
-            if isinstance(e, TabcorpAPIError):
-                raise
-            raise TabcorpAPIError(f"Unexpected error during authentication: {str(e)}")
-
-    def _bearer_get(base_url: str, path: str, token: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """GET request with bearer authentication and error handling"""
-        url = f"{base_url.rstrip('/')}{path if path.startswith('/') else '/' + path}"
-        headers = {
-            "authorization": f"Bearer {token}",
-            "user-agent": USER_AGENT,
-            "accept": "application/json"
+
+        result = await _oauth_post(cfg.base_url, data)
+        _store_token(key, result)
+        return result
+
+    async def _resolve_token(cfg: ConfigSchema, access_token: Optional[str]) -> str:
+        """Return the caller's token, or a cached/refreshed one from the session credentials"""
+        if access_token:
+            return access_token
+        return (await _ensure_token(cfg))["access_token"]
+
+    async def _refresh_rejected_token(cfg: ConfigSchema, access_token: Optional[str], rejected: str,
+                                      refresh_token: Optional[str] = None) -> Optional[str]:
+        """Obtain a replacement for a token the API answered with 401, or None if impossible.
+
+        A caller-supplied access_token is only replaced using the caller's own
+        refresh_token; the session's refresh token may belong to another account.
+        """
+        if not access_token:
+            return (await _ensure_token(cfg, stale_token=rejected))["access_token"]
+        if not (refresh_token and cfg.client_id and cfg.client_secret):
+            return None
+        if not REFRESH_TOKEN_PATTERN.fullmatch(refresh_token):
+            raise ValueError("Malformed refresh_token")
+        data = {
+            "grant_type": "refresh_token",
+            "client_id": cfg.client_id,
+            "client_secret": cfg.client_secret,
+            "refresh_token": refresh_token,
         }
-        
+        key = _token_cache_key(cfg.base_url, data)
+        result = await _single_flight(key, lambda: _oauth_grant(cfg.base_url, data, force_refresh=True))
+        return result["access_token"]
+
+    async def _authed(cfg: ConfigSchema, access_token: Optional[str], call,
+                      refresh_token: Optional[str] = None) -> Any:
+        """Run call(token), refreshing the token and retrying once if the API answers 401"""
+        token = await _resolve_token(cfg, access_token)
         try:
-            with httpx.Client(timeout=DEFAULT_TIMEOUT) as client:
-                resp = client.get(url, headers=headers, params=params or {})
-                
-                # Handle HTTP errors
-                if resp.status_code >= 400:
-                    try:
-                        error_data = resp.json()
-                        error_msg = error_data.get('error', {}).get('message', 'Unknown error')
-                    except Exception:
-                        error_msg = resp.text or f"HTTP {resp.status_code}"
-                    
-                    raise TabcorpAPIError(
-                        f"API request failed: {error_msg}",
-                        status_code=resp.status_code,
-                        response_data=error_data if 'error_data' in locals() else None
-                    )
-                
-                return resp.json()
-                
-        except httpx.TimeoutException:
-            raise TabcorpAPIError("Request timed out. Please try again.")
-        except httpx.NetworkError as e:
-            raise TabcorpAPIError(f"Network error: {str(e)}")
-        except Exception as e:
-            if isinstance(e, TabcorpAPIError):
+            return await call(token)
+        except TabcorpAPIError as e:
+            if e.status_code != 401:
                 raise
-            raise TabcorpAPIError(f"Unexpected error during API request: {str(e)}")
-
-    def _bearer_post(base_url: str, path: str, token: str, json_body: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """POST request with bearer authentication and error handling"""
-        url = f"{base_url.rstrip('/')}{path if path.startswith('/') else '/' + path}"
-        headers = {
-            "authorization": f"Bearer {token}",
-            "user-agent": USER_AGENT,
-            "content-type": "application/json",
-            "accept": "application/json"
-        }
-        
-        try:
-            with httpx.Client(timeout=DEFAULT_TIMEOUT) as client:
-                resp = client.post(url, headers=headers, json=json_body or {})
-                
-                # Handle HTTP errors
-                if resp.status_code >= 400:
-                    try:
-                        error_data = resp.json()
-                        error_msg = error_data.get('error', {}).get('message', 'Unknown error')
-                    except Exception:
-                        error_msg = resp.text or f"HTTP {resp.status_code}"
-                    
-                    raise TabcorpAPIError(
-                        f"API request failed: {error_msg}",
-                        status_code=resp.status_code,
-                        response_data=error_data if 'error_data' in locals() else None
-                    )
-                
-                return resp.json()
-                
-        except httpx.TimeoutException:
-            raise TabcorpAPIError("Request timed out. Please try again.")
-        except httpx.NetworkError as e:
-            raise TabcorpAPIError(f"Network error: {str(e)}")
-        except Exception as e:
-            if isinstance(e, TabcorpAPIError):
+            try:
+                fresh = await _refresh_rejected_token(cfg, access_token, token, refresh_token)
+            except (TabcorpAPIError, ValueError) as refresh_error:
+                logger.warning("Token refresh after 401 failed: %s", refresh_error)
+                fresh = None
+            if fresh is None or fresh == token:
                 raise
-            raise TabcorpAPIError(f"Unexpected error during API request: {str(e)}")
+        logger.info("token refreshed")
+        return await call(fresh)
+
+    async def _bearer_get(base_url: str, path: str, token: str, params: Optional[QueryParams] = None,
+                          stream: bool = False) -> Dict[str, Any]:
+        """GET request with bearer authentication and error handling (path must start with '/')"""
+        _check_token_expiry(token)
+        cache = _response_cache_for(path)
+        if cache is not None:
+            cache_key = _response_cache_key(base_url, path, token, params)
+            cached = await cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        resp, body = await _send(base_url, "GET", path, headers=_bearer_headers(token), params=params,
+                                 stream=stream)
+        result = _handle_response(resp, "API request failed", body=body)
+        if cache is not None:
+            # Cache-Control can only shorten the local TTL, never extend it
+            ttl = _cache_ttl(resp.headers.get("cache-control"))
+            if ttl is None:
+                await cache.set(cache_key, result)
+            elif ttl > 0:
+                await cache.set(cache_key, result, ttl=min(ttl, cache.ttl_seconds))
+        return result
+
+    async def _bearer_post(base_url: str, path: str, token: str, json_body: Optional[Dict[str, Any]] = None,
+                           retry: bool = False) -> Dict[str, Any]:
+        """POST request with bearer authentication and error handling.
+
+        Not retried unless retry=True, since POSTs such as bet placement are not idempotent.
+        """
+        _check_token_expiry(token)
+        return await _request(base_url, "POST", path, headers=_bearer_headers(token, post=True),
+                              content=orjson.dumps(json_body or {}), retry=retry)
+
+    async def _tool_get(cfg: ConfigSchema, access_token: Optional[str], path: str,
+                        params: Optional[QueryParams] = None, stream: bool = False) -> Dict[str, Any]:
+        """Shared body of the read-only tools: resolve the session token, then GET"""
+        return await _authed(cfg, access_token, lambda token: _bearer_get(cfg.base_url, path, token, params, stream))
+
+    async def _bearer_get_many(base_url: str, token: str,
+                               requests: List[Tuple[str, Optional[QueryParams]]]) -> List[Any]:
+        """Concurrent GETs with bounded concurrency; failures are returned as the raised exception"""
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        async def _fetch(path: str, params: Optional[QueryParams]) -> Dict[str, Any]:
+            async with semaphore:
+                return await _bearer_get(base_url, path, token, params)
+
+        return await asyncio.gather(*(_fetch(path, params) for path, params in requests), return_exceptions=True)
+
+    async def _authed_get_many(cfg: ConfigSchema, access_token: Optional[str],
+                               requests: List[Tuple[str, Optional[QueryParams]]],
+                               token: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Batch GETs that renew the token once if any item is answered 401 and re-issue only those items.
+
+        token is the bearer to start with (e.g. one a preceding _authed call already
+        renewed); it defaults to the resolved session or caller token.
+        Failures are returned as {"error": message}.
+        """
+        token = token or await _resolve_token(cfg, access_token)
+        results = await _bearer_get_many(cfg.base_url, token, requests)
+        rejected = [i for i, r in enumerate(results) if isinstance(r, TabcorpAPIError) and r.status_code == 401]
+        if rejected:
+            try:
+                fresh = await _refresh_rejected_token(cfg, access_token, token)
+            except (TabcorpAPIError, ValueError) as refresh_error:
+                logger.warning("Token refresh after 401 failed: %s", refresh_error)
+                fresh = None
+            if fresh is not None and fresh != token:
+                logger.info("token refreshed")
+                retried = await _bearer_get_many(cfg.base_url, fresh, [requests[i] for i in rejected])
+                for i, r in zip(rejected, retried):
+                    results[i] = r
+        return [{"error": str(r)} if isinstance(r, Exception) else r for r in results]
 
     def _validate_jurisdiction(jurisdiction: Optional[str], cfg: ConfigSchema) -> str:
         """Validate and return jurisdiction"""
@@ -205,12 +723,13 @@ def create_server() -> FastMCP:
     # ========== OAuth Authentication Tools ==========
 
     @server.tool()
-    def tab_oauth_password_grant(
+    async def tab_oauth_password_grant(
         ctx: Context,
         client_id: Optional[str] = None,
         client_secret: Optional[str] = None,
         username: Optional[str] = None,
         password: Optional[str] = None,
+        force_refresh: bool = False,
     ) -> Dict[str, Any]:
         """
         Obtain access and refresh tokens via password grant (for personal account betting).
@@ -220,6 +739,7 @@ def create_server() -> FastMCP:
             client_secret: Tabcorp OAuth client secret (from config if not provided)
             username: TAB account number (from config if not provided)
             password: TAB account password (from config if not provided)
+            force_refresh: Bypass the token cache and request a new token
         
         Returns:
             Dict containing access_token, refresh_token, expires_in, expires_at, token_type
@@ -236,18 +756,19 @@ def create_server() -> FastMCP:
             "password": password or cfg.password,
         }
         
-        missing = [k for k, v in data.items() if k != "grant_type" and not v]
-        if missing:
+        if not (data["client_id"] and data["client_secret"] and data["username"] and data["password"]):
+            missing = [k for k, v in data.items() if not v]
             raise ValueError(f"Missing required credentials: {', '.join(missing)}. Provide via arguments or session config.")
         
-        return _oauth_post(cfg.base_url, data)
+        return await _oauth_grant(cfg.base_url, data, force_refresh)
 
     @server.tool()
-    def tab_oauth_refresh(
+    async def tab_oauth_refresh(
         ctx: Context,
         refresh_token: Optional[str] = None,
         client_id: Optional[str] = None,
         client_secret: Optional[str] = None,
+        force_refresh: bool = False,
     ) -> Dict[str, Any]:
         """
         Refresh access token using refresh_token grant.
@@ -256,6 +777,7 @@ def create_server() -> FastMCP:
             refresh_token: The refresh token (from config if not provided)
             client_id: Tabcorp OAuth client ID (from config if not provided)
             client_secret: Tabcorp OAuth client secret (from config if not provided)
+            force_refresh: Bypass the token cache and request a new token
         
         Returns:
             Dict containing new access_token, refresh_token, expires_in, expires_at, token_type
@@ -271,17 +793,20 @@ def create_server() -> FastMCP:
             "refresh_token": refresh_token or cfg.refresh_token,
         }
         
-        missing = [k for k, v in data.items() if k != "grant_type" and not v]
-        if missing:
+        if not (data["client_id"] and data["client_secret"] and data["refresh_token"]):
+            missing = [k for k, v in data.items() if not v]
             raise ValueError(f"Missing required credentials: {', '.join(missing)}")
+        if not REFRESH_TOKEN_PATTERN.fullmatch(data["refresh_token"]):
+            raise ValueError("Malformed refresh_token")
         
-        return _oauth_post(cfg.base_url, data)
+        return await _oauth_grant(cfg.base_url, data, force_refresh)
 
     @server.tool()
-    def tab_oauth_client_credentials(
+    async def tab_oauth_client_credentials(
         ctx: Context,
         client_id: Optional[str] = None,
         client_secret: Optional[str] = None,
+        force_refresh: bool = False,
     ) -> Dict[str, Any]:
         """
         Obtain token via client_credentials grant (for public data, no account needed).
@@ -289,6 +814,7 @@ def create_server() -> FastMCP:
         Args:
             client_id: Tabcorp OAuth client ID (from config if not provided)
             client_secret: Tabcorp OAuth client secret (from config if not provided)
+            force_refresh: Bypass the token cache and request a new token
         
         Returns:
             Dict containing access_token, expires_in, expires_at, token_type
@@ -303,51 +829,51 @@ def create_server() -> FastMCP:
             "client_secret": client_secret or cfg.client_secret,
         }
         
-        missing = [k for k, v in data.items() if k != "grant_type" and not v]
-        if missing:
+        if not (data["client_id"] and data["client_secret"]):
+            missing = [k for k, v in data.items() if not v]
             raise ValueError(f"Missing required credentials: {', '.join(missing)}")
         
-        return _oauth_post(cfg.base_url, data)
+        return await _oauth_grant(cfg.base_url, data, force_refresh)
 
     # ========== Racing Endpoints ==========
 
     @server.tool()
-    def racing_get_all_meeting_dates(
+    async def racing_get_all_meeting_dates(
         ctx: Context,
-        access_token: str,
+        access_token: Optional[str] = None,
         jurisdiction: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Get all available racing meeting dates including today, tomorrow, and futures."""
         cfg: ConfigSchema = ctx.session_config
-        params = {"jurisdiction": _validate_jurisdiction(jurisdiction, cfg)}
-        return _bearer_get(cfg.base_url, "/v1/tab-info-service/racing/dates", access_token, params)
+        params = (("jurisdiction", _validate_jurisdiction(jurisdiction, cfg)),)
+        return await _tool_get(cfg, access_token, RACING_DATES_PATH, params)
 
     @server.tool()
-    def racing_get_meetings(
+    async def racing_get_meetings(
         ctx: Context,
-        access_token: str,
         meeting_date: str,
+        access_token: Optional[str] = None,
         jurisdiction: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Get all meetings for a specific date.
         
         Args:
-            access_token: Bearer access token
+            access_token: Optional bearer token (obtained from session credentials if omitted)
             meeting_date: Date in YYYY-MM-DD format (e.g., '2025-10-29')
             jurisdiction: Jurisdiction code (NSW, VIC, etc.)
         """
         cfg: ConfigSchema = ctx.session_config
-        params = {"jurisdiction": _validate_jurisdiction(jurisdiction, cfg)}
-        return _bearer_get(cfg.base_url, f"/v1/tab-info-service/racing/dates/{meeting_date}/meetings", access_token, params)
+        params = (("jurisdiction", _validate_jurisdiction(jurisdiction, cfg)),)
+        return await _tool_get(cfg, access_token, f"{RACING_DATES_PATH}/{meeting_date}/meetings", params)
 
     @server.tool()
-    def racing_get_all_races_in_meeting(
+    async def racing_get_all_races_in_meeting(
         ctx: Context,
-        access_token: str,
         meeting_date: str,
         race_type: str,
         venue_mnemonic: str,
+        access_token: Optional[str] = None,
         jurisdiction: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
@@ -359,35 +885,80 @@ def create_server() -> FastMCP:
         """
         cfg: ConfigSchema = ctx.session_config
         race_type = _validate_race_type(race_type)
-        params = {"jurisdiction": _validate_jurisdiction(jurisdiction, cfg)}
-        path = f"/v1/tab-info-service/racing/dates/{meeting_date}/meetings/{race_type}/{venue_mnemonic}/races"
-        return _bearer_get(cfg.base_url, path, access_token, params)
+        params = (("jurisdiction", _validate_jurisdiction(jurisdiction, cfg)),)
+        path = f"{RACING_DATES_PATH}/{meeting_date}/meetings/{race_type}/{venue_mnemonic}/races"
+        return await _tool_get(cfg, access_token, path, params, stream=True)
 
     @server.tool()
-    def racing_get_race(
+    async def racing_get_meeting_bundle(
+        ctx: Context,
+        meeting_date: str,
+        access_token: Optional[str] = None,
+        jurisdiction: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Get all meetings for a date together with the races of every meeting.
+        
+        Fetches the meeting list, then all race lists concurrently.
+        
+        Args:
+            meeting_date: Date in YYYY-MM-DD format (e.g., '2025-10-29')
+            jurisdiction: Jurisdiction code (NSW, VIC, etc.)
+        
+        Returns:
+            Dict with 'meetings' and 'races_by_venue' keyed by '<raceType>/<venueMnemonic>';
+            failed race lists are returned as {"error": message}
+        """
+        cfg: ConfigSchema = ctx.session_config
+        params = (("jurisdiction", _validate_jurisdiction(jurisdiction, cfg)),)
+        base = f"{RACING_DATES_PATH}/{meeting_date}/meetings"
+
+        async def _fetch_meetings(token: str) -> Tuple[str, Dict[str, Any]]:
+            return token, await _bearer_get(cfg.base_url, base, token, params)
+
+        # The race lists reuse whichever token the meetings request succeeded with
+        token, meetings = await _authed(cfg, access_token, _fetch_meetings)
+
+        venues = [
+            (m["raceType"], m["venueMnemonic"])
+            for m in meetings.get("meetings", [])
+            if m.get("raceType") and m.get("venueMnemonic")
+        ]
+        races = await _authed_get_many(
+            cfg, access_token,
+            [(f"{base}/{race_type}/{venue}/races", params) for race_type, venue in venues],
+            token=token
+        )
+        return {
+            "meetings": meetings,
+            "races_by_venue": {f"{race_type}/{venue}": r for (race_type, venue), r in zip(venues, races)},
+        }
+
+    @server.tool()
+    async def racing_get_race(
         ctx: Context,
-        access_token: str,
         meeting_date: str,
         race_type: str,
         venue_mnemonic: str,
         race_number: int,
+        access_token: Optional[str] = None,
         jurisdiction: Optional[str] = None,
         fixed_odds: bool = False,
     ) -> Dict[str, Any]:
         """Get detailed information for a specific race including runners, odds, and pools."""
         cfg: ConfigSchema = ctx.session_config
         race_type = _validate_race_type(race_type)
-        params = {
-            "jurisdiction": _validate_jurisdiction(jurisdiction, cfg),
-            "fixedOdds": str(fixed_odds).lower()
-        }
-        path = f"/v1/tab-info-service/racing/dates/{meeting_date}/meetings/{race_type}/{venue_mnemonic}/races/{race_number}"
-        return _bearer_get(cfg.base_url, path, access_token, params)
+        params = (
+            ("jurisdiction", _validate_jurisdiction(jurisdiction, cfg)),
+            ("fixedOdds", BOOL_PARAM[fixed_odds]),
+        )
+        path = _race_path(meeting_date, race_type, venue_mnemonic, race_number)
+        return await _tool_get(cfg, access_token, path, params)
 
     @server.tool()
-    def racing_get_next_to_go(
+    async def racing_get_next_to_go(
         ctx: Context,
-        access_token: str,
+        access_token: Optional[str] = None,
         jurisdiction: Optional[str] = None,
         max_races: Optional[int] = None,
         include_recently_closed: bool = False,
@@ -399,52 +970,81 @@ def create_server() -> FastMCP:
             params["maxRaces"] = max_races
         if include_recently_closed:
             params["includeRecentlyClosed"] = "true"
-        return _bearer_get(cfg.base_url, "/v1/tab-info-service/racing/next-to-go/races", access_token, params)
+        return await _tool_get(cfg, access_token, RACING_NEXT_TO_GO_PATH, params)
 
     @server.tool()
-    def racing_get_race_form(
+    async def racing_get_race_form(
         ctx: Context,
-        access_token: str,
         meeting_date: str,
         race_type: str,
         venue_mnemonic: str,
         race_number: int,
+        access_token: Optional[str] = None,
         jurisdiction: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Get comprehensive form guide for a race including all runners and their recent performance."""
         cfg: ConfigSchema = ctx.session_config
         race_type = _validate_race_type(race_type)
-        params = {"jurisdiction": _validate_jurisdiction(jurisdiction, cfg)}
-        path = f"/v1/tab-info-service/racing/dates/{meeting_date}/meetings/{race_type}/{venue_mnemonic}/races/{race_number}/form"
-        return _bearer_get(cfg.base_url, path, access_token, params)
+        params = (("jurisdiction", _validate_jurisdiction(jurisdiction, cfg)),)
+        path = f"{_race_path(meeting_date, race_type, venue_mnemonic, race_number)}/form"
+        return await _tool_get(cfg, access_token, path, params, stream=True)
+
+    @server.tool()
+    async def racing_get_all_race_forms(
+        ctx: Context,
+        meeting_date: str,
+        race_type: str,
+        venue_mnemonic: str,
+        race_numbers: List[int],
+        access_token: Optional[str] = None,
+        jurisdiction: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Get form guides for several races of a meeting concurrently.
+        
+        Args:
+            race_numbers: Races to fetch (e.g., [1, 2, 3])
+        
+        Returns:
+            Dict with 'forms' keyed by race number; failed races are returned
+            as {"error": message}
+        """
+        cfg: ConfigSchema = ctx.session_config
+        race_type = _validate_race_type(race_type)
+        params = (("jurisdiction", _validate_jurisdiction(jurisdiction, cfg)),)
+        forms = await _authed_get_many(
+            cfg, access_token,
+            [(f"{_race_path(meeting_date, race_type, venue_mnemonic, n)}/form", params) for n in race_numbers]
+        )
+        return {"forms": {str(n): form for n, form in zip(race_numbers, forms)}}
 
     @server.tool()
-    def racing_get_runner_form(
+    async def racing_get_runner_form(
         ctx: Context,
-        access_token: str,
         meeting_date: str,
         race_type: str,
         venue_mnemonic: str,
         race_number: int,
         runner_number: str,
+        access_token: Optional[str] = None,
         jurisdiction: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Get detailed form guide for a specific runner including past performances and statistics."""
         cfg: ConfigSchema = ctx.session_config
         race_type = _validate_race_type(race_type)
-        params = {"jurisdiction": _validate_jurisdiction(jurisdiction, cfg)}
-        path = f"/v1/tab-info-service/racing/dates/{meeting_date}/meetings/{race_type}/{venue_mnemonic}/races/{race_number}/form/{runner_number}"
-        return _bearer_get(cfg.base_url, path, access_token, params)
+        params = (("jurisdiction", _validate_jurisdiction(jurisdiction, cfg)),)
+        path = f"{_race_path(meeting_date, race_type, venue_mnemonic, race_number)}/form/{runner_number}"
+        return await _tool_get(cfg, access_token, path, params)
 
     @server.tool()
-    def racing_get_approximates(
+    async def racing_get_approximates(
         ctx: Context,
-        access_token: str,
         meeting_date: str,
         race_type: str,
         venue_mnemonic: str,
         race_number: int,
         wagering_product: str,
+        access_token: Optional[str] = None,
         jurisdiction: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
@@ -455,51 +1055,61 @@ def create_server() -> FastMCP:
         """
         cfg: ConfigSchema = ctx.session_config
         race_type = _validate_race_type(race_type)
-        params = {"jurisdiction": _validate_jurisdiction(jurisdiction, cfg)}
-        path = f"/v1/tab-info-service/racing/dates/{meeting_date}/meetings/{race_type}/{venue_mnemonic}/races/{race_number}/pools/{wagering_product}/approximates"
-        return _bearer_get(cfg.base_url, path, access_token, params)
+        params = (("jurisdiction", _validate_jurisdiction(jurisdiction, cfg)),)
+        path = f"{_race_path(meeting_date, race_type, venue_mnemonic, race_number)}/pools/{wagering_product}/approximates"
+        return await _tool_get(cfg, access_token, path, params)
 
     @server.tool()
-    def racing_get_open_jackpots(
+    async def racing_get_open_jackpots(
         ctx: Context,
-        access_token: str,
+        access_token: Optional[str] = None,
         jurisdiction: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Get all currently open jackpots across all meetings."""
         cfg: ConfigSchema = ctx.session_config
-        params = {"jurisdiction": _validate_jurisdiction(jurisdiction, cfg)}
-        return _bearer_get(cfg.base_url, "/v1/tab-info-service/racing/jackpots", access_token, params)
+        params = (("jurisdiction", _validate_jurisdiction(jurisdiction, cfg)),)
+        return await _tool_get(cfg, access_token, RACING_JACKPOTS_PATH, params)
 
     @server.tool()
-    def racing_get_jackpot_pools(
+    async def racing_get_jackpot_pools(
         ctx: Context,
-        access_token: str,
         meeting_date: str,
+        access_token: Optional[str] = None,
         jurisdiction: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Get all jackpot pools for a specific date."""
         cfg: ConfigSchema = ctx.session_config
-        params = {"jurisdiction": _validate_jurisdiction(jurisdiction, cfg)}
-        return _bearer_get(cfg.base_url, f"/v1/tab-info-service/racing/dates/{meeting_date}/jackpot-pools", access_token, params)
+        params = (("jurisdiction", _validate_jurisdiction(jurisdiction, cfg)),)
+        return await _tool_get(cfg, access_token, f"{RACING_DATES_PATH}/{meeting_date}/jackpot-pools", params)
 
     # ========== Sports Endpoints ==========
 
     @server.tool()
-    def sports_get_all_open(
+    async def sports_get_all_open(
         ctx: Context,
-        access_token: str,
+        access_token: Optional[str] = None,
         jurisdiction: Optional[str] = None,
+        fields: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
-        """Get all sports with at least one open or suspended market."""
+        """
+        Get all sports with at least one open or suspended market.
+        
+        Args:
+            fields: Optional sport keys to keep (e.g., ['sportName']); returns a
+                compact list instead of the full catalogue when given
+        """
         cfg: ConfigSchema = ctx.session_config
-        params = {"jurisdiction": _validate_jurisdiction(jurisdiction, cfg)}
-        return _bearer_get(cfg.base_url, "/v1/tab-info-service/sports", access_token, params)
+        params = (("jurisdiction", _validate_jurisdiction(jurisdiction, cfg)),)
+        result = await _tool_get(cfg, access_token, SPORTS_PATH, params, stream=True)
+        if fields:
+            result = {"sports": [{k: sport[k] for k in fields if k in sport} for sport in result.get("sports", [])]}
+        return result
 
     @server.tool()
-    def sports_get_open_sport(
+    async def sports_get_open_sport(
         ctx: Context,
-        access_token: str,
         sport_name: str,
+        access_token: Optional[str] = None,
         jurisdiction: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
@@ -509,15 +1119,15 @@ def create_server() -> FastMCP:
             sport_name: e.g., 'Basketball', 'Rugby League', 'AFL', 'Tennis', 'Soccer'
         """
         cfg: ConfigSchema = ctx.session_config
-        params = {"jurisdiction": _validate_jurisdiction(jurisdiction, cfg)}
-        return _bearer_get(cfg.base_url, f"/v1/tab-info-service/sports/{sport_name}", access_token, params)
+        params = (("jurisdiction", _validate_jurisdiction(jurisdiction, cfg)),)
+        return await _tool_get(cfg, access_token, f"{SPORTS_PATH}/{sport_name}", params)
 
     @server.tool()
-    def sports_get_open_competition(
+    async def sports_get_open_competition(
         ctx: Context,
-        access_token: str,
         sport_name: str,
         competition_name: str,
+        access_token: Optional[str] = None,
         jurisdiction: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
@@ -528,31 +1138,31 @@ def create_server() -> FastMCP:
             competition_name: e.g., 'NBA', 'NBL'
         """
         cfg: ConfigSchema = ctx.session_config
-        params = {"jurisdiction": _validate_jurisdiction(jurisdiction, cfg)}
-        return _bearer_get(cfg.base_url, f"/v1/tab-info-service/sports/{sport_name}/competitions/{competition_name}", access_token, params)
+        params = (("jurisdiction", _validate_jurisdiction(jurisdiction, cfg)),)
+        return await _tool_get(cfg, access_token, f"{SPORTS_PATH}/{sport_name}/competitions/{competition_name}", params)
 
     @server.tool()
-    def sports_get_open_tournament(
+    async def sports_get_open_tournament(
         ctx: Context,
-        access_token: str,
         sport_name: str,
         competition_name: str,
         tournament_name: str,
+        access_token: Optional[str] = None,
         jurisdiction: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Get a specific tournament with open markets (e.g., ATP tournaments in Tennis)."""
         cfg: ConfigSchema = ctx.session_config
-        params = {"jurisdiction": _validate_jurisdiction(jurisdiction, cfg)}
-        path = f"/v1/tab-info-service/sports/{sport_name}/competitions/{competition_name}/tournaments/{tournament_name}"
-        return _bearer_get(cfg.base_url, path, access_token, params)
+        params = (("jurisdiction", _validate_jurisdiction(jurisdiction, cfg)),)
+        path = f"{SPORTS_PATH}/{sport_name}/competitions/{competition_name}/tournaments/{tournament_name}"
+        return await _tool_get(cfg, access_token, path, params)
 
     @server.tool()
-    def sports_get_open_match_in_competition(
+    async def sports_get_open_match_in_competition(
         ctx: Context,
-        access_token: str,
         sport_name: str,
         competition_name: str,
         match_name: str,
+        access_token: Optional[str] = None,
         jurisdiction: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
@@ -562,30 +1172,30 @@ def create_server() -> FastMCP:
             match_name: e.g., 'Lakers v Warriors'
         """
         cfg: ConfigSchema = ctx.session_config
-        params = {"jurisdiction": _validate_jurisdiction(jurisdiction, cfg)}
-        path = f"/v1/tab-info-service/sports/{sport_name}/competitions/{competition_name}/matches/{match_name}"
-        return _bearer_get(cfg.base_url, path, access_token, params)
+        params = (("jurisdiction", _validate_jurisdiction(jurisdiction, cfg)),)
+        path = f"{SPORTS_PATH}/{sport_name}/competitions/{competition_name}/matches/{match_name}"
+        return await _tool_get(cfg, access_token, path, params)
 
     @server.tool()
-    def sports_get_open_match_in_tournament(
+    async def sports_get_open_match_in_tournament(
         ctx: Context,
-        access_token: str,
         sport_name: str,
         competition_name: str,
         tournament_name: str,
         match_name: str,
+        access_token: Optional[str] = None,
         jurisdiction: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Get a specific match in a tournament with open markets."""
         cfg: ConfigSchema = ctx.session_config
-        params = {"jurisdiction": _validate_jurisdiction(jurisdiction, cfg)}
-        path = f"/v1/tab-info-service/sports/{sport_name}/competitions/{competition_name}/tournaments/{tournament_name}/matches/{match_name}"
-        return _bearer_get(cfg.base_url, path, access_token, params)
+        params = (("jurisdiction", _validate_jurisdiction(jurisdiction, cfg)),)
+        path = f"{SPORTS_PATH}/{sport_name}/competitions/{competition_name}/tournaments/{tournament_name}/matches/{match_name}"
+        return await _tool_get(cfg, access_token, path, params)
 
     @server.tool()
-    def sports_get_next_to_go(
+    async def sports_get_next_to_go(
         ctx: Context,
-        access_token: str,
+        access_token: Optional[str] = None,
         jurisdiction: Optional[str] = None,
         limit: Optional[int] = None,
         live_betting_only: bool = False,
@@ -603,68 +1213,68 @@ def create_server() -> FastMCP:
             params["futuresOnly"] = "true"
         if open_only:
             params["openOnly"] = "true"
-        return _bearer_get(cfg.base_url, "/v1/tab-info-service/sports/nextToGo", access_token, params)
+        return await _tool_get(cfg, access_token, SPORTS_NEXT_TO_GO_PATH, params)
 
     # ========== Sports Results Endpoints ==========
 
     @server.tool()
-    def sports_get_all_results(
+    async def sports_get_all_results(
         ctx: Context,
-        access_token: str,
+        access_token: Optional[str] = None,
         jurisdiction: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Get all sports with at least one resulted market."""
         cfg: ConfigSchema = ctx.session_config
-        params = {"jurisdiction": _validate_jurisdiction(jurisdiction, cfg)}
-        return _bearer_get(cfg.base_url, "/v1/tab-info-service/sports/results", access_token, params)
+        params = (("jurisdiction", _validate_jurisdiction(jurisdiction, cfg)),)
+        return await _tool_get(cfg, access_token, SPORTS_RESULTS_PATH, params)
 
     @server.tool()
-    def sports_get_resulted_sport(
+    async def sports_get_resulted_sport(
         ctx: Context,
-        access_token: str,
         sport_name: str,
+        access_token: Optional[str] = None,
         jurisdiction: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Get a specific sport with resulted markets."""
         cfg: ConfigSchema = ctx.session_config
-        params = {"jurisdiction": _validate_jurisdiction(jurisdiction, cfg)}
-        return _bearer_get(cfg.base_url, f"/v1/tab-info-service/sports/results/{sport_name}", access_token, params)
+        params = (("jurisdiction", _validate_jurisdiction(jurisdiction, cfg)),)
+        return await _tool_get(cfg, access_token, f"{SPORTS_RESULTS_PATH}/{sport_name}", params)
 
     @server.tool()
-    def sports_get_resulted_competition(
+    async def sports_get_resulted_competition(
         ctx: Context,
-        access_token: str,
         sport_name: str,
         competition_name: str,
+        access_token: Optional[str] = None,
         jurisdiction: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Get a specific competition with resulted markets."""
         cfg: ConfigSchema = ctx.session_config
-        params = {"jurisdiction": _validate_jurisdiction(jurisdiction, cfg)}
-        return _bearer_get(cfg.base_url, f"/v1/tab-info-service/sports/results/{sport_name}/competitions/{competition_name}", access_token, params)
+        params = (("jurisdiction", _validate_jurisdiction(jurisdiction, cfg)),)
+        return await _tool_get(cfg, access_token, f"{SPORTS_RESULTS_PATH}/{sport_name}/competitions/{competition_name}", params)
 
     @server.tool()
-    def sports_get_resulted_match_in_competition(
+    async def sports_get_resulted_match_in_competition(
         ctx: Context,
-        access_token: str,
         sport_name: str,
         competition_name: str,
         match_name: str,
+        access_token: Optional[str] = None,
         jurisdiction: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Get a specific match with results in a competition."""
         cfg: ConfigSchema = ctx.session_config
-        params = {"jurisdiction": _validate_jurisdiction(jurisdiction, cfg)}
-        path = f"/v1/tab-info-service/sports/results/{sport_name}/competitions/{competition_name}/matches/{match_name}"
-        return _bearer_get(cfg.base_url, path, access_token, params)
+        params = (("jurisdiction", _validate_jurisdiction(jurisdiction, cfg)),)
+        path = f"{SPORTS_RESULTS_PATH}/{sport_name}/competitions/{competition_name}/matches/{match_name}"
+        return await _tool_get(cfg, access_token, path, params)
 
     # ========== FootyTAB Endpoints ==========
 
     @server.tool()
-    def footytab_get_all_rounds(
+    async def footytab_get_all_rounds(
         ctx: Context,
-        access_token: str,
         sport_name: str,
+        access_token: Optional[str] = None,
         jurisdiction: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
@@ -674,15 +1284,15 @@ def create_server() -> FastMCP:
             sport_name: e.g., 'AFL', 'Rugby League', 'Rugby Union'
         """
         cfg: ConfigSchema = ctx.session_config
-        params = {"jurisdiction": _validate_jurisdiction(jurisdiction, cfg)}
-        return _bearer_get(cfg.base_url, f"/v1/tab-info-service/sports/{sport_name}/footy/rounds", access_token, params)
+        params = (("jurisdiction", _validate_jurisdiction(jurisdiction, cfg)),)
+        return await _tool_get(cfg, access_token, f"{SPORTS_PATH}/{sport_name}/footy/rounds", params)
 
     @server.tool()
-    def footytab_get_round_details(
+    async def footytab_get_round_details(
         ctx: Context,
-        access_token: str,
         sport_name: str,
         round_number: int,
+        access_token: Optional[str] = None,
         jurisdiction: Optional[str] = None,
         series: Optional[str] = None,
     ) -> Dict[str, Any]:
@@ -696,51 +1306,124 @@ def create_server() -> FastMCP:
         params: Dict[str, Any] = {"jurisdiction": _validate_jurisdiction(jurisdiction, cfg)}
         if series:
             params["series"] = series
-        return _bearer_get(cfg.base_url, f"/v1/tab-info-service/sports/{sport_name}/footy/rounds/{round_number}", access_token, params)
+        return await _tool_get(cfg, access_token, f"{SPORTS_PATH}/{sport_name}/footy/rounds/{round_number}", params)
 
     # ========== Generic API Tools ==========
 
     @server.tool()
-    def tab_get(
+    async def tab_cache_clear(ctx: Context) -> Dict[str, Any]:
+        """
+        Clear cached API responses so the next requests fetch fresh data.
+        
+        Returns:
+            Dict with the number of cached responses that were discarded
+        """
+        cleared = _RESPONSE_CACHE.get_stats()["size"] + _NEXT_TO_GO_CACHE.get_stats()["size"]
+        await _RESPONSE_CACHE.clear()
+        await _NEXT_TO_GO_CACHE.clear()
+        return {"cleared": cleared}
+
+    @server.tool()
+    async def tab_get_valid_token(ctx: Context) -> Dict[str, Any]:
+        """
+        Get a valid access token for the session credentials.
+        
+        Returns the cached token while it is valid, refreshes it shortly before
+        expiry (when auto_refresh is enabled), or performs a new grant using the
+        password or client credentials from the session config.
+        
+        Returns:
+            Dict containing access_token, expires_in, expires_at, token_type
+        """
+        cfg: ConfigSchema = ctx.session_config
+        return await _ensure_token(cfg)
+
+    @server.tool()
+    async def tab_get(
         ctx: Context,
-        access_token: str,
         path: str,
+        access_token: Optional[str] = None,
         params: Optional[Dict[str, Any]] = None,
         jurisdiction: Optional[str] = None,
+        refresh_token: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Generic GET request to any Tabcorp API endpoint with bearer authentication.
         
         Args:
             path: API endpoint path (e.g., '/v1/tab-info-service/racing/dates')
+            access_token: Optional bearer token (obtained from session credentials if omitted)
             params: Optional query parameters
             jurisdiction: Optional jurisdiction override
+            refresh_token: Refresh token issued with access_token, used to renew it after a 401
         
         Use this for endpoints not covered by specialized tools.
         """
         cfg: ConfigSchema = ctx.session_config
-        p = dict(params or {})
-        if "jurisdiction" not in p and jurisdiction:
-            p["jurisdiction"] = _validate_jurisdiction(jurisdiction, cfg)
-        return _bearer_get(cfg.base_url, path, access_token, p)
+        p = params
+        if jurisdiction and (not params or "jurisdiction" not in params):
+            p = {**(params or {}), "jurisdiction": _validate_jurisdiction(jurisdiction, cfg)}
+        path = _normalize_path(path)
+        return await _authed(cfg, access_token, lambda token: _bearer_get(cfg.base_url, path, token, p),
+                             refresh_token)
 
     @server.tool()
-    def tab_post(
+    async def tab_get_many(
+        ctx: Context,
+        requests: List[Union[str, BatchRequest]],
+        access_token: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+        jurisdiction: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Concurrent GET requests to several Tabcorp API endpoints.
+        
+        Args:
+            requests: Paths to fetch, each either a path string or
+                {"path": ..., "params": {...}} for per-request query parameters
+            access_token: Optional bearer token (obtained from session credentials if omitted)
+            params: Optional query parameters applied to every request
+            jurisdiction: Optional jurisdiction override
+        
+        Returns:
+            List of responses in request order; failed requests are returned
+            as {"error": message}
+        """
+        cfg: ConfigSchema = ctx.session_config
+        items = [_batch_request(i, item) for i, item in enumerate(requests)]
+        p = params
+        if jurisdiction and (not params or "jurisdiction" not in params):
+            p = {**(params or {}), "jurisdiction": _validate_jurisdiction(jurisdiction, cfg)}
+
+        batch = [
+            (_normalize_path(item.path), {**(p or {}), **item.params} if item.params else p)
+            for item in items
+        ]
+        return await _authed_get_many(cfg, access_token, batch)
+
+    @server.tool()
+    async def tab_post(
         ctx: Context,
-        access_token: str,
         path: str,
+        access_token: Optional[str] = None,
         body: Optional[Dict[str, Any]] = None,
+        refresh_token: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Generic POST request to any Tabcorp API endpoint with bearer authentication.
         
         Args:
             path: API endpoint path
+            access_token: Optional bearer token (obtained from session credentials if omitted)
             body: Optional JSON request body
+            refresh_token: Refresh token issued with access_token, used to renew it after a 401
         
         Use this for placing bets or other POST operations.
         """
         cfg: ConfigSchema = ctx.session_config
-        return _bearer_post(cfg.base_url, path, access_token, body or {})
+        path = _normalize_path(path)
+        return await _authed(cfg, access_token, lambda token: _bearer_post(cfg.base_url, path, token, body or {}),
+                             refresh_token)
 
+    _TOOLS = server._tool_manager.list_tools()
     return server
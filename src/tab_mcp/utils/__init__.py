@@ -46,6 +46,7 @@ from .enhanced_api import (
     enhanced_oauth_post,
     enhanced_bearer_get,
     enhanced_bearer_post,
+    aclose_shared_client,
 )
 
 __all__ = [
@@ -76,4 +77,5 @@ __all__ = [
     'enhanced_oauth_post',
     'enhanced_bearer_get',
     'enhanced_bearer_post',
+    'aclose_shared_client',
 ]
@@ -11,7 +11,6 @@ from typing import Any, Callable, Optional, TypeVar, Dict, Tuple
 from functools import wraps, lru_cache
 from collections import OrderedDict
 import hashlib
-import json
 
 logger = logging.getLogger(__name__)
 
@@ -34,42 +33,63 @@ class TTLCache:
         self._hits = 0
         self._misses = 0
         self._lock = asyncio.Lock()
+        # Calls in progress per key, so concurrent misses share one execution
+        self._inflight: Dict[str, asyncio.Task] = {}
         
     async def get(self, key: str) -> Optional[Any]:
-        """Get item from cache if exists and not expired."""
-        async with self._lock:
-            if key in self._cache:
-                value, timestamp = self._cache[key]
-                
-                # Check if expired
-                if time.time() - timestamp > self.ttl_seconds:
+        """Get item from cache if exists and not expired.
+        
+        Hits never take the lock: the lookup, TTL check and LRU bump contain
+        no await, so they cannot interleave with other coroutines.
+        """
+        entry = self._cache.get(key)
+        if entry is not None and time.monotonic() <= entry[1]:
+            # Move to end (most recently used)
+            self._cache.move_to_end(key)
+            self._hits += 1
+            logger.debug("Cache hit for key: %s", key)
+            return entry[0]
+        
+        self._misses += 1
+        if entry is not None:
+            async with self._lock:
+                if self._cache.get(key) is entry:
                     del self._cache[key]
-                    self._misses += 1
-                    logger.debug(f"Cache expired for key: {key}")
-                    return None
-                
-                # Move to end (most recently used)
-                self._cache.move_to_end(key)
-                self._hits += 1
-                logger.debug(f"Cache hit for key: {key}")
-                return value
-            
-            self._misses += 1
-            logger.debug(f"Cache miss for key: {key}")
-            return None
+                    logger.debug("Cache expired for key: %s", key)
+        logger.debug("Cache miss for key: %s", key)
+        return None
     
-    async def set(self, key: str, value: Any) -> None:
-        """Set item in cache with current timestamp."""
-        async with self._lock:
-            # Remove oldest item if at capacity
-            if len(self._cache) >= self.maxsize and key not in self._cache:
-                oldest_key = next(iter(self._cache))
-                del self._cache[oldest_key]
-                logger.debug(f"Cache full, evicted: {oldest_key}")
-            
-            self._cache[key] = (value, time.time())
-            self._cache.move_to_end(key)
-            logger.debug(f"Cache set for key: {key}")
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Set item in cache, expiring after ttl seconds (defaults to ttl_seconds)."""
+        now = time.monotonic()
+        self._sweep(now)
+        
+        # Remove oldest item if at capacity
+        if len(self._cache) >= self.maxsize and key not in self._cache:
+            async with self._lock:
+                if len(self._cache) >= self.maxsize and key not in self._cache:
+                    oldest_key = next(iter(self._cache))
+                    del self._cache[oldest_key]
+                    logger.debug("Cache full, evicted: %s", oldest_key)
+        
+        self._cache[key] = (value, now + (self.ttl_seconds if ttl is None else ttl))
+        self._cache.move_to_end(key)
+        logger.debug("Cache set for key: %s", key)
+    
+    def _sweep(self, now: float) -> None:
+        """Evict expired entries from the least-recently-used end.
+        
+        Stops at the first live entry, so each call costs O(expired) and cold
+        keys are released on later writes instead of lingering until read.
+        Entries behind a live one (recently used, or with a longer TTL) are
+        left for a later sweep or their own lookup.
+        """
+        cache = self._cache
+        while cache:
+            key, (_, expires_at) = next(iter(cache.items()))
+            if now <= expires_at:
+                break
+            del cache[key]
     
     async def clear(self) -> None:
         """Clear all cached items."""
@@ -78,7 +98,11 @@ class TTLCache:
             logger.info("Cache cleared")
     
     def get_stats(self) -> Dict[str, Any]:
-        """Get cache statistics."""
+        """Get cache statistics.
+        
+        Counters are updated without the lock, so a snapshot taken while
+        other coroutines run may be momentarily stale but is never corrupt.
+        """
         total_requests = self._hits + self._misses
         hit_rate = (self._hits / total_requests * 100) if total_requests > 0 else 0
         
@@ -97,33 +121,39 @@ _api_cache = TTLCache(maxsize=256, ttl_seconds=300.0)  # 5 minutes
 _token_cache = TTLCache(maxsize=10, ttl_seconds=1800.0)  # 30 minutes
 _race_cache = TTLCache(maxsize=512, ttl_seconds=60.0)  # 1 minute (racing data changes frequently)
 
+# Named caches, built once rather than per lookup
+_CACHES: Dict[str, TTLCache] = {
+    'api': _api_cache,
+    'token': _token_cache,
+    'race': _race_cache,
+}
+
 
 def _generate_cache_key(func_name: str, args: tuple, kwargs: dict) -> str:
     """Generate unique cache key from function name and arguments."""
-    # Create deterministic string from args and kwargs
-    key_parts = [func_name]
-    
-    # Add args
+    # Feed each argument's repr straight into the hasher; the NUL separator
+    # keeps ("ab", "c") and ("a", "bc") distinct
+    h = hashlib.blake2b(func_name.encode(), digest_size=8)
     for arg in args:
-        if isinstance(arg, (str, int, float, bool)):
-            key_parts.append(str(arg))
-        else:
-            # For complex objects, use their string representation
-            key_parts.append(str(arg))
+        h.update(b"\x00")
+        h.update(repr(arg).encode())
     
     # Add kwargs in sorted order for consistency
-    for k in sorted(kwargs.keys()):
-        v = kwargs[k]
-        if isinstance(v, (str, int, float, bool)):
-            key_parts.append(f"{k}={v}")
-        else:
-            key_parts.append(f"{k}={str(v)}")
-    
-    # Generate hash for compact key
-    key_string = "|".join(key_parts)
-    key_hash = hashlib.md5(key_string.encode()).hexdigest()
+    for k in sorted(kwargs):
+        h.update(b"\x00")
+        h.update(k.encode())
+        h.update(b"=")
+        h.update(repr(kwargs[k]).encode())
     
-    return f"{func_name}:{key_hash}"
+    return f"{func_name}:{h.hexdigest()}"
+
+
+async def _call_and_store(cache: TTLCache, cache_key: str, func: Callable[..., Any],
+                          args: tuple, kwargs: dict) -> Any:
+    """Run a cached function and store its result."""
+    result = await func(*args, **kwargs)
+    await cache.set(cache_key, result)
+    return result
 
 
 def cached_api_call(
@@ -137,6 +167,11 @@ def cached_api_call(
         cache_type: Type of cache to use ('api', 'token', 'race')
         ttl_seconds: Override default TTL for this cached function
         maxsize: Override default maxsize for this cached function
+    
+    The decorated function exposes its cache as ``cache``, plus
+    ``cache_info()`` (statistics) and ``await cache_clear()``. Without a
+    ttl_seconds/maxsize override the cache is the shared one for cache_type,
+    so clearing it affects every function using that type.
         
     Example:
         @cached_api_call(cache_type='race', ttl_seconds=30)
@@ -144,13 +179,7 @@ def cached_api_call(
             return await api.fetch_results(race_id)
     """
     # Select cache based on type
-    cache_map = {
-        'api': _api_cache,
-        'token': _token_cache,
-        'race': _race_cache
-    }
-    
-    cache = cache_map.get(cache_type, _api_cache)
+    cache = _CACHES.get(cache_type, _api_cache)
     
     # Create custom cache if parameters specified
     if ttl_seconds is not None or maxsize is not None:
@@ -168,18 +197,25 @@ def cached_api_call(
             # Try to get from cache
             cached_value = await cache.get(cache_key)
             if cached_value is not None:
-                logger.info(f"Cache hit for {func.__name__}")
+                logger.debug("Cache hit for %s", func.__name__)
                 return cached_value
             
-            # Cache miss - execute function
-            logger.info(f"Cache miss for {func.__name__} - executing")
-            result = await func(*args, **kwargs)
-            
-            # Store in cache
-            await cache.set(cache_key, result)
-            
-            return result
+            # Cache miss - join an identical call already in flight, or start one
+            loop = asyncio.get_running_loop()
+            task = cache._inflight.get(cache_key)
+            if task is None or task.get_loop() is not loop:
+                logger.debug("Cache miss for %s - executing", func.__name__)
+                task = loop.create_task(_call_and_store(cache, cache_key, func, args, kwargs))
+                cache._inflight[cache_key] = task
+                task.add_done_callback(
+                    lambda t: cache._inflight.pop(cache_key, None) if cache._inflight.get(cache_key) is t else None
+                )
+            # Shielded so one cancelled caller does not cancel the call for the others
+            return await asyncio.shield(task)
         
+        wrapper.cache = cache
+        wrapper.cache_info = cache.get_stats
+        wrapper.cache_clear = cache.clear
         return wrapper
     
     return decorator
@@ -197,16 +233,9 @@ async def clear_cache(cache_type: Optional[str] = None) -> None:
         await _token_cache.clear()
         await _race_cache.clear()
         logger.info("All caches cleared")
-    else:
-        cache_map = {
-            'api': _api_cache,
-            'token': _token_cache,
-            'race': _race_cache
-        }
-        
-        if cache_type in cache_map:
-            await cache_map[cache_type].clear()
-            logger.info(f"{cache_type} cache cleared")
+    elif cache_type in _CACHES:
+        await _CACHES[cache_type].clear()
+        logger.info("%s cache cleared", cache_type)
 
 
 def get_cache_stats(cache_type: Optional[str] = None) -> Dict[str, Any]:
@@ -220,20 +249,10 @@ def get_cache_stats(cache_type: Optional[str] = None) -> Dict[str, Any]:
     """
     if cache_type is None:
         # Return stats for all caches
-        return {
-            'api': _api_cache.get_stats(),
-            'token': _token_cache.get_stats(),
-            'race': _race_cache.get_stats()
-        }
-    
-    cache_map = {
-        'api': _api_cache,
-        'token': _token_cache,
-        'race': _race_cache
-    }
+        return {name: cache.get_stats() for name, cache in _CACHES.items()}
     
-    if cache_type in cache_map:
-        return cache_map[cache_type].get_stats()
+    if cache_type in _CACHES:
+        return _CACHES[cache_type].get_stats()
     
     return {}
 
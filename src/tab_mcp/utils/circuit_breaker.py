@@ -5,6 +5,7 @@ Prevents cascading failures by temporarily blocking calls to failing services.
 
 import asyncio
 import logging
+import threading
 import time
 from enum import Enum
 from typing import Callable, Optional, TypeVar, Any
@@ -28,9 +29,9 @@ class CircuitBreakerOpenError(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CircuitBreakerConfig:
-    """Circuit breaker configuration."""
+    """Circuit breaker configuration (immutable, so one instance can be shared by many breakers)."""
     failure_threshold: int = 5          # Failures before opening circuit
     success_threshold: int = 2          # Successes to close circuit from half-open
     timeout_seconds: float = 60.0       # Time to wait before trying again
@@ -40,6 +41,11 @@ class CircuitBreakerConfig:
 class CircuitBreaker:
     """Circuit breaker for protecting against cascading failures."""
     
+    __slots__ = (
+        'name', 'config', '_state', '_failure_count', '_success_count',
+        '_last_failure_time', '_half_open_calls', '_lock',
+    )
+    
     def __init__(self, name: str, config: Optional[CircuitBreakerConfig] = None):
         """Initialize circuit breaker.
         
@@ -57,7 +63,7 @@ class CircuitBreaker:
         self._half_open_calls = 0
         self._lock = asyncio.Lock()
         
-        logger.info(f"Circuit breaker '{name}' initialized in CLOSED state")
+        logger.info("Circuit breaker '%s' initialized in CLOSED state", name)
     
     @property
     def state(self) -> CircuitState:
@@ -77,11 +83,25 @@ class CircuitBreaker:
         Raises:
             CircuitBreakerOpenError: If circuit is open
         """
+        # Fast path: a CLOSED circuit admits every call, so no lock is needed
+        # to let it through; failures still go through _on_failure's lock
+        if self._state is CircuitState.CLOSED:
+            try:
+                result = await func(*args, **kwargs)
+            except Exception as e:
+                await self._on_failure(e)
+                raise
+            if self._state is CircuitState.CLOSED:
+                self._failure_count = 0
+            else:
+                await self._on_success()
+            return result
+        
         async with self._lock:
             # Check if we should transition from OPEN to HALF_OPEN
             if self._state == CircuitState.OPEN:
                 if self._should_attempt_reset():
-                    logger.info(f"Circuit '{self.name}' transitioning OPEN -> HALF_OPEN")
+                    logger.info("Circuit '%s' transitioning OPEN -> HALF_OPEN", self.name)
                     self._state = CircuitState.HALF_OPEN
                     self._half_open_calls = 0
                 else:
@@ -122,12 +142,12 @@ class CircuitBreaker:
             if self._state == CircuitState.HALF_OPEN:
                 self._success_count += 1
                 logger.info(
-                    f"Circuit '{self.name}' success in HALF_OPEN: "
-                    f"{self._success_count}/{self.config.success_threshold}"
+                    "Circuit '%s' success in HALF_OPEN: %d/%d",
+                    self.name, self._success_count, self.config.success_threshold
                 )
                 
                 if self._success_count >= self.config.success_threshold:
-                    logger.info(f"Circuit '{self.name}' transitioning HALF_OPEN -> CLOSED")
+                    logger.info("Circuit '%s' transitioning HALF_OPEN -> CLOSED", self.name)
                     self._state = CircuitState.CLOSED
                     self._success_count = 0
     
@@ -138,19 +158,19 @@ class CircuitBreaker:
             self._last_failure_time = time.time()
             
             logger.warning(
-                f"Circuit '{self.name}' failure: {str(exception)} "
-                f"({self._failure_count}/{self.config.failure_threshold})"
+                "Circuit '%s' failure: %s (%d/%d)",
+                self.name, exception, self._failure_count, self.config.failure_threshold
             )
             
             if self._state == CircuitState.HALF_OPEN:
                 # Any failure in HALF_OPEN immediately opens circuit
-                logger.error(f"Circuit '{self.name}' transitioning HALF_OPEN -> OPEN")
+                logger.error("Circuit '%s' transitioning HALF_OPEN -> OPEN", self.name)
                 self._state = CircuitState.OPEN
                 self._success_count = 0
                 
             elif self._failure_count >= self.config.failure_threshold:
                 logger.error(
-                    f"Circuit '{self.name}' threshold exceeded, transitioning CLOSED -> OPEN"
+                    "Circuit '%s' threshold exceeded, transitioning CLOSED -> OPEN", self.name
                 )
                 self._state = CircuitState.OPEN
     
@@ -189,7 +209,7 @@ class CircuitBreaker:
     async def reset(self) -> None:
         """Manually reset circuit breaker to CLOSED state."""
         async with self._lock:
-            logger.info(f"Manually resetting circuit '{self.name}' to CLOSED")
+            logger.info("Manually resetting circuit '%s' to CLOSED", self.name)
             self._state = CircuitState.CLOSED
             self._failure_count = 0
             self._success_count = 0
@@ -198,6 +218,7 @@ class CircuitBreaker:
 
 # Global circuit breakers for different services
 _circuit_breakers: dict[str, CircuitBreaker] = {}
+_circuit_breakers_lock = threading.Lock()
 
 
 def get_circuit_breaker(name: str, config: Optional[CircuitBreakerConfig] = None) -> CircuitBreaker:
@@ -210,9 +231,16 @@ def get_circuit_breaker(name: str, config: Optional[CircuitBreakerConfig] = None
     Returns:
         CircuitBreaker instance
     """
-    if name not in _circuit_breakers:
-        _circuit_breakers[name] = CircuitBreaker(name, config)
-    return _circuit_breakers[name]
+    breaker = _circuit_breakers.get(name)
+    if breaker is None:
+        with _circuit_breakers_lock:
+            breaker = _circuit_breakers.get(name)
+            if breaker is None:
+                breaker = _circuit_breakers[name] = CircuitBreaker(name, config)
+                return breaker
+    if config is not None and config != breaker.config:
+        logger.warning("Circuit breaker '%s' already exists; ignoring different config", name)
+    return breaker
 
 
 def circuit_breaker(
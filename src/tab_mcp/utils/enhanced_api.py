@@ -3,12 +3,15 @@
 Provides drop-in replacements for httpx calls with built-in resilience.
 """
 
+import asyncio
+import atexit
+import hashlib
 import httpx
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from .retry_utils import retry_with_backoff, API_RETRY_CONFIG
-from .cache_utils import cached_api_call
+from .cache_utils import cached_api_call, TTLCache
 from .circuit_breaker import circuit_breaker, CircuitBreakerConfig
 
 logger = logging.getLogger(__name__)
@@ -21,29 +24,112 @@ TABCORP_CIRCUIT_CONFIG = CircuitBreakerConfig(
     half_open_max_calls=1
 )
 
+# Connection pool limits for the shared client used by the enhanced_* helpers
+DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0)
+
+# Successful GET bodies for EnhancedHTTPClient.get as (status, headers, content);
+# Response objects themselves are tied to their stream and are never cached
+_response_cache = TTLCache(maxsize=256, ttl_seconds=300.0)
+
+# Process-wide client and the event loop it was created on; connections are
+# loop-bound, so a new loop (e.g. a fresh asyncio.run) gets a new client
+_shared_client: Optional[Tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared pooled client, creating it on first use in this event loop.
+    
+    Creation has no await points, so concurrent callers on one loop cannot race.
+    
+    Returns:
+        httpx.AsyncClient with HTTP/2 and keep-alive pooling
+    """
+    global _shared_client
+    loop = asyncio.get_running_loop()
+    if _shared_client is None or _shared_client[0] is not loop:
+        _shared_client = (loop, httpx.AsyncClient(http2=True, limits=DEFAULT_LIMITS))
+    return _shared_client[1]
+
+
+async def aclose_shared_client() -> None:
+    """Close the shared client (for use from a host application's shutdown hook)."""
+    global _shared_client
+    entry, _shared_client = _shared_client, None
+    if entry is not None and entry[0] is asyncio.get_running_loop():
+        await entry[1].aclose()
+
+
+def _response_cache_key(url: str, params: Optional[Dict[str, Any]], headers: Optional[Dict[str, str]]) -> str:
+    """Build a cache key from the URL, query and credentials (so tokens never share entries)."""
+    auth = next((v for k, v in (headers or {}).items() if k.lower() == "authorization"), "")
+    raw = repr((url, sorted((params or {}).items()), auth))
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+def _cache_response(response: httpx.Response) -> Tuple[int, Tuple[Tuple[str, str], ...], bytes]:
+    """Reduce a response to the plain data needed to rebuild it.
+    
+    The stored content is already decoded, so encoding and length headers are dropped.
+    """
+    headers = tuple(
+        (k, v) for k, v in response.headers.multi_items() if k not in ("content-encoding", "content-length")
+    )
+    return response.status_code, headers, response.content
+
+
+@atexit.register
+def _close_shared_client() -> None:
+    """Best-effort close of the shared client on interpreter shutdown."""
+    global _shared_client
+    entry, _shared_client = _shared_client, None
+    if entry is None or entry[0].is_closed():
+        return
+    try:
+        entry[0].run_until_complete(entry[1].aclose())
+    except Exception:
+        # Loop still running or torn down mid-close; sockets close with the process
+        pass
+
+
+class _UnopenedClient:
+    """Stand-in for EnhancedHTTPClient._client outside the context manager; any use raises."""
+    
+    __slots__ = ()
+    
+    def __getattr__(self, name: str) -> Any:
+        raise RuntimeError("Client not initialized. Use async context manager.")
+
+
+_UNOPENED = _UnopenedClient()
+
 
 class EnhancedHTTPClient:
     """HTTP client with retry, caching, and circuit breaker."""
     
-    def __init__(self, timeout: float = 30.0):
+    def __init__(self, timeout: float = 30.0, limits: Optional[httpx.Limits] = None):
         """Initialize enhanced HTTP client.
         
         Args:
             timeout: Request timeout in seconds
+            limits: Connection pool limits (defaults to DEFAULT_LIMITS)
         """
         self.timeout = timeout
-        self._client: Optional[httpx.AsyncClient] = None
+        self.limits = limits or DEFAULT_LIMITS
+        # Requests go straight to self._client; until __aenter__ it is a stub
+        # that raises, so the request path needs no initialization check
+        self._client: Any = _UNOPENED
         logger.info(f"EnhancedHTTPClient initialized with {timeout}s timeout")
     
     async def __aenter__(self):
         """Async context manager entry."""
-        self._client = httpx.AsyncClient(timeout=self.timeout)
+        self._client = httpx.AsyncClient(timeout=self.timeout, http2=True, limits=self.limits)
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        if self._client:
-            await self._client.aclose()
+        client, self._client = self._client, _UNOPENED
+        if client is not _UNOPENED:
+            await client.aclose()
     
     @retry_with_backoff(config=API_RETRY_CONFIG)
     @circuit_breaker('tabcorp_api', config=TABCORP_CIRCUIT_CONFIG)
@@ -65,9 +151,6 @@ class EnhancedHTTPClient:
         Returns:
             httpx.Response
         """
-        if not self._client:
-            raise RuntimeError("Client not initialized. Use async context manager.")
-        
         logger.debug(f"Enhanced POST to {url}")
         response = await self._client.post(
             url,
@@ -80,7 +163,6 @@ class EnhancedHTTPClient:
     
     @retry_with_backoff(config=API_RETRY_CONFIG)
     @circuit_breaker('tabcorp_api', config=TABCORP_CIRCUIT_CONFIG)
-    @cached_api_call(cache_type='api', ttl_seconds=300)
     async def get(
         self,
         url: str,
@@ -90,6 +172,10 @@ class EnhancedHTTPClient:
     ) -> httpx.Response:
         """GET request with retry, circuit breaker, and caching.
         
+        Successful bodies are cached by URL, params and Authorization header;
+        a hit returns a fresh Response rebuilt from the stored body. Calls
+        with extra httpx arguments bypass the cache.
+        
         Args:
             url: Request URL
             headers: Request headers
@@ -99,8 +185,17 @@ class EnhancedHTTPClient:
         Returns:
             httpx.Response
         """
-        if not self._client:
-            raise RuntimeError("Client not initialized. Use async context manager.")
+        cache_key = None if kwargs else _response_cache_key(url, params, headers)
+        if cache_key is not None:
+            cached = await _response_cache.get(cache_key)
+            if cached is not None:
+                status_code, cached_headers, content = cached
+                return httpx.Response(
+                    status_code,
+                    headers=cached_headers,
+                    content=content,
+                    request=httpx.Request("GET", url, params=params, headers=headers)
+                )
         
         logger.debug(f"Enhanced GET to {url}")
         response = await self._client.get(
@@ -110,6 +205,8 @@ class EnhancedHTTPClient:
             **kwargs
         )
         response.raise_for_status()
+        if cache_key is not None:
+            await _response_cache.set(cache_key, _cache_response(response))
         return response
 
 
@@ -134,10 +231,9 @@ async def enhanced_oauth_post(
     Returns:
         JSON response as dict
     """
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        response = await client.post(url, data=data, headers=headers)
-        response.raise_for_status()
-        return response.json()
+    response = await _get_client().post(url, data=data, headers=headers, timeout=timeout)
+    response.raise_for_status()
+    return response.json()
 
 
 @retry_with_backoff(config=API_RETRY_CONFIG)
@@ -161,10 +257,9 @@ async def enhanced_bearer_get(
         JSON response as dict
     """
     headers = {"Authorization": f"Bearer {token}"}
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        response = await client.get(url, headers=headers, params=params)
-        response.raise_for_status()
-        return response.json()
+    response = await _get_client().get(url, headers=headers, params=params, timeout=timeout)
+    response.raise_for_status()
+    return response.json()
 
 
 @retry_with_backoff(config=API_RETRY_CONFIG)
@@ -187,7 +282,6 @@ async def enhanced_bearer_post(
         JSON response as dict
     """
     headers = {"Authorization": f"Bearer {token}"}
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        response = await client.post(url, headers=headers, json=data)
-        response.raise_for_status()
-        return response.json()
+    response = await _get_client().post(url, headers=headers, json=data, timeout=timeout)
+    response.raise_for_status()
+    return response.json()
@@ -5,15 +5,26 @@ Provides configurable retry logic to handle transient failures gracefully.
 
 import asyncio
 import logging
+import random
+import time
 from typing import TypeVar, Callable, Any, Optional
 from dataclasses import dataclass
 from functools import wraps
 
+import httpx
+
+from .circuit_breaker import CircuitBreakerOpenError
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
 
+class MaxRetriesExceededError(Exception):
+    """Raised when maximum retry attempts are exhausted."""
+    pass
+
+
 @dataclass
 class RetryConfig:
     """Configuration for retry behavior."""
@@ -21,12 +32,22 @@ class RetryConfig:
     initial_delay: float = 1.0  # seconds
     max_delay: float = 10.0     # seconds
     exponential_base: float = 2.0
+    jitter: float = 0.5         # up to +50% random spread so concurrent retries do not align
     retry_on: tuple = (Exception,)
-    
+    # Raised immediately even if they match retry_on: an open circuit must fail
+    # fast, and an inner retry decorator has already done its retrying
+    no_retry_on: tuple = (CircuitBreakerOpenError, MaxRetriesExceededError)
+    # Optional finer filter: an exception matching retry_on is only retried if
+    # retry_if(exc) is true, otherwise it is raised immediately
+    retry_if: Optional[Callable[[BaseException], bool]] = None
 
-class MaxRetriesExceededError(Exception):
-    """Raised when maximum retry attempts are exhausted."""
-    pass
+
+def _is_transient(exc: BaseException) -> bool:
+    """Return False for HTTP error statuses that a retry cannot fix (4xx other than 429)."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status >= 500 or status == 429
+    return True
 
 
 def retry_with_backoff(config: Optional[RetryConfig] = None):
@@ -46,38 +67,55 @@ def retry_with_backoff(config: Optional[RetryConfig] = None):
     if config is None:
         config = RetryConfig()
     
+    # Backoff schedule before jitter, indexed by failed attempt number - 1
+    delays = tuple(
+        min(config.initial_delay * config.exponential_base ** i, config.max_delay)
+        for i in range(max(config.max_attempts - 1, 0))
+    )
+    # Read once here so the retry loops use fast local lookups; like the
+    # schedule above, later changes to config do not affect this decorator
+    max_attempts = config.max_attempts
+    max_delay = config.max_delay
+    jitter = config.jitter
+    retry_on = config.retry_on
+    no_retry_on = config.no_retry_on
+    retry_if = config.retry_if
+    
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
         @wraps(func)
         async def async_wrapper(*args, **kwargs) -> T:
             last_exception = None
-            delay = config.initial_delay
             
-            for attempt in range(1, config.max_attempts + 1):
+            for attempt in range(1, max_attempts + 1):
                 try:
                     logger.debug(
-                        f"Attempt {attempt}/{config.max_attempts} for {func.__name__}"
+                        "Attempt %d/%d for %s", attempt, max_attempts, func.__name__
                     )
                     return await func(*args, **kwargs)
                     
-                except config.retry_on as e:
+                except no_retry_on:
+                    raise
+                except retry_on as e:
+                    if retry_if is not None and not retry_if(e):
+                        raise
                     last_exception = e
                     
-                    if attempt == config.max_attempts:
+                    if attempt == max_attempts:
                         logger.error(
-                            f"Max retries ({config.max_attempts}) exceeded for {func.__name__}: {str(e)}"
+                            "Max retries (%d) exceeded for %s: %s", max_attempts, func.__name__, e
                         )
                         raise MaxRetriesExceededError(
-                            f"Failed after {config.max_attempts} attempts: {str(e)}"
+                            f"Failed after {max_attempts} attempts: {str(e)}"
                         ) from e
                     
-                    # Calculate next delay with exponential backoff
+                    # Next delay from the precomputed exponential schedule
+                    delay = min(delays[attempt - 1] * (1 + random.random() * jitter), max_delay)
                     logger.warning(
-                        f"Attempt {attempt} failed for {func.__name__}: {str(e)}. "
-                        f"Retrying in {delay:.1f}s..."
+                        "Attempt %d failed for %s: %s. Retrying in %.1fs...",
+                        attempt, func.__name__, e, delay
                     )
                     
                     await asyncio.sleep(delay)
-                    delay = min(delay * config.exponential_base, config.max_delay)
                     
             # Should never reach here, but for type safety
             if last_exception:
@@ -86,34 +124,36 @@ def retry_with_backoff(config: Optional[RetryConfig] = None):
         @wraps(func)
         def sync_wrapper(*args, **kwargs) -> T:
             last_exception = None
-            delay = config.initial_delay
             
-            for attempt in range(1, config.max_attempts + 1):
+            for attempt in range(1, max_attempts + 1):
                 try:
                     logger.debug(
-                        f"Attempt {attempt}/{config.max_attempts} for {func.__name__}"
+                        "Attempt %d/%d for %s", attempt, max_attempts, func.__name__
                     )
                     return func(*args, **kwargs)
                     
-                except config.retry_on as e:
+                except no_retry_on:
+                    raise
+                except retry_on as e:
+                    if retry_if is not None and not retry_if(e):
+                        raise
                     last_exception = e
                     
-                    if attempt == config.max_attempts:
+                    if attempt == max_attempts:
                         logger.error(
-                            f"Max retries ({config.max_attempts}) exceeded for {func.__name__}: {str(e)}"
+                            "Max retries (%d) exceeded for %s: %s", max_attempts, func.__name__, e
                         )
                         raise MaxRetriesExceededError(
-                            f"Failed after {config.max_attempts} attempts: {str(e)}"
+                            f"Failed after {max_attempts} attempts: {str(e)}"
                         ) from e
                     
+                    delay = min(delays[attempt - 1] * (1 + random.random() * jitter), max_delay)
                     logger.warning(
-                        f"Attempt {attempt} failed for {func.__name__}: {str(e)}. "
-                        f"Retrying in {delay:.1f}s..."
+                        "Attempt %d failed for %s: %s. Retrying in %.1fs...",
+                        attempt, func.__name__, e, delay
                     )
                     
-                    import time
                     time.sleep(delay)
-                    delay = min(delay * config.exponential_base, config.max_delay)
                     
             if last_exception:
                 raise last_exception
@@ -133,7 +173,9 @@ API_RETRY_CONFIG = RetryConfig(
     initial_delay=1.0,
     max_delay=4.0,
     exponential_base=2.0,
-    retry_on=(ConnectionError, TimeoutError, Exception)
+    # Transport failures, 5xx and 429; other HTTP error statuses are raised at once
+    retry_on=(httpx.TransportError, httpx.HTTPStatusError, ConnectionError, TimeoutError),
+    retry_if=_is_transient,
 )
 
 QUICK_RETRY_CONFIG = RetryConfig(
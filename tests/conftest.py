@@ -1,27 +1,110 @@
-"""Shared pytest fixtures and utilities for Tabcorp MCP Server tests"""
+"""Shared pytest fixtures and utilities for Tabcorp MCP Server tests
+
+Only configuration, isolation and server fixtures live here. Sample data and
+endpoint mocks are in tests/fixtures and are pulled in by the conftest of
+each directory that uses them.
+"""
+import argparse
+import asyncio
 import os
-import time
-from typing import Dict, Any, Optional
-from unittest.mock import Mock
+from types import SimpleNamespace
+from typing import Dict, Any, List, Optional
 
 import pytest
-import respx
 from httpx import Response
-from mcp.server.fastmcp import Context
+from respx import mocks as respx_mocks
+
+from fixtures import PERSISTENT_ROUTERS, TEST_BASE_URL
 
 # Test configuration
-TEST_BASE_URL = "https://api.beta.tab.com.au"
 TEST_CLIENT_ID = os.getenv("TAB_CLIENT_ID", "test_client_id")
 TEST_CLIENT_SECRET = os.getenv("TAB_CLIENT_SECRET", "test_client_secret")
 TEST_USERNAME = os.getenv("TAB_USERNAME", "test_username")
 TEST_PASSWORD = os.getenv("TAB_PASSWORD", "test_password")
 
+RAM_DISK = "/dev/shm"
+
+_DURATION_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def _duration(value: str) -> float:
+    """Parse a duration such as 90s, 30m, 1h or 2d into seconds"""
+    unit = _DURATION_UNITS.get(value[-1:])
+    try:
+        return float(value[:-1]) * unit if unit else float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid duration: {value!r} (use e.g. 90s, 30m, 1h)") from None
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--only-stale", type=_duration, default=None, metavar="DURATION",
+        help="Skip integration tests that passed within DURATION (e.g. 1h), per the pytest cache"
+    )
+
+
+def pytest_configure(config):
+    """Put tmp_path and friends on a RAM disk when one is available
+
+    Only the temp root moves (PYTEST_DEBUG_TEMPROOT), so pytest still creates a
+    numbered pytest-of-<user>/pytest-N directory per run with its usual
+    retention, and concurrent runs do not wipe each other's trees. An explicit
+    --basetemp or PYTEST_DEBUG_TEMPROOT wins, and xdist workers inherit the
+    controller's basetemp.
+    """
+    if os.path.isdir(RAM_DISK):
+        os.environ.setdefault("PYTEST_DEBUG_TEMPROOT", RAM_DISK)
+
+
+# ========== Isolation Fixtures ==========
+
+@pytest.fixture(autouse=True)
+def teardown_checks():
+    """Collect cleanup errors and restore httpx transports after every test
+
+    Fixtures append teardown exceptions here instead of raising, so one failed
+    cleanup cannot skip the others; they are reported together at the end.
+    """
+    errors: List[BaseException] = []
+    yield errors
+    # A router started without a matching stop() keeps httpx patched for
+    # every later test
+    leaked = [
+        router for mocker in respx_mocks.Mocker.registry.values() for router in mocker.routers
+        if router not in PERSISTENT_ROUTERS
+    ]
+    for router in leaked:
+        router.stop(quiet=True)
+    if leaked:
+        errors.append(AssertionError(f"{len(leaked)} respx router(s) left running"))
+    if errors:
+        raise AssertionError("Errors during teardown:\n" + "\n".join(f"  {e!r}" for e in errors))
+
+
+@pytest.fixture(autouse=True)
+def clear_server_caches(teardown_checks):
+    """Ensure cached OAuth tokens and API responses never leak between tests"""
+    from tab_mcp.server import _TOKEN_CACHE, _TOKEN_META, _RESPONSE_CACHE, _NEXT_TO_GO_CACHE
+
+    def _clear():
+        _TOKEN_CACHE.clear()
+        _TOKEN_META.clear()
+        asyncio.run(_RESPONSE_CACHE.clear())
+        asyncio.run(_NEXT_TO_GO_CACHE.clear())
+
+    _clear()
+    yield
+    try:
+        _clear()
+    except Exception as e:
+        teardown_checks.append(e)
+
 
 # ========== Configuration Fixtures ==========
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_config():
-    """Provide test configuration matching ConfigSchema"""
+    """Provide test configuration matching ConfigSchema (frozen; derive variants with model_copy)"""
     from tab_mcp.server import ConfigSchema
     return ConfigSchema(
         client_id=TEST_CLIENT_ID,
@@ -33,234 +116,46 @@ def test_config():
     )
 
 
-@pytest.fixture
-def mock_context(test_config):
-    """Provide mock MCP Context with test configuration"""
-    ctx = Mock(spec=Context)
-    ctx.session_config = test_config
-    return ctx
-
-
-# ========== OAuth Response Fixtures ==========
-
-@pytest.fixture
-def valid_oauth_response():
-    """Valid OAuth token response"""
-    return {
-        "access_token": "test_access_token_12345",
-        "refresh_token": "test_refresh_token_67890",
-        "token_type": "Bearer",
-        "expires_in": 3600,
-        "expires_at": int(time.time()) + 3540  # 59 minutes from now
-    }
-
-
-@pytest.fixture
-def expired_oauth_response():
-    """Expired OAuth token response"""
-    return {
-        "access_token": "expired_token",
-        "refresh_token": "expired_refresh",
-        "token_type": "Bearer",
-        "expires_in": 0,
-        "expires_at": int(time.time()) - 100  # Already expired
-    }
-
-
-@pytest.fixture
-def oauth_error_response():
-    """OAuth error response"""
-    return {
-        "error": "invalid_grant",
-        "error_description": "The provided credentials are invalid"
-    }
-
-
-# ========== Racing Data Fixtures ==========
-
-@pytest.fixture
-def sample_race_meeting():
-    """Sample race meeting data"""
-    return {
-        "meetings": [
-            {
-                "meetingDate": "2025-10-29",
-                "location": "Randwick",
-                "venueMnemonic": "RAN",
-                "meetingName": "Randwick",
-                "raceType": "R",
-                "meetingStatus": "OPEN",
-                "races": [
-                    {
-                        "raceNumber": 1,
-                        "raceName": "Race 1",
-                        "raceStartTime": "2025-10-29T12:00:00Z",
-                        "raceStatus": "OPEN"
-                    }
-                ]
-            }
-        ]
-    }
-
-
-@pytest.fixture
-def sample_race_details():
-    """Sample detailed race data"""
-    return {
-        "raceNumber": 1,
-        "raceName": "Maiden Handicap",
-        "raceDistance": 1200,
-        "raceStartTime": "2025-10-29T12:00:00Z",
-        "runners": [
-            {
-                "runnerNumber": "1",
-                "runnerName": "Fast Horse",
-                "barrier": 1,
-                "fixedOdds": {
-                    "returnWin": 3.50,
-                    "returnPlace": 1.80
-                }
-            },
-            {
-                "runnerNumber": "2",
-                "runnerName": "Quick Runner",
-                "barrier": 2,
-                "fixedOdds": {
-                    "returnWin": 5.00,
-                    "returnPlace": 2.10
-                }
-            }
-        ]
-    }
-
-
-@pytest.fixture
-def sample_next_to_go():
-    """Sample next-to-go races"""
-    return {
-        "races": [
-            {
-                "meetingDate": "2025-10-29",
-                "venueMnemonic": "RAN",
-                "raceType": "R",
-                "raceNumber": 1,
-                "raceStartTime": "2025-10-29T12:00:00Z",
-                "secondsToJump": 300
-            },
-            {
-                "meetingDate": "2025-10-29",
-                "venueMnemonic": "FLE",
-                "raceType": "R",
-                "raceNumber": 2,
-                "raceStartTime": "2025-10-29T12:30:00Z",
-                "secondsToJump": 1800
-            }
-        ]
-    }
-
-
-# ========== Sports Data Fixtures ==========
-
-@pytest.fixture
-def sample_sports_list():
-    """Sample sports list"""
-    return {
-        "sports": [
-            {
-                "sportName": "Basketball",
-                "competitions": [
-                    {"competitionName": "NBA"},
-                    {"competitionName": "NBL"}
-                ]
-            },
-            {
-                "sportName": "Rugby League",
-                "competitions": [
-                    {"competitionName": "NRL"}
-                ]
-            }
-        ]
-    }
-
-
-@pytest.fixture
-def sample_sport_competition():
-    """Sample sport competition with matches"""
-    return {
-        "competitionName": "NBA",
-        "matches": [
-            {
-                "matchName": "Lakers v Warriors",
-                "startTime": "2025-10-30T02:00:00Z",
-                "competitors": [
-                    {"name": "Lakers", "position": "HOME"},
-                    {"name": "Warriors", "position": "AWAY"}
-                ],
-                "markets": [
-                    {
-                        "marketName": "Head To Head",
-                        "propositions": [
-                            {"name": "Lakers", "returnWin": 1.85},
-                            {"name": "Warriors", "returnWin": 2.00}
-                        ]
-                    }
-                ]
-            }
-        ]
-    }
-
-
-# ========== Mock HTTP Fixtures ==========
-
-@pytest.fixture
-def respx_mock():
-    """Enable respx HTTP mocking"""
-    with respx.mock:
-        yield respx
-
-
-@pytest.fixture
-def mock_oauth_success(respx_mock, valid_oauth_response):
-    """Mock successful OAuth token request"""
-    route = respx_mock.post(f"{TEST_BASE_URL}/oauth/token")
-    route.return_value = Response(200, json=valid_oauth_response)
-    return route
-
-
-@pytest.fixture
-def mock_oauth_failure(respx_mock, oauth_error_response):
-    """Mock failed OAuth token request"""
-    route = respx_mock.post(f"{TEST_BASE_URL}/oauth/token")
-    route.return_value = Response(401, json=oauth_error_response)
-    return route
-
-
-@pytest.fixture
-def mock_racing_dates_success(respx_mock):
-    """Mock successful racing dates request"""
-    response_data = {
-        "dates": [
-            {"date": "2025-10-29", "meetingCount": 15},
-            {"date": "2025-10-30", "meetingCount": 12}
-        ]
-    }
-    route = respx_mock.get(f"{TEST_BASE_URL}/v1/tab-info-service/racing/dates")
-    route.return_value = Response(200, json=response_data)
-    return route
-
-
-@pytest.fixture
-def mock_api_error(respx_mock):
-    """Mock API error response"""
-    error_data = {
-        "error": {
-            "message": "Internal server error",
-            "code": "INTERNAL_ERROR"
-        }
-    }
-    route = respx_mock.get(f"{TEST_BASE_URL}/v1/tab-info-service/racing/dates")
-    route.return_value = Response(500, json=error_data)
-    return route
+@pytest.fixture(scope="session")
+def context_factory(test_config):
+    """Build stand-in MCP Contexts with test_config plus any overrides.
+
+    Tools only read ctx.session_config, so a plain namespace is enough.
+    """
+    def make_context(**overrides):
+        config = test_config.model_copy(update=overrides) if overrides else test_config
+        return SimpleNamespace(session_config=config)
+    return make_context
+
+
+@pytest.fixture(scope="session")
+def mock_context(context_factory):
+    """Provide a stand-in MCP Context with the unmodified test configuration.
+
+    Shared across the session; tests needing other settings use context_factory.
+    """
+    return context_factory()
+
+
+# ========== Server Fixtures ==========
+
+@pytest.fixture(scope="session")
+def server():
+    """Provide the MCP server (tool registration is session-independent)"""
+    from tab_mcp.server import create_server
+    return create_server()
+
+
+@pytest.fixture(scope="session")
+def tools(server):
+    """Map tool names to their underlying functions, resolved once per session"""
+    return {name: tool.fn for name, tool in server.tool_manager.tools.items()}
+
+
+@pytest.fixture(scope="session")
+def oauth_tool(tools):
+    """Provide the client credentials tool function"""
+    return tools["tab_oauth_client_credentials"]
 
 
 # ========== Helper Functions ==========
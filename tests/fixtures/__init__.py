@@ -0,0 +1,28 @@
+"""Fixture modules shared by the per-directory conftest files
+
+Each conftest star-imports only the modules its tests need, so running one
+subsystem's tests does not build the other subsystems' sample data.
+Pure-data fixtures are session-scoped and shared between tests: treat them
+as read-only (copy before modifying).
+"""
+import weakref
+
+from httpx import Response
+
+TEST_BASE_URL = "https://api.beta.tab.com.au"
+
+# Bodies are serialized once per session and served as raw content, so
+# mocked responses skip JSON encoding on every request.
+JSON_HEADERS = {"content-type": "application/json"}
+
+
+def json_response(status_code: int, content: bytes) -> Response:
+    """Build a JSON response from pre-encoded bytes"""
+    return Response(status_code, content=content, headers=JSON_HEADERS)
+
+
+# respx_mock is provided by the respx pytest plugin; configure it per test or
+# class with @pytest.mark.respx(base_url=..., assert_all_called=...). The unit
+# tests override it with a module-scoped router registered here, so the
+# leaked-router check in teardown_checks leaves it running between tests.
+PERSISTENT_ROUTERS: "weakref.WeakSet" = weakref.WeakSet()
@@ -0,0 +1,82 @@
+"""OAuth token responses and token endpoint mocks"""
+import time
+
+import orjson
+import pytest
+
+from fixtures import TEST_BASE_URL, json_response
+
+__all__ = [
+    "valid_oauth_response",
+    "expired_oauth_response",
+    "oauth_error_response",
+    "valid_oauth_bytes",
+    "oauth_error_bytes",
+    "mock_oauth_success",
+    "mock_oauth_failure",
+]
+
+OAUTH_TOKEN_URL = f"{TEST_BASE_URL}/oauth/token"
+
+
+@pytest.fixture(scope="session")
+def valid_oauth_response():
+    """Valid OAuth token response"""
+    return {
+        "access_token": "test_access_token_12345",
+        "refresh_token": "test_refresh_token_67890",
+        "token_type": "Bearer",
+        "expires_in": 3600,
+        "expires_at": int(time.time()) + 3540  # 59 minutes from now
+    }
+
+
+@pytest.fixture(scope="session")
+def expired_oauth_response():
+    """Expired OAuth token response"""
+    return {
+        "access_token": "expired_token",
+        "refresh_token": "expired_refresh_token_00000",
+        "token_type": "Bearer",
+        "expires_in": 0,
+        "expires_at": int(time.time()) - 100  # Already expired
+    }
+
+
+@pytest.fixture(scope="session")
+def oauth_error_response():
+    """OAuth error response"""
+    return {
+        "error": "invalid_grant",
+        "error_description": "The provided credentials are invalid"
+    }
+
+
+@pytest.fixture(scope="session")
+def valid_oauth_bytes(valid_oauth_response):
+    """Encoded valid OAuth token response"""
+    return orjson.dumps(valid_oauth_response)
+
+
+@pytest.fixture(scope="session")
+def oauth_error_bytes(oauth_error_response):
+    """Encoded OAuth error response"""
+    return orjson.dumps(oauth_error_response)
+
+
+@pytest.fixture
+def mock_oauth_success(respx_mock, valid_oauth_bytes):
+    """Mock successful OAuth token request"""
+    route = respx_mock.post(OAUTH_TOKEN_URL).mock(
+        return_value=json_response(200, valid_oauth_bytes)
+    )
+    return route
+
+
+@pytest.fixture
+def mock_oauth_failure(respx_mock, oauth_error_bytes):
+    """Mock failed OAuth token request"""
+    route = respx_mock.post(OAUTH_TOKEN_URL).mock(
+        return_value=json_response(401, oauth_error_bytes)
+    )
+    return route
@@ -0,0 +1,150 @@
+"""Racing sample data and racing endpoint mocks"""
+import orjson
+import pytest
+
+from fixtures import TEST_BASE_URL, json_response
+
+__all__ = [
+    "sample_race_meeting",
+    "sample_race_details",
+    "sample_next_to_go",
+    "sample_race_meeting_bytes",
+    "sample_race_details_bytes",
+    "sample_next_to_go_bytes",
+    "mock_racing_dates_success",
+    "mock_api_error",
+]
+
+
+RACING_DATES_URL = f"{TEST_BASE_URL}/v1/tab-info-service/racing/dates"
+
+RACING_DATES_BYTES = orjson.dumps({
+    "dates": [
+        {"date": "2025-10-29", "meetingCount": 15},
+        {"date": "2025-10-30", "meetingCount": 12}
+    ]
+})
+
+API_ERROR_BYTES = orjson.dumps({
+    "error": {
+        "message": "Internal server error",
+        "code": "INTERNAL_ERROR"
+    }
+})
+
+
+@pytest.fixture(scope="session")
+def sample_race_meeting():
+    """Sample race meeting data"""
+    return {
+        "meetings": [
+            {
+                "meetingDate": "2025-10-29",
+                "location": "Randwick",
+                "venueMnemonic": "RAN",
+                "meetingName": "Randwick",
+                "raceType": "R",
+                "meetingStatus": "OPEN",
+                "races": [
+                    {
+                        "raceNumber": 1,
+                        "raceName": "Race 1",
+                        "raceStartTime": "2025-10-29T12:00:00Z",
+                        "raceStatus": "OPEN"
+                    }
+                ]
+            }
+        ]
+    }
+
+
+@pytest.fixture(scope="session")
+def sample_race_details():
+    """Sample detailed race data"""
+    return {
+        "raceNumber": 1,
+        "raceName": "Maiden Handicap",
+        "raceDistance": 1200,
+        "raceStartTime": "2025-10-29T12:00:00Z",
+        "runners": [
+            {
+                "runnerNumber": "1",
+                "runnerName": "Fast Horse",
+                "barrier": 1,
+                "fixedOdds": {
+                    "returnWin": 3.50,
+                    "returnPlace": 1.80
+                }
+            },
+            {
+                "runnerNumber": "2",
+                "runnerName": "Quick Runner",
+                "barrier": 2,
+                "fixedOdds": {
+                    "returnWin": 5.00,
+                    "returnPlace": 2.10
+                }
+            }
+        ]
+    }
+
+
+@pytest.fixture(scope="session")
+def sample_next_to_go():
+    """Sample next-to-go races"""
+    return {
+        "races": [
+            {
+                "meetingDate": "2025-10-29",
+                "venueMnemonic": "RAN",
+                "raceType": "R",
+                "raceNumber": 1,
+                "raceStartTime": "2025-10-29T12:00:00Z",
+                "secondsToJump": 300
+            },
+            {
+                "meetingDate": "2025-10-29",
+                "venueMnemonic": "FLE",
+                "raceType": "R",
+                "raceNumber": 2,
+                "raceStartTime": "2025-10-29T12:30:00Z",
+                "secondsToJump": 1800
+            }
+        ]
+    }
+
+
+@pytest.fixture(scope="session")
+def sample_race_meeting_bytes(sample_race_meeting):
+    """Encoded sample race meeting data"""
+    return orjson.dumps(sample_race_meeting)
+
+
+@pytest.fixture(scope="session")
+def sample_race_details_bytes(sample_race_details):
+    """Encoded sample race details"""
+    return orjson.dumps(sample_race_details)
+
+
+@pytest.fixture(scope="session")
+def sample_next_to_go_bytes(sample_next_to_go):
+    """Encoded sample next-to-go races"""
+    return orjson.dumps(sample_next_to_go)
+
+
+@pytest.fixture
+def mock_racing_dates_success(respx_mock):
+    """Mock successful racing dates request"""
+    route = respx_mock.get(RACING_DATES_URL).mock(
+        return_value=json_response(200, RACING_DATES_BYTES)
+    )
+    return route
+
+
+@pytest.fixture
+def mock_api_error(respx_mock):
+    """Mock API error response"""
+    route = respx_mock.get(RACING_DATES_URL).mock(
+        return_value=json_response(500, API_ERROR_BYTES)
+    )
+    return route
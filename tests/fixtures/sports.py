@@ -0,0 +1,71 @@
+"""Sports sample data"""
+import orjson
+import pytest
+
+__all__ = [
+    "sample_sports_list",
+    "sample_sport_competition",
+    "sample_sports_list_bytes",
+    "sample_sport_competition_bytes",
+]
+
+
+@pytest.fixture(scope="session")
+def sample_sports_list():
+    """Sample sports list"""
+    return {
+        "sports": [
+            {
+                "sportName": "Basketball",
+                "competitions": [
+                    {"competitionName": "NBA"},
+                    {"competitionName": "NBL"}
+                ]
+            },
+            {
+                "sportName": "Rugby League",
+                "competitions": [
+                    {"competitionName": "NRL"}
+                ]
+            }
+        ]
+    }
+
+
+@pytest.fixture(scope="session")
+def sample_sport_competition():
+    """Sample sport competition with matches"""
+    return {
+        "competitionName": "NBA",
+        "matches": [
+            {
+                "matchName": "Lakers v Warriors",
+                "startTime": "2025-10-30T02:00:00Z",
+                "competitors": [
+                    {"name": "Lakers", "position": "HOME"},
+                    {"name": "Warriors", "position": "AWAY"}
+                ],
+                "markets": [
+                    {
+                        "marketName": "Head To Head",
+                        "propositions": [
+                            {"name": "Lakers", "returnWin": 1.85},
+                            {"name": "Warriors", "returnWin": 2.00}
+                        ]
+                    }
+                ]
+            }
+        ]
+    }
+
+
+@pytest.fixture(scope="session")
+def sample_sports_list_bytes(sample_sports_list):
+    """Encoded sample sports list"""
+    return orjson.dumps(sample_sports_list)
+
+
+@pytest.fixture(scope="session")
+def sample_sport_competition_bytes(sample_sport_competition):
+    """Encoded sample sport competition"""
+    return orjson.dumps(sample_sport_competition)
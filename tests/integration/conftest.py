@@ -0,0 +1,173 @@
+"""Shared fixtures for the real-API integration tests
+
+Configuration, context and the client credentials token are session-scoped
+so every integration module authenticates once per run.
+"""
+import asyncio
+import contextlib
+import hashlib
+import os
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import orjson
+import pytest
+
+CASSETTE_DIR = Path(__file__).parent / "cassettes"
+LAST_PASS_KEY = "tab_api/last_pass/"
+CREDENTIAL_VARS = ("TAB_CLIENT_ID", "TAB_CLIENT_SECRET", "TAB_USERNAME", "TAB_PASSWORD")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Remember when each integration test last passed against the real API"""
+    outcome = yield
+    report = outcome.get_result()
+    cache = getattr(item.config, "cache", None)
+    if report.when == "call" and report.passed and cache is not None and item.get_closest_marker("integration"):
+        cache.set(LAST_PASS_KEY + item.nodeid, time.time())
+
+
+def pytest_collection_modifyitems(config, items):
+    """With --only-stale, skip integration tests that passed recently"""
+    window = config.getoption("--only-stale", default=None)
+    cache = getattr(config, "cache", None)
+    if window is None or cache is None:
+        return
+    cutoff = time.time() - window
+    for item in items:
+        if not item.get_closest_marker("integration"):
+            continue
+        last_pass = cache.get(LAST_PASS_KEY + item.nodeid, None)
+        if last_pass is not None and last_pass > cutoff:
+            item.add_marker(pytest.mark.skip(reason="passed recently (--only-stale)"))
+
+_SECRET_FIELDS = ("access_token", "refresh_token")
+
+
+def _scrub(value: str) -> str:
+    """Stable placeholder for a secret so distinct tokens stay distinct on replay"""
+    return "scrubbed-" + hashlib.sha256(value.encode()).hexdigest()[:16]
+
+
+def _scrub_tokens(response):
+    """Replace OAuth tokens in recorded JSON bodies before they reach disk"""
+    body = response["body"].get("string")
+    if not body or b"_token" not in body:
+        return response
+    try:
+        data = orjson.loads(body)
+    except orjson.JSONDecodeError:
+        return response
+    if isinstance(data, dict):
+        for field in _SECRET_FIELDS:
+            if isinstance(data.get(field), str):
+                data[field] = _scrub(data[field])
+        response["body"]["string"] = orjson.dumps(data)
+    return response
+
+
+@pytest.fixture(scope="session")
+def vcr_config():
+    """Cassette settings shared by every test in this module"""
+    return {
+        "filter_headers": ["authorization"],
+        "filter_post_data_parameters": [
+            "client_id", "client_secret", "username", "password", "refresh_token"
+        ],
+        "before_record_response": _scrub_tokens,
+        # OAuth request bodies carry credentials and per-run tokens, so match
+        # on the request line only
+        "match_on": ["method", "scheme", "host", "port", "path", "query"],
+        "decode_compressed_response": True,
+    }
+
+
+@pytest.fixture(scope="session")
+def vcr_cassette_dir():
+    """Keep cassettes beside the integration tests rather than per-module folders"""
+    return str(CASSETTE_DIR)
+
+
+def _record_mode_given(config) -> bool:
+    """Whether --record-mode was passed explicitly rather than left at its default"""
+    return any(
+        arg == "--record-mode" or arg.startswith("--record-mode=")
+        for arg in config.invocation_params.args
+    )
+
+
+@pytest.fixture(scope="session")
+def record_mode(request):
+    """Record missing cassettes on credentialed runs instead of failing.
+
+    Only pytest-recording's implicit "none" default is upgraded to "once", and
+    only when real credentials are set; without them a missing cassette must
+    fail rather than hit the live API with placeholder credentials. An explicit
+    --record-mode, including "none", is always respected.
+    """
+    mode = request.config.getoption("--record-mode", default="none")
+    if mode == "none" and all(map(os.getenv, CREDENTIAL_VARS)) and not _record_mode_given(request.config):
+        return "once"
+    return mode
+
+
+def _fixture_cassette(vcr_config, name, record_mode):
+    """Cassette for session fixtures, which the per-test vcr marker does not cover"""
+    try:
+        import vcr
+    except ImportError:
+        return contextlib.nullcontext()
+    recorder = vcr.VCR(cassette_library_dir=str(CASSETTE_DIR), record_mode=record_mode, **vcr_config)
+    return recorder.use_cassette(f"{name}.yaml")
+
+
+@pytest.fixture(scope="session")
+def real_config():
+    """Create real configuration from environment"""
+    from tab_mcp.server import ConfigSchema
+
+    return ConfigSchema(
+        # Placeholders let cassettes replay without credentials; they never
+        # reach disk because request bodies are filtered
+        client_id=os.getenv("TAB_CLIENT_ID", "replay"),
+        client_secret=os.getenv("TAB_CLIENT_SECRET", "replay"),
+        username=os.getenv("TAB_USERNAME", "replay"),
+        password=os.getenv("TAB_PASSWORD", "replay"),
+        jurisdiction="NSW",
+        base_url="https://api.beta.tab.com.au"
+    )
+
+
+@pytest.fixture(scope="session")
+def real_context(real_config):
+    """Create context with real configuration"""
+    return SimpleNamespace(session_config=real_config)
+
+
+@pytest.fixture(scope="session")
+def _token_holder():
+    """Session-wide slot for the client credentials token response"""
+    return {}
+
+
+@pytest.fixture
+def access_token(_token_holder, real_context, tools, vcr_config, record_mode):
+    """Shared client credentials access token, re-obtained only once it nears expiry"""
+    from tab_mcp.server import TOKEN_CACHE_MARGIN
+
+    token = _token_holder.get("token")
+    if token is not None and token["expires_at"] - TOKEN_CACHE_MARGIN > time.time():
+        return token["access_token"]
+
+    # Try client_credentials first (public data access)
+    try:
+        with _fixture_cassette(vcr_config, "access_token", record_mode):
+            token = asyncio.run(tools["tab_oauth_client_credentials"](
+                real_context
+            ))
+    except Exception as e:
+        pytest.skip(f"Could not obtain access token: {e}")
+    _token_holder["token"] = token
+    return token["access_token"]
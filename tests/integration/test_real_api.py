@@ -2,15 +2,21 @@
 
 These tests make actual API calls and require valid credentials.
 Skip with: pytest -m "not integration"
+
+Responses are recorded to tests/integration/cassettes with pytest-recording
+(vcrpy) on the first credentialed run and replayed afterwards, so the suite
+can run offline once cassettes exist. Re-record with --record-mode=rewrite.
+Cassettes are git-ignored; review a recording before force-adding it.
 """
 import os
 import pytest
 import time
-from datetime import datetime, timedelta
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
 
-from tab_mcp.server import create_server, ConfigSchema
-from unittest.mock import Mock
-from mcp.server.fastmcp import Context
+CASSETTE_DIR = Path(__file__).parent / "cassettes"
 
 # Check if credentials are available
 HAS_CREDENTIALS = all([
@@ -19,47 +25,15 @@ HAS_CREDENTIALS = all([
     os.getenv("TAB_USERNAME"),
     os.getenv("TAB_PASSWORD")
 ])
+HAS_CASSETTES = CASSETTE_DIR.is_dir() and any(CASSETTE_DIR.rglob("*.yaml"))
 
-pytestmark = pytest.mark.skipif(
-    not HAS_CREDENTIALS,
-    reason="Real API credentials not available in environment"
-)
-
-
-@pytest.fixture(scope="module")
-def real_config():
-    """Create real configuration from environment"""
-    return ConfigSchema(
-        client_id=os.getenv("TAB_CLIENT_ID"),
-        client_secret=os.getenv("TAB_CLIENT_SECRET"),
-        username=os.getenv("TAB_USERNAME"),
-        password=os.getenv("TAB_PASSWORD"),
-        jurisdiction="NSW",
-        base_url="https://api.beta.tab.com.au"
-    )
-
-
-@pytest.fixture(scope="module")
-def real_context(real_config):
-    """Create context with real configuration"""
-    ctx = Mock(spec=Context)
-    ctx.session_config = real_config
-    return ctx
-
-
-@pytest.fixture(scope="module")
-def access_token(real_context):
-    """Obtain real access token for module-scoped tests"""
-    server = create_server()
-    
-    # Try client_credentials first (public data access)
-    try:
-        result = server.tool_manager.tools["tab_oauth_client_credentials"].fn(
-            real_context
-        )
-        return result["access_token"]
-    except Exception as e:
-        pytest.skip(f"Could not obtain access token: {e}")
+pytestmark = [
+    pytest.mark.skipif(
+        not (HAS_CREDENTIALS or HAS_CASSETTES),
+        reason="Real API credentials not available in environment"
+    ),
+    pytest.mark.vcr,
+]
 
 
 @pytest.mark.integration
@@ -68,10 +42,9 @@ def access_token(real_context):
 class TestRealOAuthFlows:
     """Test real OAuth authentication flows"""
 
-    def test_client_credentials_grant(self, real_context):
+    async def test_client_credentials_grant(self, real_context, tools):
         """Test real client credentials authentication"""
-        server = create_server()
-        result = server.tool_manager.tools["tab_oauth_client_credentials"].fn(
+        result = await tools["tab_oauth_client_credentials"](
             real_context
         )
 
@@ -84,12 +57,11 @@ class TestRealOAuthFlows:
         assert "expires_at" in result
         assert result["expires_at"] > time.time()
 
-    def test_password_grant(self, real_context):
+    async def test_password_grant(self, real_context, tools):
         """Test real password grant authentication"""
-        server = create_server()
         
         try:
-            result = server.tool_manager.tools["tab_oauth_password_grant"].fn(
+            result = await tools["tab_oauth_password_grant"](
                 real_context
             )
 
@@ -100,25 +72,29 @@ class TestRealOAuthFlows:
             assert result["token_type"] == "Bearer"
             assert "expires_in" in result
             
-            # Store refresh token for next test
-            real_context.session_config.refresh_token = result["refresh_token"]
+            # The issued refresh token works from session config; real_context
+            # is session-scoped, so use a local copy rather than mutating it
+            refreshed_context = SimpleNamespace(session_config=real_context.session_config.model_copy(
+                update={"refresh_token": result["refresh_token"]}
+            ))
+            refreshed = await tools["tab_oauth_refresh"](refreshed_context)
+            assert "access_token" in refreshed
             
         except Exception as e:
             # Password grant might not be enabled for all accounts
             pytest.skip(f"Password grant not available: {e}")
 
-    def test_refresh_token(self, real_context):
+    async def test_refresh_token(self, real_context, tools):
         """Test real token refresh"""
         # First get a token with refresh_token
-        server = create_server()
         
         try:
-            initial = server.tool_manager.tools["tab_oauth_password_grant"].fn(
+            initial = await tools["tab_oauth_password_grant"](
                 real_context
             )
             
             # Now refresh it
-            result = server.tool_manager.tools["tab_oauth_refresh"].fn(
+            result = await tools["tab_oauth_refresh"](
                 real_context,
                 refresh_token=initial["refresh_token"]
             )
@@ -138,10 +114,9 @@ class TestRealOAuthFlows:
 class TestRealRacingEndpoints:
     """Test real Racing API endpoints"""
 
-    def test_get_all_meeting_dates(self, real_context, access_token):
+    async def test_get_all_meeting_dates(self, real_context, access_token, tools):
         """Test real meeting dates retrieval"""
-        server = create_server()
-        result = server.tool_manager.tools["racing_get_all_meeting_dates"].fn(
+        result = await tools["racing_get_all_meeting_dates"](
             real_context,
             access_token=access_token
         )
@@ -150,13 +125,12 @@ class TestRealRacingEndpoints:
         assert "dates" in result or "error" not in result
         # Note: dates list might be empty on certain days
 
-    def test_get_meetings_for_today(self, real_context, access_token):
+    async def test_get_meetings_for_today(self, real_context, access_token, tools):
         """Test real meetings retrieval for today"""
-        server = create_server()
         today = datetime.now().strftime("%Y-%m-%d")
         
         try:
-            result = server.tool_manager.tools["racing_get_meetings"].fn(
+            result = await tools["racing_get_meetings"](
                 real_context,
                 access_token=access_token,
                 meeting_date=today
@@ -169,10 +143,9 @@ class TestRealRacingEndpoints:
             # Might fail if no meetings today
             pytest.skip(f"No meetings for today: {e}")
 
-    def test_get_next_to_go_races(self, real_context, access_token):
+    async def test_get_next_to_go_races(self, real_context, access_token, tools):
         """Test real next-to-go races"""
-        server = create_server()
-        result = server.tool_manager.tools["racing_get_next_to_go"].fn(
+        result = await tools["racing_get_next_to_go"](
             real_context,
             access_token=access_token,
             max_races=5
@@ -189,10 +162,9 @@ class TestRealRacingEndpoints:
 class TestRealSportsEndpoints:
     """Test real Sports API endpoints"""
 
-    def test_get_all_open_sports(self, real_context, access_token):
+    async def test_get_all_open_sports(self, real_context, access_token, tools):
         """Test real sports list retrieval"""
-        server = create_server()
-        result = server.tool_manager.tools["sports_get_all_open"].fn(
+        result = await tools["sports_get_all_open"](
             real_context,
             access_token=access_token
         )
@@ -201,13 +173,12 @@ class TestRealSportsEndpoints:
         assert isinstance(result, dict)
         # sports list should generally have content
 
-    def test_get_specific_sport(self, real_context, access_token):
+    async def test_get_specific_sport(self, real_context, access_token, tools):
         """Test real specific sport retrieval"""
-        server = create_server()
         
         # Basketball is commonly available
         try:
-            result = server.tool_manager.tools["sports_get_open_sport"].fn(
+            result = await tools["sports_get_open_sport"](
                 real_context,
                 access_token=access_token,
                 sport_name="Basketball"
@@ -219,10 +190,9 @@ class TestRealSportsEndpoints:
             # Sport might not be available at this time
             pytest.skip(f"Basketball not available: {e}")
 
-    def test_get_sports_next_to_go(self, real_context, access_token):
+    async def test_get_sports_next_to_go(self, real_context, access_token, tools):
         """Test real sports next-to-go"""
-        server = create_server()
-        result = server.tool_manager.tools["sports_get_next_to_go"].fn(
+        result = await tools["sports_get_next_to_go"](
             real_context,
             access_token=access_token,
             limit=10
@@ -237,18 +207,16 @@ class TestRealSportsEndpoints:
 class TestAPIHealthCheck:
     """Smoke tests to verify API is accessible"""
 
-    def test_api_authentication_works(self, real_context):
+    async def test_api_authentication_works(self, real_context, tools):
         """Quick smoke test that authentication works"""
-        server = create_server()
-        result = server.tool_manager.tools["tab_oauth_client_credentials"].fn(
+        result = await tools["tab_oauth_client_credentials"](
             real_context
         )
         assert "access_token" in result
 
-    def test_api_endpoint_accessible(self, real_context, access_token):
+    async def test_api_endpoint_accessible(self, real_context, access_token, tools):
         """Quick smoke test that API endpoints are accessible"""
-        server = create_server()
-        result = server.tool_manager.tools["racing_get_all_meeting_dates"].fn(
+        result = await tools["racing_get_all_meeting_dates"](
             real_context,
             access_token=access_token
         )
@@ -0,0 +1,4 @@
+"""Fixtures for the performance tests, which exercise every subsystem"""
+from fixtures.oauth import *  # noqa: F401,F403
+from fixtures.racing import *  # noqa: F401,F403
+from fixtures.sports import *  # noqa: F401,F403
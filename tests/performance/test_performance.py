@@ -3,72 +3,148 @@
 These tests measure response times and system behavior under load.
 Run with: pytest tests/performance -v -m performance
 """
+import asyncio
 import pytest
 import time
 import statistics
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import respx
+
+import orjson
 from httpx import Response
 
-from tab_mcp.server import create_server
+from tab_mcp.server import RETRY_ATTEMPTS, _RESPONSE_CACHE, _TOKEN_CACHE, aclose_clients
+
+from fixtures import JSON_HEADERS, json_response
+
+
+# Large payloads are serialized once at import so JSON encoding stays out of
+# the measured path; respx hands these bytes back unchanged on every call.
+RACING_DATES_BYTES = orjson.dumps({
+    "dates": [
+        {"date": "2025-10-29", "meetingCount": 15}
+        for _ in range(30)  # 30 days of data
+    ]
+})
+
+ERROR_BYTES = orjson.dumps({
+    "error": {
+        "message": "Internal server error",
+        "code": "INTERNAL_ERROR"
+    }
+})
+
+LARGE_RACE_BYTES = orjson.dumps({
+    "raceNumber": 1,
+    "raceName": "Large Field Race",
+    "runners": [
+        {
+            "runnerNumber": str(i),
+            "runnerName": f"Runner {i}",
+            "barrier": i,
+            "fixedOdds": {"returnWin": 5.00 + i * 0.1}
+        }
+        for i in range(1, 51)  # 50 runners
+    ]
+})
+
+RACING_DATES_RESPONSE = json_response(200, RACING_DATES_BYTES)
+LARGE_RACE_RESPONSE = json_response(200, LARGE_RACE_BYTES)
+ERROR_RESPONSE = Response(500, content=ERROR_BYTES, headers={**JSON_HEADERS, "retry-after": "0"})
+
+RACE_PATH = "/v1/tab-info-service/racing/dates/2025-10-29/meetings/R/RAN/races/1"
+
+# Every test mocks the beta API; routes below are relative to it
+pytestmark = pytest.mark.respx(base_url="https://api.beta.tab.com.au", assert_all_called=False)
+
+BENCHMARK_ROUNDS = 20
+BENCHMARK_WARMUP_ROUNDS = 10
+
+
+@pytest.fixture
+def run_async():
+    """Run coroutines on one event loop shared by every benchmark round.
+
+    A fresh asyncio.run() per round would time loop setup and, since pooled
+    clients are per loop, a new AsyncClient each round.
+    """
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.run_until_complete(aclose_clients())
+    loop.close()
+
+
+class CacheReset:
+    """benchmark.pedantic() setup that empties the token and response caches before each round.
+
+    Every measured call is then a cache miss that reaches the mocked API;
+    rounds counts the calls set up, for comparing with a route's call_count.
+    """
+
+    def __init__(self, run_async):
+        self.run_async = run_async
+        self.rounds = 0
+
+    def __call__(self):
+        self.rounds += 1
+        _TOKEN_CACHE.clear()
+        self.run_async(_RESPONSE_CACHE.clear())
+
+
+def run_benchmark(benchmark, run_async, call):
+    """Benchmark call() on one loop with cold caches; returns its result and the CacheReset used"""
+    reset = CacheReset(run_async)
+    result = benchmark.pedantic(call, setup=reset, rounds=BENCHMARK_ROUNDS, warmup_rounds=BENCHMARK_WARMUP_ROUNDS)
+    return result, reset
 
 
 @pytest.mark.performance
 class TestOAuthPerformance:
     """Test OAuth authentication performance"""
 
-    def test_oauth_response_time(self, mock_context, respx_mock, valid_oauth_response, benchmark):
-        """Benchmark OAuth token request time"""
-        route = respx_mock.post("https://api.beta.tab.com.au/oauth/token")
-        route.return_value = Response(200, json=valid_oauth_response)
+    @pytest.mark.benchmark(group="oauth", disable_gc=True)
+    def test_oauth_response_time(self, mock_context, respx_mock, valid_oauth_bytes, benchmark, oauth_tool,
+                                 run_async):
+        """Benchmark an uncached OAuth token request"""
+        route = respx_mock.post("/oauth/token").mock(return_value=json_response(200, valid_oauth_bytes))
 
-        server = create_server()
-        
         def oauth_call():
-            return server.tool_manager.tools["tab_oauth_client_credentials"].fn(
+            return run_async(oauth_tool(
                 mock_context,
                 client_id="test",
                 client_secret="test"
-            )
+            ))
 
-        # Benchmark the call
-        result = benchmark(oauth_call)
+        result, reset = run_benchmark(benchmark, run_async, oauth_call)
         assert "access_token" in result
+        assert route.call_count == reset.rounds
 
-    def test_oauth_concurrent_requests(self, mock_context, respx_mock, valid_oauth_response):
+    @pytest.mark.xdist_group("oauth_perf")
+    async def test_oauth_concurrent_requests(self, mock_context, respx_mock, valid_oauth_bytes, tools):
         """Test OAuth under concurrent load"""
-        route = respx_mock.post("https://api.beta.tab.com.au/oauth/token")
-        route.return_value = Response(200, json=valid_oauth_response)
+        respx_mock.post("/oauth/token").mock(return_value=json_response(200, valid_oauth_bytes))
+        loop = asyncio.get_running_loop()
 
-        server = create_server()
-        
-        def oauth_call():
-            return server.tool_manager.tools["tab_oauth_client_credentials"].fn(
+        async def oauth_call():
+            t0 = loop.time()
+            result = await tools["tab_oauth_client_credentials"](
                 mock_context,
                 client_id="test",
                 client_secret="test"
             )
+            return result, loop.time() - t0
 
         # Simulate 10 concurrent requests
         num_requests = 10
-        response_times = []
-        
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = [executor.submit(oauth_call) for _ in range(num_requests)]
-            
-            for future in as_completed(futures):
-                start = time.time()
-                result = future.result()
-                response_times.append(time.time() - start)
-                assert "access_token" in result
+        results = await asyncio.gather(*[oauth_call() for _ in range(num_requests)])
+        response_times = [elapsed for _, elapsed in results]
 
         # Verify all requests completed
         assert len(response_times) == num_requests
-        
+        assert all("access_token" in result for result, _ in results)
+
         # Calculate statistics
         avg_time = statistics.mean(response_times)
         max_time = max(response_times)
-        
+
         print(f"\nConcurrent OAuth Performance:")
         print(f"  Average response time: {avg_time:.3f}s")
         print(f"  Max response time: {max_time:.3f}s")
@@ -79,146 +155,106 @@ class TestOAuthPerformance:
 class TestRacingPerformance:
     """Test Racing API performance"""
 
-    def test_racing_dates_response_time(self, mock_context, respx_mock, benchmark):
-        """Benchmark racing dates request time"""
-        response_data = {
-            "dates": [
-                {"date": "2025-10-29", "meetingCount": 15}
-                for _ in range(30)  # 30 days of data
-            ]
-        }
-        
-        route = respx_mock.get("https://api.beta.tab.com.au/v1/tab-info-service/racing/dates")
-        route.return_value = Response(200, json=response_data)
+    @pytest.mark.benchmark(group="racing", disable_gc=True)
+    def test_racing_dates_response_time(self, mock_context, respx_mock, benchmark, tools, run_async):
+        """Benchmark an uncached racing dates request"""
+        route = respx_mock.get("/v1/tab-info-service/racing/dates").mock(return_value=RACING_DATES_RESPONSE)
+        racing_tool = tools["racing_get_all_meeting_dates"]
 
-        server = create_server()
-        
         def racing_call():
-            return server.tool_manager.tools["racing_get_all_meeting_dates"].fn(
+            return run_async(racing_tool(
                 mock_context,
                 access_token="test_token"
-            )
+            ))
 
-        result = benchmark(racing_call)
+        result, reset = run_benchmark(benchmark, run_async, racing_call)
         assert "dates" in result
+        assert route.call_count == reset.rounds
 
-    def test_multiple_race_queries(self, mock_context, respx_mock, sample_race_details):
-        """Test performance of multiple race queries"""
-        route = respx_mock.get(
-            "https://api.beta.tab.com.au/v1/tab-info-service/racing/dates/2025-10-29/meetings/R/RAN/races/1"
+    @pytest.fixture
+    def race_route(self, respx_mock, sample_race_details_bytes):
+        """Mock the single race endpoint queried by the parametrized tests"""
+        return respx_mock.get(RACE_PATH).mock(
+            return_value=json_response(200, sample_race_details_bytes)
         )
-        route.return_value = Response(200, json=sample_race_details)
 
-        server = create_server()
-        
-        num_queries = 20
-        start_time = time.time()
-        
-        for _ in range(num_queries):
-            result = server.tool_manager.tools["racing_get_race"].fn(
-                mock_context,
-                access_token="test_token",
-                meeting_date="2025-10-29",
-                race_type="R",
-                venue_mnemonic="RAN",
-                race_number=1
-            )
-            assert "runners" in result
+    @pytest.mark.parametrize("iteration", range(20))
+    async def test_multiple_race_queries(self, mock_context, race_route, tools, iteration):
+        """Test performance of repeated race queries"""
+        start_time = time.perf_counter()
+        result = await tools["racing_get_race"](
+            mock_context,
+            access_token="test_token",
+            meeting_date="2025-10-29",
+            race_type="R",
+            venue_mnemonic="RAN",
+            race_number=1
+        )
+        elapsed = time.perf_counter() - start_time
 
-        total_time = time.time() - start_time
-        avg_time = total_time / num_queries
-        
-        print(f"\nMultiple Race Queries Performance:")
-        print(f"  Total time: {total_time:.3f}s")
-        print(f"  Average per query: {avg_time:.3f}s")
-        print(f"  Queries per second: {num_queries/total_time:.2f}")
-        
-        # Should handle at least 10 queries per second
-        assert num_queries / total_time >= 10
+        assert "runners" in result
+        # Should sustain at least 10 queries per second
+        assert elapsed < 0.1
 
 
 @pytest.mark.performance
 class TestSportsPerformance:
     """Test Sports API performance"""
 
-    def test_sports_list_response_time(self, mock_context, respx_mock, sample_sports_list, benchmark):
-        """Benchmark sports list request time"""
-        route = respx_mock.get("https://api.beta.tab.com.au/v1/tab-info-service/sports")
-        route.return_value = Response(200, json=sample_sports_list)
+    @pytest.mark.benchmark(group="sports", disable_gc=True)
+    def test_sports_list_response_time(self, mock_context, respx_mock, sample_sports_list_bytes, benchmark, tools,
+                                       run_async):
+        """Benchmark an uncached sports list request"""
+        route = respx_mock.get("/v1/tab-info-service/sports").mock(
+            return_value=json_response(200, sample_sports_list_bytes)
+        )
+        sports_tool = tools["sports_get_all_open"]
 
-        server = create_server()
-        
         def sports_call():
-            return server.tool_manager.tools["sports_get_all_open"].fn(
+            return run_async(sports_tool(
                 mock_context,
                 access_token="test_token"
-            )
+            ))
 
-        result = benchmark(sports_call)
+        result, reset = run_benchmark(benchmark, run_async, sports_call)
         assert "sports" in result
+        assert route.call_count == reset.rounds
 
 
 @pytest.mark.performance
 class TestErrorHandlingPerformance:
     """Test error handling performance"""
 
-    def test_error_response_time(self, mock_context, respx_mock, benchmark):
-        """Benchmark error handling response time"""
-        error_data = {
-            "error": {
-                "message": "Internal server error",
-                "code": "INTERNAL_ERROR"
-            }
-        }
-        
-        route = respx_mock.get("https://api.beta.tab.com.au/v1/tab-info-service/racing/dates")
-        route.return_value = Response(500, json=error_data)
+    @pytest.mark.benchmark(group="errors", disable_gc=True)
+    def test_error_response_time(self, mock_context, respx_mock, benchmark, tools, run_async):
+        """Benchmark error handling response time, including the transport's retry of the 500"""
+        route = respx_mock.get("/v1/tab-info-service/racing/dates").mock(return_value=ERROR_RESPONSE)
+        racing_tool = tools["racing_get_all_meeting_dates"]
 
-        server = create_server()
-        
         def error_call():
             try:
-                server.tool_manager.tools["racing_get_all_meeting_dates"].fn(
+                run_async(racing_tool(
                     mock_context,
                     access_token="test_token"
-                )
+                ))
             except Exception:
                 pass  # Expected to fail
 
         # Error handling should be fast
-        benchmark(error_call)
+        _, reset = run_benchmark(benchmark, run_async, error_call)
+        assert route.call_count == (1 + RETRY_ATTEMPTS) * reset.rounds
 
 
 @pytest.mark.performance
 class TestMemoryUsage:
     """Test memory usage and efficiency"""
 
-    def test_large_response_handling(self, mock_context, respx_mock):
+    async def test_large_response_handling(self, mock_context, respx_mock, tools):
         """Test handling of large API responses"""
-        # Create large response with many runners
-        large_response = {
-            "raceNumber": 1,
-            "raceName": "Large Field Race",
-            "runners": [
-                {
-                    "runnerNumber": str(i),
-                    "runnerName": f"Runner {i}",
-                    "barrier": i,
-                    "fixedOdds": {"returnWin": 5.00 + i * 0.1}
-                }
-                for i in range(1, 51)  # 50 runners
-            ]
-        }
-        
-        route = respx_mock.get(
-            "https://api.beta.tab.com.au/v1/tab-info-service/racing/dates/2025-10-29/meetings/R/RAN/races/1"
-        )
-        route.return_value = Response(200, json=large_response)
+        respx_mock.get(RACE_PATH).mock(return_value=LARGE_RACE_RESPONSE)
 
-        server = create_server()
-        
         start_time = time.time()
-        result = server.tool_manager.tools["racing_get_race"].fn(
+        result = await tools["racing_get_race"](
             mock_context,
             access_token="test_token",
             meeting_date="2025-10-29",
@@ -0,0 +1,41 @@
+"""Fixtures for the unit tests (OAuth payloads are used across subsystems)"""
+import httpx
+import pytest
+import pytest_asyncio
+import respx
+
+from fixtures import PERSISTENT_ROUTERS
+from fixtures.oauth import *  # noqa: F401,F403
+
+
+@pytest.fixture(scope="module")
+def _module_respx_router():
+    """Patch httpx once per module instead of once per test"""
+    with respx.mock(assert_all_called=False) as router:
+        PERSISTENT_ROUTERS.add(router)
+        yield router
+        PERSISTENT_ROUTERS.discard(router)
+
+
+@pytest.fixture
+def respx_mock(_module_respx_router):
+    """Module router with routes and call history rolled back after each test
+
+    Overrides the respx plugin fixture; starting and stopping the transport
+    patch was most of the per-test mocking cost.
+    """
+    _module_respx_router.snapshot()
+    yield _module_respx_router
+    _module_respx_router.rollback()
+    _module_respx_router.reset()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def http_client():
+    """One AsyncClient for tests that exercise raw HTTP against respx routes
+
+    Tests using it must run on the session loop:
+    @pytest.mark.asyncio(loop_scope="session").
+    """
+    async with httpx.AsyncClient() as client:
+        yield client
@@ -0,0 +1,347 @@
+"""Unit tests for generic API tools"""
+import asyncio
+import base64
+import json
+import time
+
+import httpx
+import pytest
+from httpx import Response
+
+from tab_mcp.server import (
+    create_server,
+    TabcorpAPIError,
+    TAB_BASE_URL
+)
+
+OAUTH_TOKEN_URL = f"{TAB_BASE_URL}/oauth/token"
+A_URL = f"{TAB_BASE_URL}/v1/a"
+BETS_URL = f"{TAB_BASE_URL}/v1/bets"
+
+# Shared canned responses; respx clones a Response before serving it, so
+# reusing these across tests and calls is safe
+OK_RESPONSE = Response(200, json={"ok": True})
+RETRY_NOW_RESPONSE = Response(503, headers={"retry-after": "0"})
+TOKEN_EXPIRED_RESPONSE = Response(401, json={"error": {"message": "Token expired"}})
+STALE_TOKEN_RESPONSE = Response(200, json={"access_token": "stale", "refresh_token": "r" * 20, "expires_in": 3600})
+FRESH_TOKEN_RESPONSE = Response(200, json={"access_token": "fresh", "expires_in": 3600})
+
+pytestmark = pytest.mark.xdist_group("generic")
+
+
+@pytest.mark.unit
+class TestTabGetMany:
+    """Test tab_get_many tool"""
+
+    async def test_get_many_preserves_order(self, tools, mock_context, respx_mock):
+        """Test responses are returned in request order"""
+        respx_mock.get(A_URL).return_value = Response(200, json={"name": "a"})
+        respx_mock.get(f"{TAB_BASE_URL}/v1/b").return_value = Response(200, json={"name": "b"})
+
+        result = await tools["tab_get_many"](
+            mock_context,
+            requests=["/v1/b", "v1/a"],
+            access_token="test_token"
+        )
+
+        assert result == [{"name": "b"}, {"name": "a"}]
+
+    async def test_get_many_maps_failures(self, tools, mock_context, respx_mock):
+        """Test a failing request does not fail the whole batch"""
+        respx_mock.get(f"{TAB_BASE_URL}/v1/ok").return_value = OK_RESPONSE
+        respx_mock.get(f"{TAB_BASE_URL}/v1/missing").return_value = Response(
+            404, json={"error": {"message": "Not found"}}
+        )
+
+        result = await tools["tab_get_many"](
+            mock_context,
+            requests=["/v1/ok", "/v1/missing"],
+            access_token="test_token"
+        )
+
+        assert result[0] == {"ok": True}
+        assert "Not found" in result[1]["error"]
+
+    async def test_get_many_per_request_params(self, tools, mock_context, respx_mock):
+        """Test per-request params are merged over the shared params"""
+        route = respx_mock.get(A_URL)
+        route.return_value = Response(200, json={})
+
+        await tools["tab_get_many"](
+            mock_context,
+            requests=[{"path": "/v1/a", "params": {"limit": 5}}],
+            access_token="test_token",
+            jurisdiction="VIC"
+        )
+
+        params = route.calls[0].request.url.params
+        assert params["jurisdiction"] == "VIC"
+        assert params["limit"] == "5"
+
+    @pytest.mark.parametrize("bad_item, message", [
+        ({"params": {"limit": 5}}, r"index 1: Field required \(path\)"),
+        ({"path": "/v1/b", "parms": {}}, r"index 1: Extra inputs are not permitted \(parms\)"),
+        (42, r"index 1: Input should be"),
+    ], ids=["missing_path", "unknown_key", "not_an_object"])
+    async def test_get_many_rejects_malformed_item(self, tools, mock_context, respx_mock, bad_item, message):
+        """Test a malformed batch entry raises ValueError naming its index before any request"""
+        route = respx_mock.get(A_URL)
+
+        with pytest.raises(ValueError, match=message):
+            await tools["tab_get_many"](mock_context, requests=["/v1/a", bad_item], access_token="test_token")
+
+        assert not route.called
+
+
+@pytest.mark.unit
+class TestTokenExpiryCheck:
+    """Test local expiry checks on JWT access tokens"""
+
+    async def test_expired_jwt_rejected_locally(self, tools, mock_context, respx_mock):
+        """Test an expired JWT fails without a network round-trip"""
+        payload = base64.urlsafe_b64encode(json.dumps({"exp": int(time.time()) - 10}).encode())
+        token = f"eyJhbGciOiJSUzI1NiJ9.{payload.decode().rstrip('=')}.signature"
+        route = respx_mock.get(A_URL)
+
+        with pytest.raises(TabcorpAPIError) as exc_info:
+            await tools["tab_get"](
+                mock_context,
+                path="/v1/a",
+                access_token=token
+            )
+
+        assert exc_info.value.status_code == 401
+        assert not route.called
+
+
+@pytest.mark.unit
+class TestTransientRetry:
+    """Test retries of transient HTTP failures"""
+
+    async def test_get_retried_after_503(self, tools, mock_context, respx_mock):
+        """Test a GET is retried after a transient 503"""
+        route = respx_mock.get(A_URL)
+        route.side_effect = [
+            RETRY_NOW_RESPONSE,
+            OK_RESPONSE,
+        ]
+
+        result = await tools["tab_get"](
+            mock_context,
+            path="/v1/a",
+            access_token="test_token"
+        )
+
+        assert route.call_count == 2
+        assert result == {"ok": True}
+
+    async def test_get_retried_after_network_error(self, tools, mock_context, respx_mock):
+        """Test a GET is retried after a transient connection failure"""
+        route = respx_mock.get(A_URL)
+        route.side_effect = [httpx.ConnectError("connection reset"), OK_RESPONSE]
+
+        result = await tools["tab_get"](
+            mock_context,
+            path="/v1/a",
+            access_token="test_token"
+        )
+
+        assert route.call_count == 2
+        assert result == {"ok": True}
+
+    async def test_post_not_retried(self, tools, mock_context, respx_mock):
+        """Test POSTs are not retried by default"""
+        route = respx_mock.post(BETS_URL)
+        route.return_value = RETRY_NOW_RESPONSE
+
+        with pytest.raises(TabcorpAPIError):
+            await tools["tab_post"](
+                mock_context,
+                path="/v1/bets",
+                access_token="test_token",
+                body={"amount": 1}
+            )
+
+        assert route.call_count == 1
+
+
+@pytest.mark.unit
+class TestResponseCache:
+    """Test caching of read-only info-service responses"""
+
+    async def test_info_service_get_cached(self, tools, mock_context, respx_mock):
+        """Test repeated info-service GETs are served from cache until cleared"""
+        route = respx_mock.get(f"{TAB_BASE_URL}/v1/tab-info-service/racing/dates")
+        route.return_value = Response(200, json={"dates": []})
+
+        await tools["racing_get_all_meeting_dates"](mock_context, access_token="test_token")
+        await tools["racing_get_all_meeting_dates"](mock_context, access_token="test_token")
+        assert route.call_count == 1
+
+        result = await tools["tab_cache_clear"](mock_context)
+        assert result == {"cleared": 1}
+
+        await tools["racing_get_all_meeting_dates"](mock_context, access_token="test_token")
+        assert route.call_count == 2
+
+    async def test_no_store_response_not_cached(self, tools, mock_context, respx_mock):
+        """Test Cache-Control: no-store bypasses the response cache"""
+        route = respx_mock.get(f"{TAB_BASE_URL}/v1/tab-info-service/racing/jackpots")
+        route.return_value = Response(200, json={"jackpots": []}, headers={"cache-control": "no-store"})
+
+        for _ in range(2):
+            await tools["racing_get_open_jackpots"](mock_context, access_token="test_token")
+
+        assert route.call_count == 2
+
+    async def test_other_paths_not_cached(self, tools, mock_context, respx_mock):
+        """Test GETs outside the info service always hit the network"""
+        route = respx_mock.get(f"{TAB_BASE_URL}/v1/account/balance")
+        route.return_value = Response(200, json={"balance": 10})
+
+        for _ in range(2):
+            await tools["tab_get"](
+                mock_context,
+                path="/v1/account/balance",
+                access_token="test_token"
+            )
+
+        assert route.call_count == 2
+
+
+@pytest.mark.unit
+class TestUnauthorizedRefresh:
+    """Test token refresh and single retry after a 401"""
+
+    async def test_session_token_renewed_after_401(self, tools, mock_context, respx_mock):
+        """Test a rejected session token is renewed and the request retried once"""
+        token_route = respx_mock.post(OAUTH_TOKEN_URL)
+        token_route.side_effect = [
+            STALE_TOKEN_RESPONSE,
+            FRESH_TOKEN_RESPONSE,
+        ]
+        route = respx_mock.get(A_URL)
+        route.side_effect = [
+            TOKEN_EXPIRED_RESPONSE,
+            OK_RESPONSE,
+        ]
+
+        result = await tools["tab_get"](mock_context, path="/v1/a")
+
+        assert result == {"ok": True}
+        assert token_route.call_count == 2
+        assert b"grant_type=refresh_token" in token_route.calls[1].request.content
+        assert route.calls[1].request.headers["authorization"] == "Bearer fresh"
+
+    async def test_concurrent_401s_share_one_renewal(self, tools, mock_context, respx_mock):
+        """Test parallel calls rejected with the same token trigger a single renewal"""
+        token_route = respx_mock.post(OAUTH_TOKEN_URL)
+        token_route.side_effect = [
+            STALE_TOKEN_RESPONSE,
+            FRESH_TOKEN_RESPONSE,
+        ]
+        route = respx_mock.get(A_URL)
+        route.side_effect = lambda request: (
+            OK_RESPONSE if request.headers["authorization"] == "Bearer fresh"
+            else TOKEN_EXPIRED_RESPONSE
+        )
+
+        tool = tools["tab_get"]
+        results = await asyncio.gather(*(tool(mock_context, path="/v1/a") for _ in range(5)))
+
+        assert results == [{"ok": True}] * 5
+        assert token_route.call_count == 2
+
+    async def test_get_many_renews_rejected_session_token(self, tools, mock_context, respx_mock):
+        """Test a batch renews the session token once and re-issues only the rejected requests"""
+        token_route = respx_mock.post(OAUTH_TOKEN_URL)
+        token_route.side_effect = [
+            STALE_TOKEN_RESPONSE,
+            FRESH_TOKEN_RESPONSE,
+        ]
+        route = respx_mock.get(A_URL)
+        route.side_effect = lambda request: (
+            OK_RESPONSE if request.headers["authorization"] == "Bearer fresh"
+            else TOKEN_EXPIRED_RESPONSE
+        )
+        missing_route = respx_mock.get(f"{TAB_BASE_URL}/v1/missing")
+        missing_route.return_value = Response(404, json={"error": {"message": "Not found"}})
+
+        result = await tools["tab_get_many"](mock_context, requests=["/v1/a", "/v1/missing", "/v1/a"])
+
+        assert result[0] == result[2] == {"ok": True}
+        assert "Not found" in result[1]["error"]
+        assert token_route.call_count == 2
+        assert route.call_count == 4
+        assert missing_route.call_count == 1
+
+        assert await tools["tab_get_many"](mock_context, requests=["/v1/a"]) == [{"ok": True}]
+        assert token_route.call_count == 2
+
+    async def test_caller_token_refreshed_with_caller_refresh_token(self, tools, mock_context, respx_mock):
+        """Test a caller-supplied token is replaced using the refresh token the caller passed"""
+        token_route = respx_mock.post(OAUTH_TOKEN_URL)
+        token_route.return_value = FRESH_TOKEN_RESPONSE
+        route = respx_mock.post(BETS_URL)
+        route.side_effect = [
+            TOKEN_EXPIRED_RESPONSE,
+            Response(200, json={"placed": True}),
+        ]
+
+        result = await tools["tab_post"](
+            mock_context, path="/v1/bets", access_token="caller_token", body={"stake": 1},
+            refresh_token="caller_refresh_token"
+        )
+
+        assert result == {"placed": True}
+        assert b"refresh_token=caller_refresh_token" in token_route.calls[0].request.content
+        assert route.calls[1].request.headers["authorization"] == "Bearer fresh"
+
+    async def test_caller_token_not_refreshed_from_config(self, tools, context_factory, respx_mock):
+        """Test the session's refresh token is never used to replace a caller-supplied token"""
+        ctx = context_factory(refresh_token="configured_refresh_token")
+        token_route = respx_mock.post(OAUTH_TOKEN_URL)
+        token_route.return_value = FRESH_TOKEN_RESPONSE
+        route = respx_mock.post(BETS_URL)
+        route.return_value = TOKEN_EXPIRED_RESPONSE
+
+        with pytest.raises(TabcorpAPIError) as exc_info:
+            await tools["tab_post"](ctx, path="/v1/bets", access_token="caller_token", body={"stake": 1})
+
+        assert exc_info.value.status_code == 401
+        assert not token_route.called
+        assert route.call_count == 1
+
+    async def test_401_without_refresh_token_raised(self, tools, mock_context, respx_mock):
+        """Test a caller token without a refresh token surfaces the 401"""
+        route = respx_mock.get(A_URL)
+        route.return_value = TOKEN_EXPIRED_RESPONSE
+
+        with pytest.raises(TabcorpAPIError) as exc_info:
+            await tools["tab_get"](mock_context, path="/v1/a", access_token="caller_token")
+
+        assert exc_info.value.status_code == 401
+        assert route.call_count == 1
+
+
+@pytest.mark.unit
+class TestCreateServer:
+    """Test server construction"""
+
+    def test_tools_registered_once(self):
+        """Test repeated create_server calls reuse the registered tools"""
+        first = create_server()
+        second = create_server()
+
+        assert first.tool_manager.tools.keys() == second.tool_manager.tools.keys()
+        assert first.tool_manager.tools["tab_get"] is second.tool_manager.tools["tab_get"]
+
+    def test_each_server_has_own_session_manager(self):
+        """Test every create_server call gets a fresh FastMCP whose HTTP session manager can run"""
+        first = create_server()
+        second = create_server()
+        first.streamable_http_app()
+        second.streamable_http_app()
+
+        assert first is not second
+        assert first.session_manager is not second.session_manager
@@ -1,32 +1,58 @@
 """Unit tests for OAuth authentication tools"""
+import asyncio
 import pytest
 import time
-from unittest.mock import Mock
-import respx
 from httpx import Response
 
 from tab_mcp.server import (
-    create_server,
     TabcorpAPIError,
     TAB_BASE_URL,
-    OAUTH_TOKEN_PATH
+    OAUTH_TOKEN_PATH,
+    TOKEN_CACHE_MAX,
+    TOKEN_EXPIRY_BUFFER,
+    _TOKEN_CACHE,
+    _store_token,
+    _token_cache_key
 )
 
+from fixtures import json_response
+
+OAUTH_TOKEN_URL = f"{TAB_BASE_URL}{OAUTH_TOKEN_PATH}"
+
+pytestmark = pytest.mark.xdist_group("oauth")
+
+# Wall-clock time is pinned for this module so expiry arithmetic is exact
+FROZEN_NOW = 1_700_000_000.0
+
+CLIENT_CREDENTIALS_RESPONSE = {
+    "access_token": "client_creds_token",
+    "token_type": "Bearer",
+    "expires_in": 3600,
+    "expires_at": int(FROZEN_NOW) + 3540
+}
+
+
+@pytest.fixture(autouse=True, scope="module")
+def frozen_time():
+    """Pin time.time() for every test in this module (monotonic clocks are untouched)"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(time, "time", lambda: FROZEN_NOW)
+        yield FROZEN_NOW
+
 
 @pytest.mark.unit
 @pytest.mark.oauth
 class TestOAuthPasswordGrant:
     """Test password grant OAuth flow"""
 
-    def test_password_grant_success(self, mock_context, respx_mock, valid_oauth_response):
+    async def test_password_grant_success(self, tools, mock_context, respx_mock, valid_oauth_bytes):
         """Test successful password grant authentication"""
         # Mock OAuth endpoint
-        route = respx_mock.post(f"{TAB_BASE_URL}{OAUTH_TOKEN_PATH}")
-        route.return_value = Response(200, json=valid_oauth_response)
+        route = respx_mock.post(OAUTH_TOKEN_URL)
+        route.return_value = json_response(200, valid_oauth_bytes)
 
-        # Create server and call tool
-        server = create_server()
-        result = server.tool_manager.tools["tab_oauth_password_grant"].fn(
+        # Call tool
+        result = await tools["tab_oauth_password_grant"](
             mock_context,
             client_id="test_client",
             client_secret="test_secret",
@@ -45,48 +71,43 @@ class TestOAuthPasswordGrant:
         assert result["refresh_token"] == "test_refresh_token_67890"
         assert result["token_type"] == "Bearer"
         assert result["expires_in"] == 3600
-        assert "expires_at" in result
-        assert result["expires_at"] > time.time()
+        assert result["expires_at"] == int(FROZEN_NOW) + 3600 - TOKEN_EXPIRY_BUFFER
 
-    def test_password_grant_from_config(self, mock_context, respx_mock, valid_oauth_response):
+    async def test_password_grant_from_config(self, tools, context_factory, respx_mock, valid_oauth_bytes):
         """Test password grant using credentials from config"""
-        # Configure mock context with credentials
-        mock_context.session_config.client_id = "config_client"
-        mock_context.session_config.client_secret = "config_secret"
-        mock_context.session_config.username = "config_user"
-        mock_context.session_config.password = "config_pass"
+        ctx = context_factory(
+            client_id="config_client",
+            client_secret="config_secret",
+            username="config_user",
+            password="config_pass",
+        )
 
         # Mock OAuth endpoint
-        route = respx_mock.post(f"{TAB_BASE_URL}{OAUTH_TOKEN_PATH}")
-        route.return_value = Response(200, json=valid_oauth_response)
+        route = respx_mock.post(OAUTH_TOKEN_URL)
+        route.return_value = json_response(200, valid_oauth_bytes)
 
         # Call without explicit credentials
-        server = create_server()
-        result = server.tool_manager.tools["tab_oauth_password_grant"].fn(mock_context)
+        result = await tools["tab_oauth_password_grant"](ctx)
 
         # Verify it used config credentials
         assert route.called
         assert result["access_token"] == "test_access_token_12345"
 
-    def test_password_grant_missing_credentials(self, mock_context):
+    async def test_password_grant_missing_credentials(self, tools, context_factory):
         """Test password grant with missing credentials raises error"""
-        # Clear config credentials
-        mock_context.session_config.client_id = None
-        mock_context.session_config.client_secret = None
+        ctx = context_factory(client_id=None, client_secret=None)
 
-        server = create_server()
         with pytest.raises(ValueError, match="Missing required credentials"):
-            server.tool_manager.tools["tab_oauth_password_grant"].fn(mock_context)
+            await tools["tab_oauth_password_grant"](ctx)
 
-    def test_password_grant_invalid_credentials(self, mock_context, respx_mock, oauth_error_response):
+    async def test_password_grant_invalid_credentials(self, tools, mock_context, respx_mock, oauth_error_bytes):
         """Test password grant with invalid credentials"""
         # Mock OAuth error
-        route = respx_mock.post(f"{TAB_BASE_URL}{OAUTH_TOKEN_PATH}")
-        route.return_value = Response(401, json=oauth_error_response)
+        route = respx_mock.post(OAUTH_TOKEN_URL)
+        route.return_value = json_response(401, oauth_error_bytes)
 
-        server = create_server()
         with pytest.raises(TabcorpAPIError) as exc_info:
-            server.tool_manager.tools["tab_oauth_password_grant"].fn(
+            await tools["tab_oauth_password_grant"](
                 mock_context,
                 client_id="bad_client",
                 client_secret="bad_secret",
@@ -103,51 +124,57 @@ class TestOAuthPasswordGrant:
 class TestOAuthRefresh:
     """Test refresh token OAuth flow"""
 
-    def test_refresh_token_success(self, mock_context, respx_mock, valid_oauth_response):
+    async def test_refresh_token_success(self, tools, mock_context, respx_mock, valid_oauth_bytes):
         """Test successful token refresh"""
         # Mock OAuth endpoint
-        route = respx_mock.post(f"{TAB_BASE_URL}{OAUTH_TOKEN_PATH}")
-        route.return_value = Response(200, json=valid_oauth_response)
+        route = respx_mock.post(OAUTH_TOKEN_URL)
+        route.return_value = json_response(200, valid_oauth_bytes)
 
-        server = create_server()
-        result = server.tool_manager.tools["tab_oauth_refresh"].fn(
+        result = await tools["tab_oauth_refresh"](
             mock_context,
-            refresh_token="old_refresh_token",
+            refresh_token="old_refresh_token_12345",
             client_id="test_client",
             client_secret="test_secret"
         )
 
         # Verify request
         assert route.called
-        request_body = route.calls[0].request.content.decode()
-        assert "grant_type=refresh_token" in request_body
-        assert "old_refresh_token" in request_body
+        request_body = route.calls[0].request.content
+        assert b"grant_type=refresh_token" in request_body
+        assert b"refresh_token=old_refresh_token_12345" in request_body
 
         # Verify response
         assert result["access_token"] == "test_access_token_12345"
         assert result["refresh_token"] == "test_refresh_token_67890"
 
+    @pytest.mark.parametrize("refresh_token", ["bad token!", "r" * 19], ids=["bad_chars", "too_short"])
+    async def test_refresh_token_malformed(self, tools, mock_context, respx_mock, refresh_token):
+        """Test malformed refresh tokens are rejected without a network call"""
+        route = respx_mock.post(OAUTH_TOKEN_URL)
+
+        with pytest.raises(ValueError, match="Malformed refresh_token"):
+            await tools["tab_oauth_refresh"](
+                mock_context,
+                refresh_token=refresh_token,
+                client_id="test_client",
+                client_secret="test_secret"
+            )
+
+        assert not route.called
+
 
 @pytest.mark.unit
 @pytest.mark.oauth  
 class TestOAuthClientCredentials:
     """Test client credentials OAuth flow"""
 
-    def test_client_credentials_success(self, mock_context, respx_mock):
+    async def test_client_credentials_success(self, tools, mock_context, respx_mock):
         """Test successful client credentials authentication"""
         # Mock response (no refresh_token for client_credentials)
-        response = {
-            "access_token": "client_creds_token",
-            "token_type": "Bearer",
-            "expires_in": 3600,
-            "expires_at": int(time.time()) + 3540
-        }
-        
-        route = respx_mock.post(f"{TAB_BASE_URL}{OAUTH_TOKEN_PATH}")
-        route.return_value = Response(200, json=response)
-
-        server = create_server()
-        result = server.tool_manager.tools["tab_oauth_client_credentials"].fn(
+        route = respx_mock.post(OAUTH_TOKEN_URL)
+        route.return_value = Response(200, json=CLIENT_CREDENTIALS_RESPONSE)
+
+        result = await tools["tab_oauth_client_credentials"](
             mock_context,
             client_id="test_client",
             client_secret="test_secret"
@@ -155,9 +182,122 @@ class TestOAuthClientCredentials:
 
         # Verify request
         assert route.called
-        request_body = route.calls[0].request.content.decode()
-        assert "grant_type=client_credentials" in request_body
+        request_body = route.calls[0].request.content
+        assert b"grant_type=client_credentials" in request_body
 
         # Verify response
         assert result["access_token"] == "client_creds_token"
         assert "refresh_token" not in result  # Not provided for client_credentials
+
+
+@pytest.mark.unit
+@pytest.mark.oauth
+class TestOAuthTokenCache:
+    """Test in-process reuse of OAuth tokens"""
+
+    async def test_cached_token_reused(self, tools, mock_context, respx_mock, valid_oauth_bytes):
+        """Test repeated grants for the same credentials hit the network once"""
+        route = respx_mock.post(OAUTH_TOKEN_URL)
+        route.return_value = json_response(200, valid_oauth_bytes)
+
+        tool = tools["tab_oauth_client_credentials"]
+        first = await tool(mock_context, client_id="test_client", client_secret="test_secret")
+        second = await tool(mock_context, client_id="test_client", client_secret="test_secret")
+
+        assert route.call_count == 1
+        assert second["access_token"] == first["access_token"]
+
+    async def test_force_refresh_bypasses_cache(self, tools, mock_context, respx_mock, valid_oauth_bytes):
+        """Test force_refresh always requests a new token"""
+        route = respx_mock.post(OAUTH_TOKEN_URL)
+        route.return_value = json_response(200, valid_oauth_bytes)
+
+        tool = tools["tab_oauth_client_credentials"]
+        await tool(mock_context, client_id="test_client", client_secret="test_secret")
+        await tool(mock_context, client_id="test_client", client_secret="test_secret", force_refresh=True)
+
+        assert route.call_count == 2
+
+    async def test_expired_token_refetched(self, tools, mock_context, respx_mock, valid_oauth_response):
+        """Test tokens near expiry are fetched again"""
+        route = respx_mock.post(OAUTH_TOKEN_URL)
+        route.return_value = Response(200, json={**valid_oauth_response, "expires_in": 61})
+
+        tool = tools["tab_oauth_client_credentials"]
+        await tool(mock_context, client_id="test_client", client_secret="test_secret")
+        await tool(mock_context, client_id="test_client", client_secret="test_secret")
+
+        assert route.call_count == 2
+
+    async def test_valid_token_refreshed_before_expiry(self, tools, mock_context, respx_mock, valid_oauth_bytes):
+        """Test a near-expiry cached token is refreshed without waiting for a 401"""
+        cfg = mock_context.session_config
+        _store_token(_token_cache_key(cfg.base_url, {
+            "grant_type": "password",
+            "client_id": cfg.client_id,
+            "client_secret": cfg.client_secret,
+            "username": cfg.username,
+            "password": cfg.password,
+        }), {
+            "access_token": "stale_token",
+            "refresh_token": "cached_refresh_token",
+            "expires_at": int(FROZEN_NOW) + 10,
+        })
+        route = respx_mock.post(OAUTH_TOKEN_URL)
+        route.return_value = json_response(200, valid_oauth_bytes)
+
+        result = await tools["tab_get_valid_token"](mock_context)
+
+        assert route.call_count == 1
+        request_body = route.calls[0].request.content
+        assert b"grant_type=refresh_token" in request_body
+        assert b"refresh_token=cached_refresh_token" in request_body
+        assert result["access_token"] == "test_access_token_12345"
+
+    async def test_wrong_password_misses_cache(self, tools, context_factory, respx_mock,
+                                               valid_oauth_bytes, oauth_error_bytes):
+        """Test a session with the same username but a wrong password is not served the cached token"""
+        oauth_route = respx_mock.post(OAUTH_TOKEN_URL)
+        oauth_route.side_effect = [json_response(200, valid_oauth_bytes), json_response(401, oauth_error_bytes)]
+        api_route = respx_mock.get(f"{TAB_BASE_URL}/v1/tab-info-service/racing/jackpots")
+        api_route.return_value = Response(200, json={"jackpots": []})
+
+        tool = tools["racing_get_open_jackpots"]
+        await tool(context_factory(password="right"))
+        with pytest.raises(TabcorpAPIError) as exc_info:
+            await tool(context_factory(password="WRONG", client_secret="nope"))
+
+        assert exc_info.value.status_code == 401
+        assert oauth_route.call_count == 2
+        assert b"password=WRONG" in oauth_route.calls[1].request.content
+        assert api_route.call_count == 1
+
+    def test_store_prunes_expired_tokens(self):
+        """Test storing a token drops cached entries that have already expired"""
+        _store_token("rotated", {"access_token": "old", "expires_at": int(FROZEN_NOW) - 1})
+        _store_token("current", {"access_token": "new", "expires_at": int(FROZEN_NOW) + 3600})
+
+        assert list(_TOKEN_CACHE) == ["current"]
+
+    def test_store_evicts_oldest_at_capacity(self):
+        """Test the cache never holds more than TOKEN_CACHE_MAX grants"""
+        for i in range(TOKEN_CACHE_MAX + 1):
+            _store_token(f"key{i}", {"access_token": f"token{i}", "expires_at": int(FROZEN_NOW) + 3600})
+
+        assert len(_TOKEN_CACHE) == TOKEN_CACHE_MAX
+        assert "key0" not in _TOKEN_CACHE
+        assert f"key{TOKEN_CACHE_MAX}" in _TOKEN_CACHE
+
+    async def test_tools_share_session_token(self, tools, mock_context, respx_mock, valid_oauth_bytes):
+        """Test concurrent tool calls without access_token trigger a single grant"""
+        oauth_route = respx_mock.post(OAUTH_TOKEN_URL)
+        oauth_route.return_value = json_response(200, valid_oauth_bytes)
+        api_route = respx_mock.get(f"{TAB_BASE_URL}/v1/tab-info-service/racing/jackpots")
+        api_route.return_value = Response(200, json={"jackpots": []})
+
+        tool = tools["racing_get_open_jackpots"]
+        await asyncio.gather(tool(mock_context), tool(mock_context, jurisdiction="VIC"))
+
+        assert oauth_route.call_count == 1
+        assert api_route.call_count == 2
+        assert api_route.calls[0].request.headers["authorization"] == "Bearer test_access_token_12345"
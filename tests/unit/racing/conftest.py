@@ -0,0 +1,2 @@
+"""Fixtures for the racing tool tests"""
+from fixtures.racing import *  # noqa: F401,F403
@@ -1,21 +1,40 @@
 """Unit tests for Racing API tools"""
 import pytest
-import respx
 from httpx import Response
 
 from tab_mcp.server import (
-    create_server,
-    TabcorpAPIError,
     TAB_BASE_URL
 )
 
+from fixtures import json_response
+
+RACING_DATES_URL = f"{TAB_BASE_URL}/v1/tab-info-service/racing/dates"
+MEETINGS_URL = f"{RACING_DATES_URL}/2025-10-29/meetings"
+RANDWICK_RACES_URL = f"{MEETINGS_URL}/R/RAN/races"
+RACE_URL = f"{RANDWICK_RACES_URL}/1"
+NEXT_TO_GO_URL = f"{TAB_BASE_URL}/v1/tab-info-service/racing/next-to-go/races"
+OAUTH_TOKEN_URL = f"{TAB_BASE_URL}/oauth/token"
+
+TOKEN_EXPIRED_RESPONSE = Response(401, json={"error": {"message": "Token expired"}})
+STALE_TOKEN_RESPONSE = Response(200, json={"access_token": "stale", "refresh_token": "r" * 20, "expires_in": 3600})
+FRESH_TOKEN_RESPONSE = Response(200, json={"access_token": "fresh", "expires_in": 3600})
+
+
+def fresh_token_only(response):
+    """Return a respx side effect serving response to the fresh token and 401 to any other"""
+    return lambda request: (
+        response if request.headers["authorization"] == "Bearer fresh" else TOKEN_EXPIRED_RESPONSE
+    )
+
+pytestmark = pytest.mark.xdist_group("racing")
+
 
 @pytest.mark.unit
 @pytest.mark.racing
 class TestRacingGetAllMeetingDates:
     """Test racing_get_all_meeting_dates tool"""
 
-    def test_get_meeting_dates_success(self, mock_context, respx_mock):
+    async def test_get_meeting_dates_success(self, tools, mock_context, respx_mock):
         """Test successful retrieval of meeting dates"""
         # Mock API response
         response_data = {
@@ -26,11 +45,10 @@ class TestRacingGetAllMeetingDates:
             ]
         }
         
-        route = respx_mock.get(f"{TAB_BASE_URL}/v1/tab-info-service/racing/dates")
+        route = respx_mock.get(RACING_DATES_URL)
         route.return_value = Response(200, json=response_data)
 
-        server = create_server()
-        result = server.tool_manager.tools["racing_get_all_meeting_dates"].fn(
+        result = await tools["racing_get_all_meeting_dates"](
             mock_context,
             access_token="test_token"
         )
@@ -39,35 +57,32 @@ class TestRacingGetAllMeetingDates:
         assert route.called
         request = route.calls[0].request
         assert "Bearer test_token" in request.headers["authorization"]
-        assert "jurisdiction" in str(request.url)
+        assert "jurisdiction" in request.url.params
 
         # Verify response
         assert "dates" in result
         assert len(result["dates"]) == 3
         assert result["dates"][0]["date"] == "2025-10-29"
 
-    def test_get_meeting_dates_with_jurisdiction(self, mock_context, respx_mock):
+    async def test_get_meeting_dates_with_jurisdiction(self, tools, mock_context, respx_mock):
         """Test meeting dates with custom jurisdiction"""
         response_data = {"dates": []}
-        route = respx_mock.get(f"{TAB_BASE_URL}/v1/tab-info-service/racing/dates")
+        route = respx_mock.get(RACING_DATES_URL)
         route.return_value = Response(200, json=response_data)
 
-        server = create_server()
-        result = server.tool_manager.tools["racing_get_all_meeting_dates"].fn(
+        result = await tools["racing_get_all_meeting_dates"](
             mock_context,
             access_token="test_token",
             jurisdiction="VIC"
         )
 
         assert route.called
-        assert "jurisdiction=VIC" in str(route.calls[0].request.url)
+        assert route.calls[0].request.url.params["jurisdiction"] == "VIC"
 
-    def test_get_meeting_dates_invalid_jurisdiction(self, mock_context):
+    async def test_get_meeting_dates_invalid_jurisdiction(self, tools, mock_context):
         """Test invalid jurisdiction raises error"""
-        server = create_server()
-        
         with pytest.raises(ValueError, match="Invalid jurisdiction"):
-            server.tool_manager.tools["racing_get_all_meeting_dates"].fn(
+            await tools["racing_get_all_meeting_dates"](
                 mock_context,
                 access_token="test_token",
                 jurisdiction="INVALID"
@@ -79,15 +94,12 @@ class TestRacingGetAllMeetingDates:
 class TestRacingGetMeetings:
     """Test racing_get_meetings tool"""
 
-    def test_get_meetings_success(self, mock_context, respx_mock, sample_race_meeting):
+    async def test_get_meetings_success(self, tools, mock_context, respx_mock, sample_race_meeting_bytes):
         """Test successful retrieval of meetings for a date"""
-        route = respx_mock.get(
-            f"{TAB_BASE_URL}/v1/tab-info-service/racing/dates/2025-10-29/meetings"
-        )
-        route.return_value = Response(200, json=sample_race_meeting)
+        route = respx_mock.get(MEETINGS_URL)
+        route.return_value = json_response(200, sample_race_meeting_bytes)
 
-        server = create_server()
-        result = server.tool_manager.tools["racing_get_meetings"].fn(
+        result = await tools["racing_get_meetings"](
             mock_context,
             access_token="test_token",
             meeting_date="2025-10-29"
@@ -99,20 +111,102 @@ class TestRacingGetMeetings:
         assert result["meetings"][0]["venueMnemonic"] == "RAN"
 
 
+@pytest.mark.unit
+@pytest.mark.racing
+class TestRacingGetMeetingBundle:
+    """Test racing_get_meeting_bundle tool"""
+
+    async def test_meeting_bundle_success(self, tools, mock_context, respx_mock, sample_race_meeting, sample_race_meeting_bytes):
+        """Test meetings are returned with the races of each venue"""
+        respx_mock.get(MEETINGS_URL).return_value = json_response(200, sample_race_meeting_bytes)
+        races_route = respx_mock.get(RANDWICK_RACES_URL)
+        races_route.return_value = Response(200, json={"races": [{"raceNumber": 1}]})
+
+        result = await tools["racing_get_meeting_bundle"](
+            mock_context,
+            access_token="test_token",
+            meeting_date="2025-10-29"
+        )
+
+        assert races_route.called
+        assert result["meetings"] == sample_race_meeting
+        assert result["races_by_venue"] == {"R/RAN": {"races": [{"raceNumber": 1}]}}
+
+    async def test_meeting_bundle_renews_rejected_session_token(self, tools, mock_context, respx_mock,
+                                                                sample_race_meeting_bytes):
+        """Test a 401 on the meetings request renews the session token and the race lists use it"""
+        token_route = respx_mock.post(OAUTH_TOKEN_URL)
+        token_route.side_effect = [STALE_TOKEN_RESPONSE, FRESH_TOKEN_RESPONSE]
+        meetings_route = respx_mock.get(MEETINGS_URL)
+        meetings_route.side_effect = fresh_token_only(json_response(200, sample_race_meeting_bytes))
+        races_route = respx_mock.get(RANDWICK_RACES_URL)
+        races_route.side_effect = fresh_token_only(Response(200, json={"races": []}))
+
+        result = await tools["racing_get_meeting_bundle"](mock_context, meeting_date="2025-10-29")
+
+        assert result["races_by_venue"] == {"R/RAN": {"races": []}}
+        assert token_route.call_count == 2
+        assert meetings_route.call_count == 2
+        assert races_route.call_count == 1
+
+
+@pytest.mark.unit
+@pytest.mark.racing
+class TestRacingGetAllRaceForms:
+    """Test racing_get_all_race_forms tool"""
+
+    async def test_all_race_forms_success(self, tools, mock_context, respx_mock):
+        """Test forms are fetched for each requested race"""
+        respx_mock.get(f"{RANDWICK_RACES_URL}/1/form").return_value = Response(200, json={"raceNumber": 1})
+        respx_mock.get(f"{RANDWICK_RACES_URL}/2/form").return_value = Response(404, json={"error": {"message": "Not found"}})
+
+        result = await tools["racing_get_all_race_forms"](
+            mock_context,
+            meeting_date="2025-10-29",
+            race_type="R",
+            venue_mnemonic="RAN",
+            race_numbers=[1, 2],
+            access_token="test_token"
+        )
+
+        assert result["forms"]["1"] == {"raceNumber": 1}
+        assert "Not found" in result["forms"]["2"]["error"]
+
+    async def test_all_race_forms_renews_rejected_session_token(self, tools, mock_context, respx_mock):
+        """Test races answered 401 are re-fetched once with a renewed session token"""
+        token_route = respx_mock.post(OAUTH_TOKEN_URL)
+        token_route.side_effect = [STALE_TOKEN_RESPONSE, FRESH_TOKEN_RESPONSE]
+        form_route = respx_mock.get(f"{RANDWICK_RACES_URL}/1/form")
+        form_route.side_effect = fresh_token_only(Response(200, json={"raceNumber": 1}))
+        respx_mock.get(f"{RANDWICK_RACES_URL}/2/form").return_value = Response(
+            404, json={"error": {"message": "Not found"}}
+        )
+
+        result = await tools["racing_get_all_race_forms"](
+            mock_context,
+            meeting_date="2025-10-29",
+            race_type="R",
+            venue_mnemonic="RAN",
+            race_numbers=[1, 2]
+        )
+
+        assert result["forms"]["1"] == {"raceNumber": 1}
+        assert "Not found" in result["forms"]["2"]["error"]
+        assert token_route.call_count == 2
+        assert form_route.call_count == 2
+
+
 @pytest.mark.unit
 @pytest.mark.racing
 class TestRacingGetRace:
     """Test racing_get_race tool"""
 
-    def test_get_race_success(self, mock_context, respx_mock, sample_race_details):
+    async def test_get_race_success(self, tools, mock_context, respx_mock, sample_race_details_bytes):
         """Test successful retrieval of race details"""
-        route = respx_mock.get(
-            f"{TAB_BASE_URL}/v1/tab-info-service/racing/dates/2025-10-29/meetings/R/RAN/races/1"
-        )
-        route.return_value = Response(200, json=sample_race_details)
+        route = respx_mock.get(RACE_URL)
+        route.return_value = json_response(200, sample_race_details_bytes)
 
-        server = create_server()
-        result = server.tool_manager.tools["racing_get_race"].fn(
+        result = await tools["racing_get_race"](
             mock_context,
             access_token="test_token",
             meeting_date="2025-10-29",
@@ -126,15 +220,12 @@ class TestRacingGetRace:
         assert "runners" in result
         assert len(result["runners"]) == 2
 
-    def test_get_race_with_fixed_odds(self, mock_context, respx_mock, sample_race_details):
+    async def test_get_race_with_fixed_odds(self, tools, mock_context, respx_mock, sample_race_details_bytes):
         """Test race retrieval with fixed odds parameter"""
-        route = respx_mock.get(
-            f"{TAB_BASE_URL}/v1/tab-info-service/racing/dates/2025-10-29/meetings/R/RAN/races/1"
-        )
-        route.return_value = Response(200, json=sample_race_details)
+        route = respx_mock.get(RACE_URL)
+        route.return_value = json_response(200, sample_race_details_bytes)
 
-        server = create_server()
-        result = server.tool_manager.tools["racing_get_race"].fn(
+        result = await tools["racing_get_race"](
             mock_context,
             access_token="test_token",
             meeting_date="2025-10-29",
@@ -145,14 +236,12 @@ class TestRacingGetRace:
         )
 
         assert route.called
-        assert "fixedOdds=true" in str(route.calls[0].request.url)
+        assert route.calls[0].request.url.params["fixedOdds"] == "true"
 
-    def test_get_race_invalid_race_type(self, mock_context):
+    async def test_get_race_invalid_race_type(self, tools, mock_context):
         """Test invalid race type raises error"""
-        server = create_server()
-        
         with pytest.raises(ValueError, match="Invalid race type"):
-            server.tool_manager.tools["racing_get_race"].fn(
+            await tools["racing_get_race"](
                 mock_context,
                 access_token="test_token",
                 meeting_date="2025-10-29",
@@ -167,15 +256,12 @@ class TestRacingGetRace:
 class TestRacingNextToGo:
     """Test racing_get_next_to_go tool"""
 
-    def test_next_to_go_success(self, mock_context, respx_mock, sample_next_to_go):
+    async def test_next_to_go_success(self, tools, mock_context, respx_mock, sample_next_to_go_bytes):
         """Test successful retrieval of next-to-go races"""
-        route = respx_mock.get(
-            f"{TAB_BASE_URL}/v1/tab-info-service/racing/next-to-go/races"
-        )
-        route.return_value = Response(200, json=sample_next_to_go)
+        route = respx_mock.get(NEXT_TO_GO_URL)
+        route.return_value = json_response(200, sample_next_to_go_bytes)
 
-        server = create_server()
-        result = server.tool_manager.tools["racing_get_next_to_go"].fn(
+        result = await tools["racing_get_next_to_go"](
             mock_context,
             access_token="test_token"
         )
@@ -185,36 +271,30 @@ class TestRacingNextToGo:
         assert len(result["races"]) == 2
         assert result["races"][0]["secondsToJump"] == 300
 
-    def test_next_to_go_with_max_races(self, mock_context, respx_mock, sample_next_to_go):
+    async def test_next_to_go_with_max_races(self, tools, mock_context, respx_mock, sample_next_to_go_bytes):
         """Test next-to-go with maxRaces parameter"""
-        route = respx_mock.get(
-            f"{TAB_BASE_URL}/v1/tab-info-service/racing/next-to-go/races"
-        )
-        route.return_value = Response(200, json=sample_next_to_go)
+        route = respx_mock.get(NEXT_TO_GO_URL)
+        route.return_value = json_response(200, sample_next_to_go_bytes)
 
-        server = create_server()
-        result = server.tool_manager.tools["racing_get_next_to_go"].fn(
+        result = await tools["racing_get_next_to_go"](
             mock_context,
             access_token="test_token",
             max_races=5
         )
 
         assert route.called
-        assert "maxRaces=5" in str(route.calls[0].request.url)
+        assert route.calls[0].request.url.params["maxRaces"] == "5"
 
-    def test_next_to_go_with_filters(self, mock_context, respx_mock, sample_next_to_go):
+    async def test_next_to_go_with_filters(self, tools, mock_context, respx_mock, sample_next_to_go_bytes):
         """Test next-to-go with includeRecentlyClosed filter"""
-        route = respx_mock.get(
-            f"{TAB_BASE_URL}/v1/tab-info-service/racing/next-to-go/races"
-        )
-        route.return_value = Response(200, json=sample_next_to_go)
+        route = respx_mock.get(NEXT_TO_GO_URL)
+        route.return_value = json_response(200, sample_next_to_go_bytes)
 
-        server = create_server()
-        result = server.tool_manager.tools["racing_get_next_to_go"].fn(
+        result = await tools["racing_get_next_to_go"](
             mock_context,
             access_token="test_token",
             include_recently_closed=True
         )
 
         assert route.called
-        assert "includeRecentlyClosed=true" in str(route.calls[0].request.url)
+        assert route.calls[0].request.url.params["includeRecentlyClosed"] == "true"
@@ -0,0 +1,2 @@
+"""Fixtures for the sports tool tests"""
+from fixtures.sports import *  # noqa: F401,F403
@@ -1,27 +1,33 @@
 """Unit tests for Sports API tools"""
 import pytest
-import respx
 from httpx import Response
 
 from tab_mcp.server import (
-    create_server,
     TabcorpAPIError,
     TAB_BASE_URL
 )
 
+from fixtures import json_response
+
+SPORTS_URL = f"{TAB_BASE_URL}/v1/tab-info-service/sports"
+BASKETBALL_URL = f"{SPORTS_URL}/Basketball"
+NBA_URL = f"{BASKETBALL_URL}/competitions/NBA"
+SPORTS_NEXT_TO_GO_URL = f"{SPORTS_URL}/nextToGo"
+
+pytestmark = pytest.mark.xdist_group("sports")
+
 
 @pytest.mark.unit
 @pytest.mark.sports
 class TestSportsGetAllOpen:
     """Test sports_get_all_open tool"""
 
-    def test_get_all_open_success(self, mock_context, respx_mock, sample_sports_list):
+    async def test_get_all_open_success(self, tools, mock_context, respx_mock, sample_sports_list_bytes):
         """Test successful retrieval of all open sports"""
-        route = respx_mock.get(f"{TAB_BASE_URL}/v1/tab-info-service/sports")
-        route.return_value = Response(200, json=sample_sports_list)
+        route = respx_mock.get(SPORTS_URL)
+        route.return_value = json_response(200, sample_sports_list_bytes)
 
-        server = create_server()
-        result = server.tool_manager.tools["sports_get_all_open"].fn(
+        result = await tools["sports_get_all_open"](
             mock_context,
             access_token="test_token"
         )
@@ -36,20 +42,46 @@ class TestSportsGetAllOpen:
         assert len(result["sports"]) == 2
         assert result["sports"][0]["sportName"] == "Basketball"
 
-    def test_get_all_open_with_jurisdiction(self, mock_context, respx_mock, sample_sports_list):
+    async def test_get_all_open_with_jurisdiction(self, tools, mock_context, respx_mock, sample_sports_list_bytes):
         """Test sports list with custom jurisdiction"""
-        route = respx_mock.get(f"{TAB_BASE_URL}/v1/tab-info-service/sports")
-        route.return_value = Response(200, json=sample_sports_list)
+        route = respx_mock.get(SPORTS_URL)
+        route.return_value = json_response(200, sample_sports_list_bytes)
 
-        server = create_server()
-        result = server.tool_manager.tools["sports_get_all_open"].fn(
+        result = await tools["sports_get_all_open"](
             mock_context,
             access_token="test_token",
             jurisdiction="QLD"
         )
 
         assert route.called
-        assert "jurisdiction=QLD" in str(route.calls[0].request.url)
+        assert route.calls[0].request.url.params["jurisdiction"] == "QLD"
+
+    async def test_get_all_open_with_fields(self, tools, mock_context, respx_mock, sample_sports_list_bytes):
+        """Test projecting the sports list onto selected fields"""
+        route = respx_mock.get(SPORTS_URL)
+        route.return_value = json_response(200, sample_sports_list_bytes)
+
+        result = await tools["sports_get_all_open"](
+            mock_context,
+            access_token="test_token",
+            fields=["sportName"]
+        )
+
+        assert result == {"sports": [{"sportName": "Basketball"}, {"sportName": "Rugby League"}]}
+
+    async def test_get_all_open_error(self, tools, mock_context, respx_mock):
+        """Test API errors are raised from the streamed listing"""
+        route = respx_mock.get(SPORTS_URL)
+        route.return_value = Response(400, json={"error": {"message": "Invalid jurisdiction"}})
+
+        with pytest.raises(TabcorpAPIError) as exc_info:
+            await tools["sports_get_all_open"](
+                mock_context,
+                access_token="test_token"
+            )
+
+        assert exc_info.value.status_code == 400
+        assert "Invalid jurisdiction" in str(exc_info.value)
 
 
 @pytest.mark.unit
@@ -57,15 +89,12 @@ class TestSportsGetAllOpen:
 class TestSportsGetOpenSport:
     """Test sports_get_open_sport tool"""
 
-    def test_get_open_sport_success(self, mock_context, respx_mock, sample_sport_competition):
+    async def test_get_open_sport_success(self, tools, mock_context, respx_mock, sample_sport_competition):
         """Test successful retrieval of specific sport"""
-        route = respx_mock.get(
-            f"{TAB_BASE_URL}/v1/tab-info-service/sports/Basketball"
-        )
+        route = respx_mock.get(BASKETBALL_URL)
         route.return_value = Response(200, json={"competitions": [sample_sport_competition]})
 
-        server = create_server()
-        result = server.tool_manager.tools["sports_get_open_sport"].fn(
+        result = await tools["sports_get_open_sport"](
             mock_context,
             access_token="test_token",
             sport_name="Basketball"
@@ -74,7 +103,7 @@ class TestSportsGetOpenSport:
         assert route.called
         assert "competitions" in result
 
-    def test_get_open_sport_not_found(self, mock_context, respx_mock):
+    async def test_get_open_sport_not_found(self, tools, mock_context, respx_mock):
         """Test sport not found returns error"""
         error_data = {
             "error": {
@@ -83,13 +112,12 @@ class TestSportsGetOpenSport:
             }
         }
         route = respx_mock.get(
-            f"{TAB_BASE_URL}/v1/tab-info-service/sports/InvalidSport"
+            f"{SPORTS_URL}/InvalidSport"
         )
         route.return_value = Response(404, json=error_data)
 
-        server = create_server()
         with pytest.raises(TabcorpAPIError) as exc_info:
-            server.tool_manager.tools["sports_get_open_sport"].fn(
+            await tools["sports_get_open_sport"](
                 mock_context,
                 access_token="test_token",
                 sport_name="InvalidSport"
@@ -103,15 +131,12 @@ class TestSportsGetOpenSport:
 class TestSportsGetOpenCompetition:
     """Test sports_get_open_competition tool"""
 
-    def test_get_open_competition_success(self, mock_context, respx_mock, sample_sport_competition):
+    async def test_get_open_competition_success(self, tools, mock_context, respx_mock, sample_sport_competition_bytes):
         """Test successful retrieval of competition"""
-        route = respx_mock.get(
-            f"{TAB_BASE_URL}/v1/tab-info-service/sports/Basketball/competitions/NBA"
-        )
-        route.return_value = Response(200, json=sample_sport_competition)
+        route = respx_mock.get(NBA_URL)
+        route.return_value = json_response(200, sample_sport_competition_bytes)
 
-        server = create_server()
-        result = server.tool_manager.tools["sports_get_open_competition"].fn(
+        result = await tools["sports_get_open_competition"](
             mock_context,
             access_token="test_token",
             sport_name="Basketball",
@@ -129,7 +154,7 @@ class TestSportsGetOpenCompetition:
 class TestSportsNextToGo:
     """Test sports_get_next_to_go tool"""
 
-    def test_next_to_go_success(self, mock_context, respx_mock):
+    async def test_next_to_go_success(self, tools, mock_context, respx_mock):
         """Test successful retrieval of next-to-go sports"""
         response_data = {
             "matches": [
@@ -148,13 +173,10 @@ class TestSportsNextToGo:
             ]
         }
         
-        route = respx_mock.get(
-            f"{TAB_BASE_URL}/v1/tab-info-service/sports/nextToGo"
-        )
+        route = respx_mock.get(SPORTS_NEXT_TO_GO_URL)
         route.return_value = Response(200, json=response_data)
 
-        server = create_server()
-        result = server.tool_manager.tools["sports_get_next_to_go"].fn(
+        result = await tools["sports_get_next_to_go"](
             mock_context,
             access_token="test_token"
         )
@@ -163,50 +185,35 @@ class TestSportsNextToGo:
         assert "matches" in result
         assert len(result["matches"]) == 2
 
-    def test_next_to_go_with_limit(self, mock_context, respx_mock):
-        """Test next-to-go with limit parameter"""
-        route = respx_mock.get(
-            f"{TAB_BASE_URL}/v1/tab-info-service/sports/nextToGo"
-        )
+    @pytest.mark.parametrize("kwargs, expected_params", [
+        ({"limit": 10}, {"limit": "10"}),
+        (
+            {"live_betting_only": True, "open_only": True},
+            {"liveBettingOnly": "true", "openOnly": "true"}
+        ),
+    ], ids=["limit", "filters"])
+    async def test_next_to_go_query_params(self, tools, mock_context, respx_mock, kwargs, expected_params):
+        """Test next-to-go limit and filter arguments map to query params"""
+        route = respx_mock.get(SPORTS_NEXT_TO_GO_URL)
         route.return_value = Response(200, json={"matches": []})
 
-        server = create_server()
-        result = server.tool_manager.tools["sports_get_next_to_go"].fn(
+        await tools["sports_get_next_to_go"](
             mock_context,
             access_token="test_token",
-            limit=10
+            **kwargs
         )
 
         assert route.called
-        assert "limit=10" in str(route.calls[0].request.url)
-
-    def test_next_to_go_with_filters(self, mock_context, respx_mock):
-        """Test next-to-go with multiple filters"""
-        route = respx_mock.get(
-            f"{TAB_BASE_URL}/v1/tab-info-service/sports/nextToGo"
-        )
-        route.return_value = Response(200, json={"matches": []})
-
-        server = create_server()
-        result = server.tool_manager.tools["sports_get_next_to_go"].fn(
-            mock_context,
-            access_token="test_token",
-            live_betting_only=True,
-            open_only=True
-        )
-
-        assert route.called
-        request_url = str(route.calls[0].request.url)
-        assert "liveBettingOnly=true" in request_url
-        assert "openOnly=true" in request_url
-
+        params = route.calls[0].request.url.params
+        for name, value in expected_params.items():
+            assert params[name] == value
 
 @pytest.mark.unit
 @pytest.mark.sports
 class TestSportsGetOpenMatch:
     """Test sports match retrieval tools"""
 
-    def test_get_open_match_in_competition(self, mock_context, respx_mock):
+    async def test_get_open_match_in_competition(self, tools, mock_context, respx_mock):
         """Test retrieval of match in competition"""
         match_data = {
             "matchName": "Lakers v Warriors",
@@ -223,12 +230,11 @@ class TestSportsGetOpenMatch:
         }
         
         route = respx_mock.get(
-            f"{TAB_BASE_URL}/v1/tab-info-service/sports/Basketball/competitions/NBA/matches/Lakers v Warriors"
+            f"{NBA_URL}/matches/Lakers v Warriors"
         )
         route.return_value = Response(200, json=match_data)
 
-        server = create_server()
-        result = server.tool_manager.tools["sports_get_open_match_in_competition"].fn(
+        result = await tools["sports_get_open_match_in_competition"](
             mock_context,
             access_token="test_token",
             sport_name="Basketball",
@@ -1,95 +1,102 @@
 """Unit tests for server helper functions and core logic"""
+import socket
+import time
+
+import httpx
+import orjson
 import pytest
-import respx
 from httpx import Response
-import time
+from pydantic import ValidationError
 
-# Test the internal helper functions by importing the module
-import sys
-sys.path.insert(0, '/root/tab-mcp/src')
+from tab_mcp import server as server_module
+from tab_mcp.server import (
+    ConfigSchema,
+    DNS_CACHE_TTL,
+    TabcorpAPIError,
+    VALID_JURISDICTIONS,
+    VALID_RACE_TYPES,
+    _cached_getaddrinfo,
+    _handle_response,
+    _register_dns_host,
+    create_server,
+)
+
+from fixtures import json_response
+
+pytestmark = pytest.mark.xdist_group("helpers")
 
 
 @pytest.mark.unit
+@pytest.mark.asyncio(loop_scope="session")
 class TestOAuthHelpers:
     """Test OAuth helper functions"""
 
-    def test_oauth_post_success(self, respx_mock, valid_oauth_response):
+    async def test_oauth_post_success(self, respx_mock, valid_oauth_bytes, http_client):
         """Test successful OAuth POST request"""
-        # Import the function to test
-        from tab_mcp.server import create_server
-        server = create_server()
-        
         # We'll test by actually calling the OAuth endpoint
         route = respx_mock.post("https://api.beta.tab.com.au/oauth/token")
-        route.return_value = Response(200, json=valid_oauth_response)
+        route.return_value = json_response(200, valid_oauth_bytes)
         
         # Make a direct HTTP call using httpx
-        import httpx
-        with httpx.Client() as client:
-            response = client.post(
-                "https://api.beta.tab.com.au/oauth/token",
-                data={"grant_type": "client_credentials", "client_id": "test", "client_secret": "test"},
-                headers={"content-type": "application/x-www-form-urlencoded"}
-            )
-            result = response.json()
+        response = await http_client.post(
+            "https://api.beta.tab.com.au/oauth/token",
+            data={"grant_type": "client_credentials", "client_id": "test", "client_secret": "test"},
+            headers={"content-type": "application/x-www-form-urlencoded"}
+        )
+        result = orjson.loads(response.content)
         
         assert result["access_token"] == "test_access_token_12345"
         assert result["token_type"] == "Bearer"
 
-    def test_oauth_post_error(self, respx_mock, oauth_error_response):
+    async def test_oauth_post_error(self, respx_mock, oauth_error_bytes, http_client):
         """Test OAuth POST with error response"""
         route = respx_mock.post("https://api.beta.tab.com.au/oauth/token")
-        route.return_value = Response(401, json=oauth_error_response)
+        route.return_value = json_response(401, oauth_error_bytes)
         
-        import httpx
-        with httpx.Client() as client:
-            response = client.post(
-                "https://api.beta.tab.com.au/oauth/token",
-                data={"grant_type": "client_credentials", "client_id": "bad", "client_secret": "bad"},
-                headers={"content-type": "application/x-www-form-urlencoded"}
-            )
+        response = await http_client.post(
+            "https://api.beta.tab.com.au/oauth/token",
+            data={"grant_type": "client_credentials", "client_id": "bad", "client_secret": "bad"},
+            headers={"content-type": "application/x-www-form-urlencoded"}
+        )
         
         assert response.status_code == 401
-        assert "error" in response.json()
+        assert b'"error"' in response.content
 
 
 @pytest.mark.unit
+@pytest.mark.asyncio(loop_scope="session")
 class TestRacingHelpers:
     """Test Racing API helper functions"""
 
-    def test_bearer_get_success(self, respx_mock):
+    async def test_bearer_get_success(self, respx_mock, http_client):
         """Test successful bearer GET request"""
         response_data = {"dates": [{"date": "2025-10-29"}]}
         route = respx_mock.get("https://api.beta.tab.com.au/v1/tab-info-service/racing/dates")
         route.return_value = Response(200, json=response_data)
         
-        import httpx
-        with httpx.Client() as client:
-            response = client.get(
-                "https://api.beta.tab.com.au/v1/tab-info-service/racing/dates",
-                headers={
-                    "authorization": "Bearer test_token",
-                    "accept": "application/json"
-                },
-                params={"jurisdiction": "NSW"}
-            )
-            result = response.json()
+        response = await http_client.get(
+            "https://api.beta.tab.com.au/v1/tab-info-service/racing/dates",
+            headers={
+                "authorization": "Bearer test_token",
+                "accept": "application/json"
+            },
+            params={"jurisdiction": "NSW"}
+        )
+        result = orjson.loads(response.content)
         
         assert "dates" in result
         assert len(result["dates"]) == 1
 
-    def test_bearer_get_error(self, respx_mock):
+    async def test_bearer_get_error(self, respx_mock, http_client):
         """Test bearer GET with error response"""
         error_data = {"error": {"message": "Unauthorized"}}
         route = respx_mock.get("https://api.beta.tab.com.au/v1/tab-info-service/racing/dates")
         route.return_value = Response(401, json=error_data)
         
-        import httpx
-        with httpx.Client() as client:
-            response = client.get(
-                "https://api.beta.tab.com.au/v1/tab-info-service/racing/dates",
-                headers={"authorization": "Bearer invalid_token"}
-            )
+        response = await http_client.get(
+            "https://api.beta.tab.com.au/v1/tab-info-service/racing/dates",
+            headers={"authorization": "Bearer invalid_token"}
+        )
         
         assert response.status_code == 401
 
@@ -98,23 +105,96 @@ class TestRacingHelpers:
 class TestValidationHelpers:
     """Test validation helper functions"""
 
-    def test_valid_jurisdictions(self):
-        """Test jurisdiction validation"""
-        from tab_mcp.server import VALID_JURISDICTIONS
-        
-        assert "NSW" in VALID_JURISDICTIONS
-        assert "VIC" in VALID_JURISDICTIONS
-        assert "QLD" in VALID_JURISDICTIONS
-        assert "INVALID" not in VALID_JURISDICTIONS
-
-    def test_valid_race_types(self):
-        """Test race type validation"""
-        from tab_mcp.server import VALID_RACE_TYPES
-        
-        assert "R" in VALID_RACE_TYPES  # Racing/Thoroughbred
-        assert "H" in VALID_RACE_TYPES  # Harness
-        assert "G" in VALID_RACE_TYPES  # Greyhounds
-        assert "X" not in VALID_RACE_TYPES
+    @pytest.mark.parametrize("collection, member, expected", [
+        (VALID_JURISDICTIONS, "NSW", True),
+        (VALID_JURISDICTIONS, "VIC", True),
+        (VALID_JURISDICTIONS, "QLD", True),
+        (VALID_JURISDICTIONS, "INVALID", False),
+        (VALID_RACE_TYPES, "R", True),  # Racing/Thoroughbred
+        (VALID_RACE_TYPES, "H", True),  # Harness
+        (VALID_RACE_TYPES, "G", True),  # Greyhounds
+        (VALID_RACE_TYPES, "X", False),
+    ])
+    def test_membership(self, collection, member, expected):
+        """Test jurisdiction and race type validation sets"""
+        assert (member in collection) is expected
+
+API_HOST = "api.example.test"
+API_ADDRINFO = [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("192.0.2.10", 443))]
+
+
+@pytest.fixture
+def resolver(monkeypatch):
+    """Replace the system resolver with a recorder and start from an empty DNS cache
+
+    Set resolver.error to make the next lookup raise it.
+    """
+    calls = []
+
+    def fake_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+        calls.append(host)
+        error, fake_getaddrinfo.error = fake_getaddrinfo.error, None
+        if error is not None:
+            raise error
+        return API_ADDRINFO
+
+    fake_getaddrinfo.error = None
+    fake_getaddrinfo.calls = calls
+    monkeypatch.setattr(server_module, "_system_getaddrinfo", fake_getaddrinfo)
+    monkeypatch.setattr(server_module, "_DNS_CACHE", {})
+    monkeypatch.setattr(server_module, "_DNS_HOSTS", {API_HOST})
+    return fake_getaddrinfo
+
+
+@pytest.mark.unit
+class TestDNSCache:
+    """Test the getaddrinfo cache for API hosts"""
+
+    def test_registered_host_cached_until_ttl(self, resolver, monkeypatch):
+        """Test a registered host is resolved once per DNS_CACHE_TTL"""
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now)
+        assert _cached_getaddrinfo(API_HOST, 443) == API_ADDRINFO
+        assert _cached_getaddrinfo(API_HOST, 443) == API_ADDRINFO
+        assert resolver.calls == [API_HOST]
+
+        monkeypatch.setattr(time, "monotonic", lambda: now + DNS_CACHE_TTL + 1)
+        _cached_getaddrinfo(API_HOST, 443)
+
+        assert resolver.calls == [API_HOST, API_HOST]
+
+    def test_unregistered_host_not_cached(self, resolver):
+        """Test other hosts always go to the system resolver"""
+        _cached_getaddrinfo("other.example.test", 443)
+        _cached_getaddrinfo("other.example.test", 443)
+
+        assert resolver.calls == ["other.example.test"] * 2
+        assert server_module._DNS_CACHE == {}
+
+    def test_resolver_error_not_cached(self, resolver):
+        """Test a failed lookup is retried on the next call"""
+        resolver.error = socket.gaierror(socket.EAI_AGAIN, "Temporary failure in name resolution")
+        with pytest.raises(socket.gaierror):
+            _cached_getaddrinfo(API_HOST, 443)
+
+        assert _cached_getaddrinfo(API_HOST, 443) == API_ADDRINFO
+        assert resolver.calls == [API_HOST, API_HOST]
+
+    def test_bytes_host_shares_entry(self, resolver):
+        """Test a bytes host name is matched and cached like its str form"""
+        _cached_getaddrinfo(API_HOST.encode(), 443)
+        _cached_getaddrinfo(API_HOST, 443)
+
+        assert resolver.calls == [API_HOST.encode()]
+
+    def test_register_installs_hook(self, resolver, monkeypatch):
+        """Test registering a base URL adds its host and patches socket.getaddrinfo"""
+        monkeypatch.setattr(socket, "getaddrinfo", resolver)
+        _register_dns_host("https://other.example.test/v1")
+        _register_dns_host("https://third.example.test")
+
+        assert socket.getaddrinfo is _cached_getaddrinfo
+        assert {"other.example.test", "third.example.test"} <= server_module._DNS_HOSTS
 
 
 @pytest.mark.unit
@@ -123,8 +203,6 @@ class TestErrorHandling:
 
     def test_tabcorp_api_error_creation(self):
         """Test TabcorpAPIError exception"""
-        from tab_mcp.server import TabcorpAPIError
-        
         error = TabcorpAPIError(
             "Test error",
             status_code=500,
@@ -136,6 +214,17 @@ class TestErrorHandling:
         assert error.response_data == {"error": "Internal error"}
         assert "Test error" in str(error)
 
+    def test_invalid_json_body(self):
+        """Test a non-JSON success body raises TabcorpAPIError"""
+        resp = Response(200, content=b"<html>maintenance</html>",
+                        request=httpx.Request("GET", "https://api.beta.tab.com.au/v1/a"))
+
+        with pytest.raises(TabcorpAPIError) as exc_info:
+            _handle_response(resp, "API request failed")
+
+        assert exc_info.value.status_code == 200
+        assert "invalid JSON" in exc_info.value.message
+
 
 @pytest.mark.unit  
 class TestConfigSchema:
@@ -143,8 +232,6 @@ class TestConfigSchema:
 
     def test_config_creation(self):
         """Test ConfigSchema creation with valid data"""
-        from tab_mcp.server import ConfigSchema
-        
         config = ConfigSchema(
             client_id="test_id",
             client_secret="test_secret",
@@ -158,9 +245,6 @@ class TestConfigSchema:
 
     def test_config_invalid_jurisdiction(self):
         """Test ConfigSchema with invalid jurisdiction"""
-        from tab_mcp.server import ConfigSchema
-        from pydantic import ValidationError
-        
         with pytest.raises(ValidationError):
             ConfigSchema(
                 client_id="test",
@@ -175,8 +259,6 @@ class TestServerCreation:
 
     def test_create_server(self):
         """Test server creation returns SmitheryFastMCP instance"""
-        from tab_mcp.server import create_server
-        
         server = create_server()
         assert server is not None
         assert hasattr(server, 'list_tools')
@@ -0,0 +1,126 @@
+"""Unit tests for cache utilities"""
+import asyncio
+
+import pytest
+
+from tab_mcp.utils import TTLCache, cached_api_call
+
+pytestmark = pytest.mark.xdist_group("utils")
+
+
+@pytest.mark.unit
+class TestTTLCache:
+    """Test TTLCache lookups, expiry and eviction"""
+
+    async def test_hit_and_miss(self):
+        """Test a stored value is returned and counted as a hit"""
+        cache = TTLCache(maxsize=4, ttl_seconds=60.0)
+        await cache.set("a", {"name": "a"})
+
+        assert await cache.get("a") == {"name": "a"}
+        assert await cache.get("b") is None
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    async def test_expired_entry_removed_on_get(self):
+        """Test an expired entry is a miss and is dropped from the cache"""
+        cache = TTLCache(maxsize=4, ttl_seconds=60.0)
+        await cache.set("a", 1, ttl=-1)
+
+        assert await cache.get("a") is None
+        assert cache.get_stats()["size"] == 0
+
+    async def test_set_sweeps_expired_entries(self):
+        """Test writes evict expired entries from the least-recently-used end"""
+        cache = TTLCache(maxsize=8, ttl_seconds=60.0)
+        await cache.set("old1", 1, ttl=-1)
+        await cache.set("old2", 2, ttl=-1)
+        await cache.set("live", 3)
+
+        await cache.set("new", 4)
+
+        assert list(cache._cache) == ["live", "new"]
+
+    async def test_sweep_stops_at_first_live_entry(self):
+        """Test expired entries behind a live one are left for their own lookup"""
+        cache = TTLCache(maxsize=8, ttl_seconds=60.0)
+        await cache.set("live", 1)
+        await cache.set("expired", 2, ttl=-1)
+
+        await cache.set("new", 3)
+
+        assert list(cache._cache) == ["live", "expired", "new"]
+        assert await cache.get("expired") is None
+        assert list(cache._cache) == ["live", "new"]
+
+    async def test_lru_eviction(self):
+        """Test the least recently used entry is evicted at capacity"""
+        cache = TTLCache(maxsize=2, ttl_seconds=60.0)
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        await cache.get("a")
+
+        await cache.set("c", 3)
+
+        assert await cache.get("b") is None
+        assert await cache.get("a") == 1
+        assert await cache.get("c") == 3
+
+
+@pytest.mark.unit
+class TestCachedApiCall:
+    """Test the cached_api_call decorator"""
+
+    async def test_concurrent_misses_run_once(self):
+        """Test concurrent calls with the same arguments share one execution"""
+        calls = []
+        release = asyncio.Event()
+
+        @cached_api_call(ttl_seconds=60)
+        async def fetch(race_id):
+            calls.append(race_id)
+            await release.wait()
+            return {"race": race_id}
+
+        pending = [asyncio.ensure_future(fetch("R1")) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*pending)
+
+        assert calls == ["R1"]
+        assert results == [{"race": "R1"}] * 5
+        assert not fetch.cache._inflight
+
+    async def test_result_cached_after_call(self):
+        """Test a later call is served from the cache"""
+        calls = []
+
+        @cached_api_call(ttl_seconds=60)
+        async def fetch(race_id):
+            calls.append(race_id)
+            return {"race": race_id}
+
+        await fetch("R1")
+        await fetch("R1")
+        await fetch("R2")
+
+        assert calls == ["R1", "R2"]
+
+    async def test_cancelled_caller_does_not_cancel_shared_call(self):
+        """Test one waiter being cancelled leaves the in-flight call running for the rest"""
+        release = asyncio.Event()
+
+        @cached_api_call(ttl_seconds=60)
+        async def fetch(race_id):
+            await release.wait()
+            return {"race": race_id}
+
+        first = asyncio.ensure_future(fetch("R1"))
+        second = asyncio.ensure_future(fetch("R1"))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == {"race": "R1"}
+        assert first.cancelled()
@@ -0,0 +1,73 @@
+"""Unit tests for the circuit breaker"""
+import pytest
+
+from tab_mcp.utils import (
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    CircuitBreakerOpenError,
+    CircuitState,
+)
+
+pytestmark = pytest.mark.xdist_group("utils")
+
+
+async def ok():
+    return "ok"
+
+
+async def boom():
+    raise ConnectionError("boom")
+
+
+@pytest.mark.unit
+class TestCircuitBreakerClosed:
+    """Test the lock-free CLOSED path of CircuitBreaker.call"""
+
+    async def test_success_passes_through(self):
+        """Test a CLOSED circuit returns the call's result"""
+        breaker = CircuitBreaker("test", CircuitBreakerConfig(failure_threshold=2))
+
+        assert await breaker.call(ok) == "ok"
+        assert breaker.state is CircuitState.CLOSED
+
+    async def test_success_resets_failure_count(self):
+        """Test failures must be consecutive to open the circuit"""
+        breaker = CircuitBreaker("test", CircuitBreakerConfig(failure_threshold=2))
+
+        with pytest.raises(ConnectionError):
+            await breaker.call(boom)
+        await breaker.call(ok)
+        with pytest.raises(ConnectionError):
+            await breaker.call(boom)
+
+        assert breaker.state is CircuitState.CLOSED
+
+    async def test_opens_at_threshold_and_fails_fast(self):
+        """Test the circuit opens after failure_threshold failures and then blocks calls"""
+        breaker = CircuitBreaker("test", CircuitBreakerConfig(failure_threshold=2, timeout_seconds=60.0))
+        calls = []
+
+        async def tracked():
+            calls.append(1)
+            return "ok"
+
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                await breaker.call(boom)
+
+        assert breaker.state is CircuitState.OPEN
+        with pytest.raises(CircuitBreakerOpenError):
+            await breaker.call(tracked)
+        assert calls == []
+
+    async def test_half_open_success_closes(self):
+        """Test an OPEN circuit past its timeout admits a trial call and closes on success"""
+        breaker = CircuitBreaker(
+            "test", CircuitBreakerConfig(failure_threshold=1, success_threshold=1, timeout_seconds=0.0)
+        )
+        with pytest.raises(ConnectionError):
+            await breaker.call(boom)
+        assert breaker.state is CircuitState.OPEN
+
+        assert await breaker.call(ok) == "ok"
+        assert breaker.state is CircuitState.CLOSED
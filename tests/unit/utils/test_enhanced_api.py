@@ -0,0 +1,85 @@
+"""Unit tests for the enhanced HTTP client"""
+import gzip
+
+import httpx
+import orjson
+import pytest
+from httpx import Response
+
+from tab_mcp.utils import EnhancedHTTPClient, reset_all_circuits
+from tab_mcp.utils import enhanced_api
+
+pytestmark = pytest.mark.xdist_group("utils")
+
+RACES_URL = "https://api.example.test/v1/races"
+RACES_BODY = orjson.dumps({"races": [{"raceNumber": 1}, {"raceNumber": 2}]})
+
+
+@pytest.fixture(autouse=True)
+async def clean_client_state():
+    """Start each test with an empty response cache and closed circuits"""
+    await enhanced_api._response_cache.clear()
+    await reset_all_circuits()
+    yield
+    await enhanced_api._response_cache.clear()
+
+
+@pytest.mark.unit
+class TestEnhancedGetCache:
+    """Test EnhancedHTTPClient.get response body caching"""
+
+    async def test_hit_returns_rebuilt_response(self, respx_mock):
+        """Test a cache hit returns a fresh Response with the original body"""
+        route = respx_mock.get(RACES_URL)
+        route.return_value = Response(200, content=RACES_BODY, headers={"content-type": "application/json"})
+
+        async with EnhancedHTTPClient() as client:
+            first = await client.get(RACES_URL, headers={"authorization": "Bearer t"})
+            second = await client.get(RACES_URL, headers={"authorization": "Bearer t"})
+
+        assert route.call_count == 1
+        assert second is not first
+        assert second.status_code == 200
+        assert second.content == RACES_BODY
+        assert second.json() == first.json()
+        assert second.headers["content-type"] == "application/json"
+        assert second.request.url == RACES_URL
+
+    async def test_compressed_body_cached_decoded(self, respx_mock):
+        """Test a gzip response is cached decoded, without its encoding headers"""
+        route = respx_mock.get(RACES_URL)
+        route.return_value = Response(
+            200, content=gzip.compress(RACES_BODY), headers={"content-encoding": "gzip"}
+        )
+
+        async with EnhancedHTTPClient() as client:
+            await client.get(RACES_URL)
+            cached = await client.get(RACES_URL)
+
+        assert route.call_count == 1
+        assert cached.content == RACES_BODY
+        assert "content-encoding" not in cached.headers
+
+    async def test_tokens_do_not_share_entries(self, respx_mock):
+        """Test responses are cached per Authorization header"""
+        route = respx_mock.get(RACES_URL)
+        route.return_value = Response(200, content=RACES_BODY)
+
+        async with EnhancedHTTPClient() as client:
+            await client.get(RACES_URL, headers={"authorization": "Bearer a"})
+            await client.get(RACES_URL, headers={"authorization": "Bearer b"})
+
+        assert route.call_count == 2
+
+    async def test_error_response_not_cached(self, respx_mock):
+        """Test a 4xx response raises and leaves nothing in the cache"""
+        route = respx_mock.get(RACES_URL)
+        route.side_effect = [Response(404), Response(200, content=RACES_BODY)]
+
+        async with EnhancedHTTPClient() as client:
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.get(RACES_URL)
+            result = await client.get(RACES_URL)
+
+        assert route.call_count == 2
+        assert result.content == RACES_BODY
@@ -0,0 +1,101 @@
+"""Unit tests for retry utilities"""
+import dataclasses
+
+import httpx
+import pytest
+
+from tab_mcp.utils import (
+    API_RETRY_CONFIG,
+    CircuitBreakerOpenError,
+    MaxRetriesExceededError,
+    RetryConfig,
+    retry_with_backoff,
+)
+
+pytestmark = pytest.mark.xdist_group("utils")
+
+# Same retry classification as API_RETRY_CONFIG without the backoff sleeps
+API_RETRY_NO_DELAY = dataclasses.replace(API_RETRY_CONFIG, initial_delay=0.0, max_delay=0.0)
+
+
+def status_error(status_code: int) -> httpx.HTTPStatusError:
+    """Build the error raise_for_status() raises for a response with status_code"""
+    request = httpx.Request("GET", "https://api.example.test/v1/a")
+    response = httpx.Response(status_code, request=request)
+    return httpx.HTTPStatusError(f"HTTP {status_code}", request=request, response=response)
+
+
+def failing(error: Exception):
+    """Return an async function that raises error on every call, and its call log"""
+    calls = []
+
+    async def func():
+        calls.append(1)
+        raise error
+    return func, calls
+
+
+@pytest.mark.unit
+class TestApiRetryStatusSplit:
+    """Test which HTTP failures API_RETRY_CONFIG retries"""
+
+    @pytest.mark.parametrize("status_code", [500, 503, 429])
+    async def test_transient_status_retried(self, status_code):
+        """Test 5xx and 429 responses are retried up to max_attempts"""
+        func, calls = failing(status_error(status_code))
+
+        with pytest.raises(MaxRetriesExceededError):
+            await retry_with_backoff(API_RETRY_NO_DELAY)(func)()
+
+        assert len(calls) == API_RETRY_CONFIG.max_attempts
+
+    @pytest.mark.parametrize("status_code", [400, 401, 404])
+    async def test_client_error_not_retried(self, status_code):
+        """Test other 4xx responses are raised on the first attempt"""
+        func, calls = failing(status_error(status_code))
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await retry_with_backoff(API_RETRY_NO_DELAY)(func)()
+
+        assert len(calls) == 1
+
+    async def test_transport_error_retried(self):
+        """Test connection failures are retried"""
+        func, calls = failing(httpx.ConnectError("connection reset"))
+
+        with pytest.raises(MaxRetriesExceededError):
+            await retry_with_backoff(API_RETRY_NO_DELAY)(func)()
+
+        assert len(calls) == API_RETRY_CONFIG.max_attempts
+
+
+@pytest.mark.unit
+class TestNoRetryOn:
+    """Test exceptions in no_retry_on bypass retry_on"""
+
+    @pytest.mark.parametrize("error", [
+        CircuitBreakerOpenError("circuit open"),
+        MaxRetriesExceededError("inner retries exhausted"),
+    ])
+    async def test_raised_without_retry(self, error):
+        """Test an open circuit or an inner retry failure is not retried even under a catch-all retry_on"""
+        func, calls = failing(error)
+
+        with pytest.raises(type(error)):
+            await retry_with_backoff(RetryConfig(initial_delay=0.0, retry_on=(Exception,)))(func)()
+
+        assert len(calls) == 1
+
+    def test_sync_raised_without_retry(self):
+        """Test the sync wrapper honours no_retry_on too"""
+        calls = []
+
+        @retry_with_backoff(RetryConfig(initial_delay=0.0, retry_on=(Exception,)))
+        def func():
+            calls.append(1)
+            raise CircuitBreakerOpenError("circuit open")
+
+        with pytest.raises(CircuitBreakerOpenError):
+            func()
+
+        assert len(calls) == 1